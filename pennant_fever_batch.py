@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+pennant_fever_batch.py
+
+Vectorized batch engine for Game.resolve_team_runs.
+
+Resolves N half-games for a single (batting team, opposing starter, ballpark)
+matchup at once. The run logic in resolve_team_runs is deterministic given the
+white/red/green dice and the roster state at first pitch, so the engine builds
+an outcome table over all 216 dice triads (Steps 0-10, vectorized with NumPy)
+and then resolves any number of rolls by indexing into it.
+
+The engine does not play the game out: relievers are not marked as used, and
+the odd-triad injury check (Step 4c) is reported as a mask instead of applied.
+
+Usage:
+    engine = BatchGameEngine(team, opponent_pitcher, team.ballpark, current_day)
+    white, red, green = roll_triads(10000, np.random.default_rng(7))
+    earned, unearned, starter_ip, bullpen_ip = engine.resolve_team_runs(white, red, green)
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+from pennant_fever_game import (
+    Game,
+    ReliefPitching,
+    compile_charts,
+    logger,
+    roster_ratings,
+)
+
+
+# =============================================================================
+# TRIAD ENUMERATION
+# =============================================================================
+
+TRIAD_COUNT = 216
+BV_CAP = 135
+TOTAL_GAME_OUTS = 27
+
+# Every (white, red, green) combination, white die slowest
+_faces = np.arange(1, 7, dtype=np.int64)
+TRIAD_WHITE = np.repeat(_faces, 36)
+TRIAD_RED = np.tile(np.repeat(_faces, 6), 6)
+TRIAD_GREEN = np.tile(_faces, 36)
+
+# Baseball innings notation (6.1 = 6 1/3 innings) for 0-27 outs, built the same
+# way as ReliefPitching/recalculate_relief_innings so the floats match exactly
+OUTS_TO_INNINGS = np.array([float(f"{outs // 3}.{outs % 3}") for outs in range(TOTAL_GAME_OUTS + 1)])
+
+
+def triad_index(white, red, green):
+    """Return the outcome-table row for the given dice (scalars or arrays)."""
+    return (np.asarray(white) - 1) * 36 + (np.asarray(red) - 1) * 6 + (np.asarray(green) - 1)
+
+
+def roll_triads(n, rng=None):
+    """Roll n white/red/green triads with a NumPy Generator."""
+    rng = rng if rng is not None else np.random.default_rng()
+    dice = rng.integers(1, 7, size=(3, n))
+    return dice[0], dice[1], dice[2]
+
+
+def innings_to_outs(innings):
+    """Convert baseball innings notation (scalar or array) to outs."""
+    innings = np.asarray(innings, dtype=np.float64)
+    return (innings.astype(np.int64) * 3 + np.round((innings % 1) * 10).astype(np.int64))
+
+
+# =============================================================================
+# BATCH ENGINE
+# =============================================================================
+
+class BatchGameEngine:
+    """Resolve many half-games for one batting team against one opposing starter."""
+
+    # Game.calculate_fatigue_penalty only reads the reliever, so the engine can borrow it
+    calculate_fatigue_penalty = Game.calculate_fatigue_penalty
+
+    def __init__(self, team, opponent_pitcher, ballpark, current_day,
+                 power_chart=None, speed_bench_chart=None, cache=None, charts=None):
+        self.team = team
+        self.opponent_pitcher = opponent_pitcher
+        self.ballpark = ballpark
+        self.current_day = current_day
+        self.charts = charts if charts is not None else compile_charts(power_chart, speed_bench_chart)
+        if cache is None:
+            self.table = self.build_outcome_table()
+        else:
+            # Reuse the table (and the relievers it picked) from an earlier identical matchup
+            self.table, self.chosen_relievers = cache.outcome_table(
+                team, opponent_pitcher, ballpark, current_day,
+                lambda: (self.build_outcome_table(), self.chosen_relievers),
+                id(self.charts))
+
+    # -------------------------------------------------------------------------
+    # Chart lookups (one value per triad)
+    # -------------------------------------------------------------------------
+
+    def _chart_ratings(self, slots, attribute):
+        """Roster `attribute` at each compiled chart slot (NaN where the chart is empty)."""
+        values = roster_ratings(self.team.players, attribute)
+        valid = slots >= 0
+        if valid.any() and slots.max() >= len(values):
+            raise IndexError(f"Chart slot {int(slots.max())} is beyond {self.team.team_name}'s {len(values)}-man roster")
+        return np.where(valid, values[np.where(valid, slots, 0)], np.nan)
+
+    def _power_bonus_power(self):
+        """Power rating of the Power Chart player for each triad (NaN when not consulted)."""
+        slots = self.charts.power_slots[TRIAD_WHITE - 1, TRIAD_RED - 1, TRIAD_GREEN - 1]
+        return self._chart_ratings(slots, 'power')
+
+    def _speed_bonus_speed(self):
+        """Speed rating of the Speed/Bench Chart player for each triad (NaN when not consulted)."""
+        slots = np.where(TRIAD_RED == TRIAD_GREEN,
+                         self.charts.speed_slots[TRIAD_RED - 1, TRIAD_GREEN - 1, TRIAD_WHITE - 1], -1)
+        return self._chart_ratings(slots, 'speed')
+
+    def _individual_bat_batting(self):
+        """Batting rating of the individual bat player (dice sum 11-18 -> lineup spot 1-8)."""
+        batting = np.zeros(19)
+        for dice_sum in range(11, 19):
+            batting[dice_sum] = self.team.players[dice_sum - 11].batting
+        return batting
+
+    def _unearned_runs_by_sum(self):
+        """Unearned runs chart value for dice sums 3-10 (0 elsewhere)."""
+        unearned = np.zeros(19)
+        for dice_sum in range(3, 11):
+            unearned[dice_sum] = self.team.unearned_runs_chart.get(str(dice_sum), 0)
+        return unearned
+
+    # -------------------------------------------------------------------------
+    # Relief pitching (depends only on white and red dice)
+    # -------------------------------------------------------------------------
+
+    def _relief_bv_modifier(self, chosen_relievers, reliever_innings_distribution):
+        """Mirror of Game.adjust_bv_for_relievers without the per-batter logging."""
+        total_modifier = 0
+        total_outs_distributed = 0
+        lineup = [player for player in self.team.players if player.role == 'Starter']
+        lineup_size = len(lineup)
+
+        for reliever in chosen_relievers:
+            innings_pitched = Game.convert_innings_to_float(reliever_innings_distribution.get(reliever.name, "0.0"))
+            if innings_pitched == 0:
+                continue
+
+            outs_for_this_reliever = int(innings_pitched * 3)
+            while outs_for_this_reliever > 0:
+                player = lineup[total_outs_distributed % lineup_size]
+                player_bv = player.batting + player.eye + (player.power * 0.4)
+                batter_modifier = 0
+                reliever_modifier = 0
+                if reliever.throws in ('L', 'R') and player.bats in ('L', 'R'):
+                    batter_modifier = player.splits_L if reliever.throws == 'L' else player.splits_R
+                    reliever_modifier = reliever.splits_L if player.bats == 'L' else reliever.splits_R
+
+                adjusted_player_bv = max(0, player_bv + (batter_modifier - reliever_modifier))
+                total_modifier += (adjusted_player_bv) * (innings_pitched / 9.0)
+                total_outs_distributed += 1
+                outs_for_this_reliever -= 1
+
+        return total_modifier if total_outs_distributed > 0 else 0
+
+    def _extras_relief_value(self, used_relievers):
+        """Mirror of the reliever half of Game.handle_extra_innings for this team."""
+        best_reliever = self.team.bullpen.best_available(used_relievers)
+        if best_reliever is not None:
+            return best_reliever.relief_value + best_reliever.clutch
+        if not used_relievers:
+            return 0
+        last_used = used_relievers[-1]
+        return max(last_used.relief_value - self.calculate_fatigue_penalty(last_used) + last_used.clutch, 0)
+
+    def _relief_tables(self):
+        """Bullpen innings, bullpen outs, BV modifier and extras relief value for every (white, red) pair."""
+        bullpen_innings = np.zeros((6, 6))
+        bullpen_outs = np.zeros((6, 6), dtype=np.int64)
+        bv_modifier = np.zeros((6, 6))
+        extras_relief_value = np.zeros((6, 6))
+        self.chosen_relievers = {}
+
+        # Fatigue multipliers are fixed for the day, so the bullpen's ordering is too
+        ranking = self.team.bullpen.ranking(self.current_day)
+        ranked = [reliever for reliever, _ in ranking]
+        fatigue_cache = dict(ranking)
+
+        for white in range(1, 7):
+            for red in range(1, 7):
+                relief = ReliefPitching(self.opponent_pitcher, self.team, (white, red, 1), None)
+                innings = relief.innings_pitched_by_bullpen()
+                chosen = ranked[:relief.number_of_relievers_used(innings)]
+                distribution = relief.distribute_innings_among_relievers(chosen, innings, fatigue_cache)
+
+                bullpen_innings[white - 1, red - 1] = innings
+                bullpen_outs[white - 1, red - 1] = innings_to_outs(innings) if chosen else 0
+                bv_modifier[white - 1, red - 1] = self._relief_bv_modifier(chosen, distribution)
+                extras_relief_value[white - 1, red - 1] = self._extras_relief_value(chosen)
+                self.chosen_relievers[(white, red)] = chosen
+
+        return bullpen_innings, bullpen_outs, bv_modifier, extras_relief_value
+
+    # -------------------------------------------------------------------------
+    # Outcome table
+    # -------------------------------------------------------------------------
+
+    def _days_since_last_start(self):
+        last_start_day = self.opponent_pitcher.last_start_day
+        if last_start_day is None or last_start_day == 0:
+            return float('inf')
+        return self.current_day - last_start_day
+
+    def build_outcome_table(self) -> Dict[str, np.ndarray]:
+        """Resolve Steps 0-10 of resolve_team_runs for all 216 triads."""
+        pitcher = self.opponent_pitcher
+        white, red, green = TRIAD_WHITE, TRIAD_RED, TRIAD_GREEN
+
+        # Step 0: Dice
+        dice_sum = white + red + green
+        doubles = (white == red) | (white == green) | (red == green)
+        triples = (white == red) & (red == green)
+        triad = white * 100 + red * 10 + green
+
+        # Step 1: Shutout / Complete Game / CG-SHO combo
+        short_rested = self._days_since_last_start() < pitcher.rest
+        if short_rested:
+            is_shutout = np.zeros(TRIAD_COUNT, dtype=bool)
+            is_complete_game = np.zeros(TRIAD_COUNT, dtype=bool)
+        else:
+            # The scalar check compares the three-digit triad (111-666) against the dice-sum
+            # chart, so only its "sum > 10" branch (endurance >= 4) can ever fire
+            is_complete_game = np.full(TRIAD_COUNT, pitcher.endurance >= 4)
+            is_shutout = (triad > pitcher.sho_rating) & (white >= 5) & (pitcher.start_value >= 3.0)
+        is_cg_sho = is_shutout & is_complete_game
+        is_sho_relief = is_shutout & ~is_complete_game
+        needs_relief = ~is_complete_game
+
+        # Step 2/3: Batting Value adjusted for the relievers chosen on this white/red pair
+        bullpen_innings, bullpen_outs, bv_modifier, extras_relief_value = self._relief_tables()
+        relief_innings = bullpen_innings[white - 1, red - 1]
+        relief_outs = bullpen_outs[white - 1, red - 1]
+        relievers_chosen = relief_outs > 0
+        base_bv = self.team.get_batting_value(pitcher)
+        bv = np.where(needs_relief, np.maximum(0, base_bv + bv_modifier[white - 1, red - 1]), base_bv)
+        bv = np.minimum(bv, BV_CAP)
+
+        power = self._power_bonus_power()
+        speed = self._speed_bonus_speed()
+        stadium_value = self.ballpark.stadium_value
+        has_power = ~np.isnan(power)
+        has_speed = ~np.isnan(speed)
+        power_bonus = np.where(has_power, np.nan_to_num(power) * white + stadium_value, 0)
+        speed_bonus = np.where(has_speed, np.nan_to_num(speed) * white, 0)
+
+        # Step 4: Triples - even triad gets Power and Speed/Bench bonuses, odd triad checks injury
+        even_triples = triples & (triad % 2 == 0)
+        bv = bv + np.where(even_triples, power_bonus, 0)
+        bv = bv + np.where(even_triples, speed_bonus, 0)
+        bv = np.minimum(bv, BV_CAP)
+        injury_check = triples & (triad % 2 == 1)
+
+        # Step 5: Individual bat bonus (dice sum > 10)
+        bv = bv + np.where(dice_sum > 10, self._individual_bat_batting()[dice_sum], 0)
+        bv = np.minimum(bv, BV_CAP)
+
+        # Step 6: Doubles (triples count as doubles too)
+        white_pair = doubles & ((white == red) | (white == green))
+        red_green_pair = doubles & (red == green)
+        bv = bv + np.where(white_pair, power_bonus, 0)
+        bv = bv + np.where(red_green_pair, speed_bonus, 0)
+        bv = np.minimum(bv, BV_CAP)
+
+        # Step 7: The scalar path resolves the defense chart but discards its run total,
+        # so it has no effect on the outcome and is not repeated here.
+
+        # Step 8: Earned runs
+        product = np.maximum(pitcher.start_value * white, 6)
+        earned_runs = np.floor_divide(bv, product)
+
+        # Step 9: Unearned runs (dice sum <= 10)
+        unearned_runs = np.where(dice_sum <= 10, self._unearned_runs_by_sum()[dice_sum], 0)
+
+        # Step 10: Starter / bullpen split (Game.calculate_runs_for_starter)
+        starter_outs = TOTAL_GAME_OUTS - np.where(needs_relief, innings_to_outs(relief_innings), 0)
+        starter_innings = starter_outs // 3 + (starter_outs % 3) * 0.1
+        pulled = earned_runs >= 8
+        if pitcher.start_value >= 5:
+            starter_innings = np.where(pulled, np.maximum(starter_innings - 1, 3), starter_innings)
+        else:
+            starter_innings = np.where(pulled, np.maximum(starter_innings - 2, 2), starter_innings)
+        if short_rested:
+            endurance_penalty = 1 if pitcher.endurance >= 4 else 2
+            starter_innings = np.maximum(starter_innings - endurance_penalty, 2)
+
+        # Relievers only pick up innings when they were chosen and the starter fell short of 9
+        recalculated_outs = TOTAL_GAME_OUTS - innings_to_outs(starter_innings)
+        bullpen_game_outs = np.where(needs_relief & (starter_innings < 9.0) & relievers_chosen, recalculated_outs, 0)
+
+        # Shutouts short-circuit after Step 1
+        earned_runs = np.where(is_shutout, 0, earned_runs)
+        unearned_runs = np.where(is_shutout, 0, unearned_runs)
+        starter_innings = np.where(is_cg_sho, 9.0, np.where(is_sho_relief, 0, starter_innings))
+        bullpen_game_outs = np.where(is_cg_sho, 0, np.where(is_sho_relief, relief_outs, bullpen_game_outs))
+
+        logger.debug(f"Batch outcome table built for {self.team.team_name} vs {pitcher.name} (day {self.current_day})")
+
+        return {
+            'white': white,
+            'red': red,
+            'green': green,
+            'earned_runs': earned_runs,
+            'unearned_runs': unearned_runs,
+            'total_runs': earned_runs + unearned_runs,
+            'starter_innings': starter_innings,
+            'bullpen_outs': bullpen_game_outs,
+            'bullpen_innings': OUTS_TO_INNINGS[bullpen_game_outs],
+            'is_shutout': is_shutout,
+            'is_complete_game': is_complete_game,
+            'is_cg_sho': is_cg_sho,
+            'injury_check': injury_check,
+            'batting_value': np.where(is_shutout, 0, bv),
+            # Relief value this team brings to a tie game; a complete game leaves the bullpen untouched
+            'extras_relief_value': np.where(is_complete_game, self._extras_relief_value([]),
+                                            extras_relief_value[white - 1, red - 1]),
+        }
+
+    # -------------------------------------------------------------------------
+    # Resolution
+    # -------------------------------------------------------------------------
+
+    def resolve_team_runs(self, white, red, green) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Resolve N half-games; returns earned runs, unearned runs, starter and bullpen innings."""
+        idx = triad_index(white, red, green)
+        table = self.table
+        return (table['earned_runs'][idx], table['unearned_runs'][idx],
+                table['starter_innings'][idx], table['bullpen_innings'][idx])
+
+    def simulate(self, n, rng=None):
+        """Roll n triads and resolve them; returns the dice and the resolved arrays."""
+        white, red, green = roll_triads(n, rng)
+        return (white, red, green), self.resolve_team_runs(white, red, green)
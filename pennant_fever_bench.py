@@ -0,0 +1,511 @@
+#!/usr/bin/env python3
+"""
+pennant_fever_bench.py
+
+Benchmark suite for the season engine on synthetic leagues.
+
+Leagues are built directly as Team / Pitcher / Player objects from a seed, so the
+benchmarks need no league JSON, team files or workbooks, and the same arguments
+always produce the same league and schedule. Each run times:
+
+    play_game          Game.play_game over random pairings
+    resolve_team_runs  one side of a game (dice, shutout/CG check, BV, relief, runs)
+    relief_pitching    ReliefPitching: bullpen innings, reliever choice, innings and runs split
+    standings          Standings.record_game over a pool of played results
+    season             a main()-style season: schedule, standings log, team stats, pitcher
+                       and batting trackers, state journal, then the playoffs
+
+and records throughput, p50/p99 latency per call (per game for the season) and peak
+RSS. Every run is appended to a JSON history file; --compare checks the run against
+a baseline (a saved run, or the latest matching run in a history file) and exits
+with status 1 when any metric is worse by more than --threshold.
+
+Files the season writes (standings log, journal) go to a temporary directory; team
+files are never touched. Without data_paths_pennant_fever on the path the engine is
+pointed at a temporary directory too.
+
+Usage:
+    python pennant_fever_bench.py                                  # 30 teams, 162 days
+    python pennant_fever_bench.py --teams 12 --days 60 --games 2000 --seasons 1
+    python pennant_fever_bench.py --save-baseline bench_baseline.json
+    python pennant_fever_bench.py --compare bench_baseline.json --threshold 0.15
+    python pennant_fever_bench.py --only play_game,season
+    python pennant_fever_bench.py --only season --step-profile 16     # per-step timings too
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import types
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import pennant_fever_game as game
+except ImportError:
+    # No data_paths_pennant_fever here (fresh checkout, CI): give the engine scratch paths
+    _scratch = Path(tempfile.mkdtemp(prefix='pennant_fever_bench_'))
+    _paths = types.ModuleType('data_paths_pennant_fever')
+    _paths.PENNANT_FEVER_DIR = _scratch
+    _paths.PENNANT_FEVER_LOGS_GAME_DIR = _scratch / 'logs'
+    _paths.PENNANT_FEVER_JSON_MLB_DIR = _scratch / 'json_mlb'
+    _paths.PENNANT_FEVER_JSON_FIC_DIR = _scratch / 'json_fictional'
+    sys.modules['data_paths_pennant_fever'] = _paths
+    import pennant_fever_game as game
+
+from pennant_fever_profiler import StepProfiler
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BENCHMARKS = ('play_game', 'resolve_team_runs', 'relief_pitching', 'standings', 'season')
+DEFAULT_HISTORY = 'pennant_fever_bench_history.json'
+POSITIONS = ('C', '1B', '2B', '3B', 'SS', 'LF', 'CF', 'RF', 'DH')
+
+
+# =============================================================================
+# SYNTHETIC LEAGUES
+# =============================================================================
+
+def make_team(team_id, team_name, rnd, players=15, starters=5, relievers=7):
+    """A team with ratings drawn in the ranges the real rosters use."""
+    roster = []
+    for k in range(players):
+        lineup = k < len(POSITIONS)
+        roster.append(game.Player(
+            role='Starter' if lineup else 'Bench', name=f"{team_name} P{k + 1}",
+            batting=rnd.randint(0, 8), power=rnd.randint(0, 8), speed=rnd.randint(0, 8),
+            fielding=rnd.randint(-2, 2), position=POSITIONS[k] if lineup else rnd.choice(POSITIONS[:-1]),
+            bats=rnd.choice('LRRS'), clutch=rnd.randint(-1, 2), eye=rnd.randint(-1, 3),
+            splits_L=rnd.randint(-2, 2), splits_R=rnd.randint(-2, 2), injury=rnd.randint(0, 3)))
+    staff = []
+    for k in range(starters):
+        staff.append(game.Pitcher(
+            name=f"{team_name} SP{k + 1}", type='SP', start_value=rnd.choice([1, 2, 3, 3.5, 4, 5, 6]),
+            endurance=rnd.choice([1, 2, 3, 4, 4.5, 5, 6, 7, 8]), rest=rnd.choice([4, 5]), relief_value=0,
+            fatigue=rnd.randint(1, 8), sho_rating=rnd.randint(611, 666), throws=rnd.choice('LRR'),
+            clutch=rnd.randint(-1, 2), splits_L=rnd.randint(-2, 2), splits_R=rnd.randint(-2, 2)))
+    for k in range(relievers):
+        staff.append(game.Pitcher(
+            name=f"{team_name} RP{k + 1}", type='RP', start_value=0, endurance=1, rest=1,
+            relief_value=rnd.randint(-3, 5), fatigue=rnd.randint(1, 8), throws=rnd.choice('LRR'),
+            clutch=rnd.randint(-1, 2), splits_L=rnd.randint(-2, 2), splits_R=rnd.randint(-2, 2)))
+    return game.Team(team_id=team_id, team_name=team_name, pitchers=staff, players=roster,
+                     unearned_runs_chart={str(s): rnd.randint(0, 2) for s in range(3, 11)},
+                     stadium_value=rnd.randint(-1, 1), home_field_advantage=rnd.randint(-1, 1),
+                     ballpark_name=f"{team_name} Park")
+
+
+def make_league(teams=30, days=162, players=15, starters=5, relievers=7, seed=1):
+    """
+    A league shaped like load_league()'s result: two sub-leagues of three divisions
+    (as Playoffs expects) and a schedule where every team plays every day.
+    """
+    rnd = random.Random(seed)
+    team_ids = [f"SYN{i:02d}" for i in range(1, teams + 1)]
+    team_lookup = {team_id: make_team(team_id, f"Synthetic {i}", rnd, players, starters, relievers)
+                   for i, team_id in enumerate(team_ids, 1)}
+
+    divisions = [[str(team_id) for team_id in division] for division in np.array_split(team_ids, 6)]
+    sub_leagues = [
+        {'sub_league_name': league_name,
+         'divisions': [{'division_name': f"{league_name} {division_name}", 'teams': divisions[3 * league + d]}
+                       for d, division_name in enumerate(('East', 'Central', 'West'))]}
+        for league, league_name in enumerate(('American League', 'National League'))
+    ]
+    all_team_ids = [team_id for sub_league in sub_leagues for division in sub_league['divisions'] for team_id in division['teams']]
+    schedule_id_map = {i + 1: team_id for i, team_id in enumerate(all_team_ids)}
+
+    games = []
+    numbers = list(schedule_id_map)
+    for day in range(1, days + 1):
+        rnd.shuffle(numbers)
+        games.extend({'day': day, 'time': 'N', 'away': numbers[i], 'home': numbers[i + 1]}
+                     for i in range(0, len(numbers) - 1, 2))
+
+    return {
+        'league_data': {'sub_leagues': sub_leagues, 'schedule_name': None},
+        'sub_leagues': sub_leagues,
+        'team_lookup': team_lookup,
+        'all_team_ids': all_team_ids,
+        'schedule': game.Schedule(games=games),
+        'schedule_id_map': schedule_id_map,
+        'charts': game.compile_charts(),
+    }
+
+
+# =============================================================================
+# TIMING
+# =============================================================================
+
+def summarize_timings(ns, seconds=None):
+    """Throughput and p50/p99 latency (microseconds) from per-call nanosecond timings."""
+    ns = np.asarray(ns, dtype=np.float64)
+    seconds = ns.sum() / 1e9 if seconds is None else seconds
+    p50, p99 = np.percentile(ns, [50, 99]) / 1000 if len(ns) else (0.0, 0.0)
+    return {
+        'calls': int(len(ns)),
+        'seconds': round(seconds, 4),
+        'per_second': round(len(ns) / seconds, 1) if seconds else 0.0,
+        'p50_us': round(float(p50), 1),
+        'p99_us': round(float(p99), 1),
+    }
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far (None where resource is unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def pairings(league, count, rng):
+    """`count` (home, away) team pairs drawn from the league."""
+    teams = list(league['team_lookup'].values())
+    picks = rng.choice(len(teams), size=(count, 2), replace=True)
+    return [(teams[home], teams[away if away != home else (away + 1) % len(teams)]) for home, away in picks]
+
+
+def new_game(league, home_team, away_team, day, rng, matchup_cache):
+    return game.Game(home_team, away_team, day, game.POWER_CHART, game.SPEED_BENCH_CHART,
+                     game.Game.consult_relief_defense_chart, matchup_cache=matchup_cache, rng=rng,
+                     charts=league['charts'])
+
+
+# =============================================================================
+# BENCHMARKS
+# =============================================================================
+
+def bench_play_game(league, games, seed, warmup=50):
+    rng = np.random.default_rng(seed)
+    cache = game.MatchupCache()
+    pairs = pairings(league, games + warmup, rng)
+    timings = np.empty(games, dtype=np.int64)
+    for i, (home_team, away_team) in enumerate(pairs):
+        day = i // len(league['team_lookup']) + 1
+        start = time.perf_counter_ns()
+        new_game(league, home_team, away_team, day, rng, cache).play_game(day)
+        if i >= warmup:
+            timings[i - warmup] = time.perf_counter_ns() - start
+    return summarize_timings(timings)
+
+
+def bench_resolve_team_runs(league, calls, seed, warmup=50):
+    rng = np.random.default_rng(seed)
+    cache = game.MatchupCache()
+    pairs = pairings(league, calls + warmup, rng)
+    timings = np.empty(calls, dtype=np.int64)
+    for i, (home_team, away_team) in enumerate(pairs):
+        day = i // len(league['team_lookup']) + 1
+        match = new_game(league, home_team, away_team, day, rng, cache)
+        starter = home_team.select_starting_pitcher(day)
+        start = time.perf_counter_ns()
+        match.resolve_team_runs(away_team, starter, day, is_visiting=True)
+        if i >= warmup:
+            timings[i - warmup] = time.perf_counter_ns() - start
+    return summarize_timings(timings)
+
+
+def bench_relief_pitching(league, calls, seed, warmup=50):
+    rng = np.random.default_rng(seed)
+    cache = game.MatchupCache()
+    pairs = pairings(league, calls + warmup, rng)
+    timings = np.empty(calls, dtype=np.int64)
+    for i, (home_team, away_team) in enumerate(pairs):
+        day = i // len(league['team_lookup']) + 1
+        match = new_game(league, home_team, away_team, day, rng, cache)
+        starter = home_team.select_starting_pitcher(day)
+        dice = match.roll_dice()
+        start = time.perf_counter_ns()
+        relief = game.ReliefPitching(starter, away_team, dice, match)
+        _, relievers, fatigue_cache = relief.process_relief_pitching(day)
+        relief.distribute_innings_among_relievers(relievers, relief.innings_pitched_by_bullpen(), fatigue_cache)
+        relief.distribute_runs_among_relievers(relievers, int(dice[1] % 3), int(dice[2] % 2), day, fatigue_cache)
+        if i >= warmup:
+            timings[i - warmup] = time.perf_counter_ns() - start
+    return summarize_timings(timings)
+
+
+def bench_standings(league, calls, seed, pool=500):
+    """record_game over a pool of already-played results, cycled `calls` times."""
+    rng = np.random.default_rng(seed)
+    cache = game.MatchupCache()
+    results = []
+    for i, (home_team, away_team) in enumerate(pairings(league, pool, rng)):
+        day = i // len(league['team_lookup']) + 1
+        results.append((day, home_team.team_id, away_team.team_id,
+                        new_game(league, home_team, away_team, day, rng, cache).play_game(day)))
+    standings = game.Standings(league['sub_leagues'], league['team_lookup'])
+    timings = np.empty(calls, dtype=np.int64)
+    for i in range(calls):
+        day, home_id, away_id, result = results[i % pool]
+        start = time.perf_counter_ns()
+        standings.record_game(day, home_id, away_id, result, team_lookup=league['team_lookup'])
+        timings[i] = time.perf_counter_ns() - start
+    return summarize_timings(timings)
+
+
+def play_season(league, seed, directory):
+    """
+    The body of pennant_fever_game.main() on a given league: returns per-game
+    nanosecond timings and the regular season and playoff wall times.
+    """
+    rng = np.random.default_rng(seed)
+    team_lookup = league['team_lookup']
+    schedule = league['schedule']
+    schedule_id_map = league['schedule_id_map']
+    charts = league['charts']
+
+    team_stats_lookup = {team_id: game.TeamStats(team.team_name) for team_id, team in team_lookup.items()}
+    standings_store = game.StandingsStore(os.path.join(directory, 'standings_log.jsonl'),
+                                          os.path.join(directory, 'standings_snapshot.json'))
+    standings_store.reset()
+    standings = game.Standings(league['sub_leagues'], team_lookup, store=standings_store)
+    pitcher_tracker = game.SeasonPitcherTracker()
+    batting_stats = game.SeasonBattingStats(team_lookup.values())
+    team_names = {team_id: team.team_name for team_id, team in team_lookup.items()}
+    matchup_cache = game.MatchupCache()
+    journal = game.StateJournal(os.path.join(directory, 'season_state.journal'))
+    journal.truncate()
+    journal.prime(team_lookup)
+
+    timings = []
+    season_start = time.perf_counter()
+    for day in range(1, schedule.num_days + 1):
+        day_results = []
+        for game_info in schedule.get_games_for_day(day):
+            start = time.perf_counter_ns()
+            away_team_id = schedule_id_map[game_info['away']]
+            home_team_id = schedule_id_map[game_info['home']]
+            home_team = team_lookup[home_team_id]
+            away_team = team_lookup[away_team_id]
+            result = new_game(league, home_team, away_team, day, rng, matchup_cache).play_game(day)
+            standings.record_game(day, home_team_id, away_team_id, result, team_lookup=team_lookup)
+            team_stats_lookup[home_team_id].update_stats(result.home_runs, result.away_runs, result.is_one_run, result.is_extra_innings, pitcher_throws=result.away_pitcher_throws, is_home_game=True)
+            team_stats_lookup[away_team_id].update_stats(result.away_runs, result.home_runs, result.is_one_run, result.is_extra_innings, pitcher_throws=result.home_pitcher_throws, is_home_game=False)
+            journal.record_team(home_team, day)
+            journal.record_team(away_team, day)
+            pitcher_tracker.record_game(result, team_names)
+            day_results.append(result)
+            timings.append(time.perf_counter_ns() - start)
+        batting_stats.add_results(day_results, rng)
+        standings_store.end_of_day(standings, day)
+        journal.checkpoint(day)
+    standings_store.snapshot(standings, schedule.num_days)
+    journal.truncate()  # main() compacts into the team files here; the benchmark leaves them alone
+    season_seconds = time.perf_counter() - season_start
+
+    playoffs_start = time.perf_counter()
+    playoffs = game.Playoffs(standings, team_stats_lookup, game.POWER_CHART, game.SPEED_BENCH_CHART,
+                             game.Game.consult_relief_defense_chart, matchup_cache=matchup_cache, rng=rng, charts=charts)
+    playoffs.simulate_playoffs(regular_season_days=schedule.num_days)
+    return timings, season_seconds, time.perf_counter() - playoffs_start
+
+
+def bench_season(config, seasons, seed):
+    timings = []
+    season_seconds = []
+    playoff_seconds = []
+    with tempfile.TemporaryDirectory(prefix='pennant_fever_bench_') as directory:
+        for season in range(seasons):
+            league = make_league(**config, seed=seed)  # fresh rest/rotation state every season
+            game_ns, regular, playoffs = play_season(league, seed + season, directory)
+            timings.extend(game_ns)
+            season_seconds.append(regular)
+            playoff_seconds.append(playoffs)
+    summary = summarize_timings(timings, seconds=sum(season_seconds))
+    summary.update(
+        seasons=seasons,
+        season_seconds=round(float(np.mean(season_seconds)), 3),
+        playoff_seconds=round(float(np.mean(playoff_seconds)), 3),
+    )
+    return summary
+
+
+def run(config, games, seasons, seed, only=BENCHMARKS):
+    """Run the selected benchmarks; returns {name: metrics}, plus peak RSS after each."""
+    results = {}
+    for name in only:
+        league = make_league(**config, seed=seed)
+        start = time.perf_counter()
+        if name == 'play_game':
+            metrics = bench_play_game(league, games, seed)
+        elif name == 'resolve_team_runs':
+            metrics = bench_resolve_team_runs(league, games, seed)
+        elif name == 'relief_pitching':
+            metrics = bench_relief_pitching(league, games, seed)
+        elif name == 'standings':
+            metrics = bench_standings(league, games * 4, seed)
+        else:
+            metrics = bench_season(config, seasons, seed)
+        metrics['peak_rss_mb'] = peak_rss_mb()
+        results[name] = metrics
+        print(f"{name:<18} {metrics['per_second']:>12,.0f}/s  p50 {metrics['p50_us']:>9.1f} us  "
+              f"p99 {metrics['p99_us']:>9.1f} us  ({time.perf_counter() - start:.1f}s)")
+    return results
+
+
+# =============================================================================
+# HISTORY AND COMPARISON
+# =============================================================================
+
+# Metrics compared against a baseline; True = higher is better
+COMPARED_METRICS = {
+    'per_second': True,
+    'p50_us': False,
+    'p99_us': False,
+    'season_seconds': False,
+    'playoff_seconds': False,
+    'peak_rss_mb': False,
+}
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def make_record(config, games, seasons, seed, results, step_profile=0):
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'machine': f"{platform.system()} {platform.machine()}",
+        'config': dict(config, games=games, seasons=seasons, seed=seed, step_profile=step_profile),
+        'results': results,
+    }
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        data = json.load(f)
+    return data if isinstance(data, list) else [data]
+
+
+def append_history(path, record):
+    history = load_history(path)
+    history.append(record)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(history, f, indent=2)
+    os.replace(temp_path, path)
+
+
+def find_baseline(path, config):
+    """The latest run in `path` (a saved run or a history file) with the same league and workload."""
+    matching = [record for record in load_history(path) if record.get('config') == config]
+    return matching[-1] if matching else None
+
+
+def compare(record, baseline, threshold):
+    """Lines describing every compared metric; returns (lines, regressions)."""
+    lines = []
+    regressions = []
+    for name, metrics in record['results'].items():
+        base_metrics = baseline['results'].get(name)
+        if base_metrics is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            new, old = metrics.get(metric), base_metrics.get(metric)
+            if not new or not old:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            flag = 'REGRESSION' if worse > threshold else ''
+            line = f"{name:<18} {metric:<16} {old:>12,.2f} -> {new:>12,.2f}  {change:+7.1%}  {flag}"
+            lines.append(line)
+            if flag:
+                regressions.append(line)
+    return lines, regressions
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the Pennant Fever season engine on synthetic leagues')
+    parser.add_argument('--teams', type=int, default=30, help='Teams in the league (even, at least 6)')
+    parser.add_argument('--days', type=int, default=162, help='Schedule length in days (every team plays daily)')
+    parser.add_argument('--players', type=int, default=15, help='Position players per team (9 starters + bench)')
+    parser.add_argument('--starters', type=int, default=5, help='Starting pitchers per team')
+    parser.add_argument('--relievers', type=int, default=7, help='Relief pitchers per team')
+    parser.add_argument('--games', type=int, default=5000, help='Timed calls per micro-benchmark')
+    parser.add_argument('--seasons', type=int, default=3, help='Full seasons to time')
+    parser.add_argument('--seed', type=int, default=1, help='League and dice seed')
+    parser.add_argument('--only', default=None, help=f"Comma-separated subset of: {', '.join(BENCHMARKS)}")
+    parser.add_argument('--history', default=DEFAULT_HISTORY, help='JSON history file every run is appended to')
+    parser.add_argument('--no-history', action='store_true', help="Don't append this run to the history file")
+    parser.add_argument('--save-baseline', default=None, help='Also write this run to a baseline file')
+    parser.add_argument('--compare', default=None, help='Baseline or history file to compare this run against')
+    parser.add_argument('--threshold', type=float, default=0.10, help='Relative change that counts as a regression')
+    parser.add_argument('--step-profile', type=int, default=0, metavar='N',
+                        help='Run with a resolve_team_runs StepProfiler timing 1 call in N and print its report')
+    args = parser.parse_args()
+
+    if args.teams < 6 or args.teams % 2:
+        parser.error('--teams must be even and at least 6 (two leagues of three divisions)')
+    if args.players < len(POSITIONS) or args.starters < 1 or args.relievers < 4:
+        parser.error(f'rosters need at least {len(POSITIONS)} position players, 1 starter and 4 relievers')
+    if args.step_profile < 0:
+        parser.error('--step-profile must be at least 1 (or 0 for no profiler)')
+    only = tuple(args.only.split(',')) if args.only else BENCHMARKS
+    unknown = set(only) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+
+    game.logger.setLevel(logging.WARNING)
+    config = {'teams': args.teams, 'days': args.days, 'players': args.players,
+              'starters': args.starters, 'relievers': args.relievers}
+    print(f"League: {args.teams} teams, {args.days} days, {args.players} players, "
+          f"{args.starters}+{args.relievers} pitchers per team (seed {args.seed})")
+
+    if args.step_profile:
+        game.set_profiler(StepProfiler(args.step_profile))
+    results = run(config, args.games, args.seasons, args.seed, only)
+    record = make_record(config, args.games, args.seasons, args.seed, results, args.step_profile)
+    if args.step_profile:
+        print(f"\n{game.set_profiler(None).report(histograms=True)}\n")
+    print(f"Peak RSS: {peak_rss_mb()} MB")
+
+    if not args.no_history:
+        append_history(args.history, record)
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(record, f, indent=2)
+        print(f"Baseline written to {args.save_baseline}")
+
+    if args.compare:
+        baseline = find_baseline(args.compare, record['config'])
+        if baseline is None:
+            print(f"No run in {args.compare} with this configuration; nothing to compare")
+            return
+        print(f"\nAgainst {baseline.get('commit') or 'baseline'} ({baseline['timestamp']}), "
+              f"threshold {args.threshold:.0%}:")
+        lines, regressions = compare(record, baseline, args.threshold)
+        print("\n".join(lines))
+        if regressions:
+            print(f"\n{len(regressions)} regression(s)")
+            sys.exit(1)
+        print("\nNo regressions")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+pennant_fever_bundle_converter.py
+
+Build a league bundle from the existing league file and per-team JSON directory.
+
+The league is loaded the old way (league.json / league_fictional.json, one
+team_id_<id>.json per team, charts.json and the schedule file), then written as
+a single bundle next to the team files, where load_league() picks it up. The bundle
+records each source file's mtime, size and sha256, and load_league() rebuilds it by
+itself when one changes; run this to build it ahead of time or to check it.
+
+Usage:
+    python pennant_fever_bundle_converter.py                        # current LEAGUE_TYPE
+    python pennant_fever_bundle_converter.py --league-type fictional
+    python pennant_fever_bundle_converter.py --output /tmp/mlb_2023.pfbundle --verify
+"""
+
+import argparse
+import time
+
+import pennant_fever_game as game
+
+
+def convert(output=None, verify=False):
+    """Write the current LEAGUE_TYPE's bundle; returns its path."""
+    start = time.perf_counter()
+    league = game.load_league(use_bundle=False)
+    loaded = time.perf_counter()
+    path = output or game.league_bundle_path()
+    game.write_league_bundle(path, league)
+    print(f"Read {len(league['team_lookup'])} team files in {loaded - start:.2f}s; wrote {path}")
+
+    if verify:
+        start = time.perf_counter()
+        bundled = game.load_league_bundle(path)
+        print(f"Bundle loads in {time.perf_counter() - start:.3f}s")
+        for team_id, team in league['team_lookup'].items():
+            other = bundled['team_lookup'][team_id]
+            for group in ('players', 'pitchers'):
+                if [p.to_dict() for p in getattr(team, group)] != [p.to_dict() for p in getattr(other, group)]:
+                    raise SystemExit(f"Bundle mismatch: {team.team_name} {group}")
+        if league['schedule'].schedule != bundled['schedule'].schedule:
+            raise SystemExit("Bundle mismatch: schedule")
+        print("Bundle matches the JSON files")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert per-team JSON files into a Pennant Fever league bundle')
+    parser.add_argument('--league-type', choices=('mlb', 'fictional'), default=None,
+                        help='League to convert (default: LEAGUE_TYPE in pennant_fever_game)')
+    parser.add_argument('--output', default=None, help='Bundle path (default: next to the team JSON files)')
+    parser.add_argument('--verify', action='store_true', help='Reload the bundle and compare it with the JSON files')
+    args = parser.parse_args()
+
+    game.init()
+    if args.league_type:
+        game.LEAGUE_TYPE = args.league_type
+    convert(args.output, args.verify)
+
+
+if __name__ == '__main__':
+    main()
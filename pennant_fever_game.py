@@ -1,37 +1,62 @@
 import random
-import pandas as pd
+import numpy as np
 # import pygame  # Commented out - micro/GUI simulation not yet complete
 import json
 import os
 import sys
 import math
 import logging
+import contextlib
+import copy
+import hashlib
+import heapq
+import pickle
+import struct
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 
-# Add common folder to sys.path for shared modules
-COMMON_PATH = Path.home() / "Documents/_code/common"
-sys.path.insert(0, str(COMMON_PATH))
-
-from data_paths_pennant_fever import *
+# Importing this module does no setup work of its own: pandas and
+# openpyxl are imported where the stats exports need them, and the file logger and data
+# directory are set up by init(), which entry points (main() and the CLI tools) call.
+# Worker processes and library callers can skip it; the logger then only reports warnings.
 
-from common_logger import setup_logger
-
-# Guard against multiple initializations (e.g., if module is reimported)
-if not logging.getLogger("pennant_fever").hasHandlers():
-    logger = setup_logger(
-        name="pennant_fever",
-        log_dir=PENNANT_FEVER_LOGS_GAME_DIR,
-        prefix="pennant_fever",
-        console_level=logging.DEBUG
-    )
-    logger.debug("Logger initialized. Starting the pennant_fever module.")
-else:
-    # Logger already exists, reuse it
-    logger = logging.getLogger("pennant_fever")
-    logger.debug("Logger reused (module reimport detected).")
+# Shared modules live in the common folder unless they are already importable
+COMMON_PATH = Path.home() / "Documents/_code/common"
+try:
+    from data_paths_pennant_fever import *
+except ImportError:
+    sys.path.insert(0, str(COMMON_PATH))
+    from data_paths_pennant_fever import *
+
+import pennant_fever_trace as trace
+import pennant_fever_profiler as profiling
+from pennant_fever_game_log import GameLog, innings_to_outs
+from pennant_fever_reference_cache import file_hash
+
+logger = logging.getLogger("pennant_fever")
+
+
+def init(console_level=logging.INFO):
+    """
+    Set up the pennant_fever file/console logger and create the data directory.
+    The console gets INFO by default; pass logging.DEBUG for the step-by-step game
+    log, or install a tracer (set_tracer) to follow games cheaply. Safe to call
+    more than once; returns the logger.
+    """
+    # Guard against multiple initializations (e.g., init() from several entry points)
+    if not logger.hasHandlers():
+        from common_logger import setup_logger  # next to data_paths_pennant_fever
+        setup_logger(
+            name="pennant_fever",
+            log_dir=PENNANT_FEVER_LOGS_GAME_DIR,
+            prefix="pennant_fever",
+            console_level=console_level
+        )
+        logger.debug("Logger initialized. Starting the pennant_fever module.")
+    PENNANT_FEVER_DIR.mkdir(parents=True, exist_ok=True)
+    return logger
 
-PENNANT_FEVER_DIR.mkdir(parents=True, exist_ok=True)
 
 # Use centralized path from data_paths_pennant_fever
 BASE_DIRECTORY = str(PENNANT_FEVER_DIR)
@@ -52,8 +77,392 @@ def get_team_json_directory():
         logger.warning(f"Unknown LEAGUE_TYPE '{LEAGUE_TYPE}', defaulting to MLB directory")
         return PENNANT_FEVER_JSON_MLB_DIR
 
+# League bundle (one file per league and season, built by pennant_fever_bundle_converter.py):
+# load_league() uses it when it exists in the team JSON directory, optionally memory-mapped
+USE_LEAGUE_BUNDLE = True
+LEAGUE_BUNDLE_MMAP = False
+
+# Standings output during the season: render the tables every N days (0 = final standings only)
+# and write a standings snapshot every N days (the per-game log is flushed daily)
+STANDINGS_DISPLAY_INTERVAL = 0
+STANDINGS_SNAPSHOT_INTERVAL = 7
+
+# Structured trace sink (pennant_fever_trace.RingBufferTracer / FileTracer), None = tracing off.
+# Every trace site is guarded by `if TRACER is not None`, so nothing is built when it's off.
+TRACER = None
+
+# Write a binary trace of the season to this file in BASE_DIRECTORY (None = off);
+# render it with: python pennant_fever_trace.py <file>
+TRACE_FILE = None
+
+# Per-step timing counters for resolve_team_runs (pennant_fever_profiler.StepProfiler), None = off.
+# Like TRACER, every site is guarded, so an uninstalled profiler costs one `is not None` test per call.
+PROFILER = None
+
+# Profile the season's resolve_team_runs steps, timing 1 call in this many (0 = off); the
+# report is logged and written to step_profile.json in BASE_DIRECTORY after the season
+STEP_PROFILE_SAMPLE_EVERY = 0
+
+# Write the season's columnar game log here in BASE_DIRECTORY (None = off): a '.sqlite'/'.db'
+# file, or a directory of Parquet parts otherwise; query it with pennant_fever_game_log
+GAME_LOG_FILE = None
+
+# Also write season_pitcher_stats.xlsx next to the CSV (needs openpyxl, slow for large leagues)
+PITCHER_STATS_EXCEL = False
+
+
+def set_tracer(tracer):
+    """Install a tracer for every game (None turns tracing off); returns the previous one."""
+    global TRACER
+    previous = TRACER
+    TRACER = tracer
+    return previous
+
+
+def set_profiler(profiler):
+    """Install a StepProfiler for resolve_team_runs (None turns it off); returns the previous one."""
+    global PROFILER
+    previous = PROFILER
+    PROFILER = profiler
+    return previous
+
+# =============================================================================
+# DICE CHARTS - Power and Speed/Bench charts keyed by (die, die) -> third die
+# =============================================================================
+POWER_CHART = {
+    (1, 1): {1: "Spot 4", 2: "Bench 6", 3: "Bench 5", 4: "Spot 5", 5: "Spot 7", 6: "Spot 9"},
+    (2, 2): {1: "Spot 3", 2: "Spot 4", 3: "Bench 1", 4: "Spot 2", 5: "Spot 6", 6: "Bench 2"},
+    (3, 3): {1: "Bench 4", 2: "Spot 3", 3: "Spot 4", 4: "Spot 1", 5: "Spot 5", 6: "Bench 3"},
+    (4, 4): {1: "Spot 5", 2: "Spot 2", 3: "Spot 3", 4: "Spot 4", 5: "Spot 1", 6: "Spot 6"},
+    (5, 5): {1: "Spot 8", 2: "Spot 7", 3: "Spot 6", 4: "Spot 3", 5: "Spot 4", 6: "Spot 2"},
+    (6, 6): {1: "Bench 2", 2: "Spot 8", 3: "Spot 5", 4: "Bench 1", 5: "Spot 3", 6: "Spot 4"}
+}
+
+SPEED_BENCH_CHART = {
+    (1, 1): {1: "Spot 5", 2: "Bench 1", 3: "Bench 2", 4: "Spot 3", 5: "Spot 6", 6: "Spot 2"},
+    (2, 2): {1: "Spot 1", 2: "Spot 8", 3: "Spot 3", 4: "Spot 4", 5: "Spot 7", 6: "Bench 3"},
+    (3, 3): {1: "Spot 1", 2: "Spot 1", 3: "Spot 1", 4: "Spot 9", 5: "Spot 1", 6: "Spot 1"},
+    (4, 4): {1: "Spot 2", 2: "Bench 3", 3: "Bench 6", 4: "Spot 2", 5: "Spot 3", 6: "Bench 5"},
+    (5, 5): {1: "Spot 6", 2: "Spot 9", 3: "Spot 8", 4: "Bench 4", 5: "Spot 2", 6: "Spot 1"},
+    (6, 6): {1: "Spot 7", 2: "Bench 2", 3: "Spot 4", 4: "Bench 1", 5: "Spot 3", 6: "Spot 5"}
+}
+
+# Relief/Defense Chart - fielder consulted by dice sum (3-10) and green die parity
+DEFENSE_CHART = {
+    3: {"odd": "Bench 5", "even": "CF"}, # CF needs to be changed to P but we need P (or SP/RP) as a position in the player json first
+    4: {"odd": "Bench 4", "even": "Bench 6"},
+    5: {"odd": "Bench 2", "even": "Bench 3"},
+    6: {"odd": "C", "even": "Bench 1"},
+    7: {"odd": "SS", "even": "1B"},
+    8: {"odd": "3B", "even": "SS"},
+    9: {"odd": "CF", "even": "LF"},
+    10: {"odd": "2B", "even": "RF"}
+}
+
+# Relief/Defense Chart - Pitcher Endurance column (dice sum 3-10, no relief needed above 10)
+ENDURANCE_CHART = {3: 2, 4: 2, 5: 1, 6: 1, 7: 2, 8: 3, 9: 4, 10: 5}
+
+# Optional chart file in BASE_DIRECTORY (json/charts.json is the stock ruleset); the
+# built-in tables above are used when it is missing
+CHARTS_FILE_NAME = 'charts.json'
+
+
+def chart_slot(chart_entry):
+    """Convert a "Spot N" / "Bench N" chart entry to a roster index (None if invalid)."""
+    if not chart_entry:
+        return None
+    if "Spot" in chart_entry:
+        return int(chart_entry.split(" ")[1]) - 1
+    if "Bench" in chart_entry:
+        return 9 + int(chart_entry.split(" ")[1]) - 1
+    return None
+
+
+class CompiledCharts:
+    """
+    Dice charts compiled to integer roster-slot arrays, built once per league load.
+
+    power_slots[w-1, r-1, g-1] is the roster index the Power Chart points at for a
+    (white, red, green) roll, with the white-die pairing already resolved;
+    speed_slots[r-1, g-1, w-1] is the Speed/Bench Chart entry. defense_slots and
+    defense_positions are indexed [dice_sum, green die odd] and hold either a bench
+    roster index or a fielding position; endurance[dice_sum] is the starter's
+    endurance threshold. -1 (or None) marks an empty cell.
+    """
+
+    MAX_DICE_SUM = 18
+
+    def __init__(self, power_chart, speed_bench_chart, defense_chart=None, endurance_chart=None):
+        defense_chart = defense_chart if defense_chart is not None else DEFENSE_CHART
+        endurance_chart = endurance_chart if endurance_chart is not None else ENDURANCE_CHART
+
+        self.power_slots = np.full((6, 6, 6), -1, dtype=np.int16)
+        self.speed_slots = np.full((6, 6, 6), -1, dtype=np.int16)
+        for white in range(1, 7):
+            for red in range(1, 7):
+                for green in range(1, 7):
+                    # consult_power_chart pairs white with red first, then with green
+                    if white == red:
+                        entry = power_chart.get((white, red), {}).get(green)
+                    elif white == green:
+                        entry = power_chart.get((white, green), {}).get(red)
+                    else:
+                        entry = None
+                    slot = chart_slot(entry)
+                    if slot is not None:
+                        self.power_slots[white - 1, red - 1, green - 1] = slot
+
+                    slot = chart_slot(speed_bench_chart.get((red, green), {}).get(white))
+                    if slot is not None:
+                        self.speed_slots[red - 1, green - 1, white - 1] = slot
+
+        size = self.MAX_DICE_SUM + 1
+        self.defense_slots = np.full((size, 2), -1, dtype=np.int16)
+        self.defense_positions = [[None, None] for _ in range(size)]
+        for dice_sum, row in defense_chart.items():
+            for parity, column in (("even", 0), ("odd", 1)):
+                entry = row.get(parity)
+                if not entry:
+                    continue
+                if "Bench" in entry:
+                    self.defense_slots[dice_sum, column] = chart_slot(entry)
+                else:
+                    self.defense_positions[dice_sum][column] = entry
+
+        self.endurance = np.zeros(size, dtype=np.int16)
+        for dice_sum, threshold in endurance_chart.items():
+            self.endurance[dice_sum] = threshold
+
+        # Fielding positions the defense chart can call for, in chart order
+        self.fielding_positions = list(dict.fromkeys(
+            position for row in self.defense_positions for position in row if position is not None))
+
+        # Plain nested lists for the scalar engine, where numpy scalar indexing is the slower path
+        self.power_lookup = self.power_slots.tolist()
+        self.speed_lookup = self.speed_slots.tolist()
+        self.defense_lookup = self.defense_slots.tolist()
+        self.endurance_lookup = self.endurance.tolist()
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Compile a chart file: {"power_chart": {"1,1": {"1": "Spot 4", ...}}, "speed_bench_chart": {...},
+        "defense_chart": {"3": {"odd": "Bench 5", "even": "CF"}, ...}, "endurance_chart": {"3": 2, ...}}.
+        The defense and endurance charts are optional.
+        """
+        with open(path, 'r') as f:
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def from_dict(cls, data):
+        """Compile a parsed chart document (the charts.json layout)."""
+        def dice_chart(chart):
+            return {tuple(int(die) for die in key.split(",")): {int(die): entry for die, entry in row.items()}
+                    for key, row in chart.items()}
+
+        defense_chart = data.get('defense_chart')
+        endurance_chart = data.get('endurance_chart')
+        return cls(
+            dice_chart(data['power_chart']),
+            dice_chart(data['speed_bench_chart']),
+            {int(dice_sum): row for dice_sum, row in defense_chart.items()} if defense_chart else None,
+            {int(dice_sum): value for dice_sum, value in endurance_chart.items()} if endurance_chart else None,
+        )
+
+    def power_slot(self, white_die, red_die, green_die):
+        return self.power_lookup[white_die - 1][red_die - 1][green_die - 1]
+
+    def speed_slot(self, red_die, green_die, white_die):
+        return self.speed_lookup[red_die - 1][green_die - 1][white_die - 1]
+
+    def defense_entry(self, dice_sum, green_die):
+        """(bench roster index or -1, fielding position or None) for a dice sum and green die."""
+        if not 0 <= dice_sum <= self.MAX_DICE_SUM:
+            return -1, None
+        column = green_die % 2
+        return self.defense_lookup[dice_sum][column], self.defense_positions[dice_sum][column]
+
+    def endurance_threshold(self, dice_sum):
+        if not 0 <= dice_sum <= self.MAX_DICE_SUM:
+            return 0
+        return self.endurance_lookup[dice_sum]
+
+
+_COMPILED_CHARTS = {}
+
+
+def compile_charts(power_chart=None, speed_bench_chart=None):
+    """
+    CompiledCharts for a pair of chart dicts, compiled once and reused for as long as
+    the dicts are alive (the engine is usually handed the same module-level charts).
+    """
+    power_chart = power_chart if power_chart is not None else POWER_CHART
+    speed_bench_chart = speed_bench_chart if speed_bench_chart is not None else SPEED_BENCH_CHART
+    key = (id(power_chart), id(speed_bench_chart))
+    entry = _COMPILED_CHARTS.get(key)
+    if entry is None or entry[0] is not power_chart or entry[1] is not speed_bench_chart:
+        entry = (power_chart, speed_bench_chart, CompiledCharts(power_chart, speed_bench_chart))
+        _COMPILED_CHARTS[key] = entry
+    return entry[2]
+
+
+def chart_document(directory=None):
+    """The charts.json document in `directory` (BASE_DIRECTORY by default), or the built-in charts in that layout."""
+    charts_path = os.path.join(directory or BASE_DIRECTORY, CHARTS_FILE_NAME)
+    if os.path.exists(charts_path):
+        with open(charts_path, 'r') as f:
+            return json.load(f)
+
+    def dice_chart(chart):
+        return {f"{a},{b}": {str(die): entry for die, entry in row.items()} for (a, b), row in chart.items()}
+
+    return {
+        'power_chart': dice_chart(POWER_CHART),
+        'speed_bench_chart': dice_chart(SPEED_BENCH_CHART),
+        'defense_chart': {str(dice_sum): row for dice_sum, row in DEFENSE_CHART.items()},
+        'endurance_chart': {str(dice_sum): value for dice_sum, value in ENDURANCE_CHART.items()},
+    }
+
+
+def load_charts(directory=None):
+    """Compile the chart file in `directory` (BASE_DIRECTORY by default), or the built-in charts."""
+    charts_path = os.path.join(directory or BASE_DIRECTORY, CHARTS_FILE_NAME)
+    if os.path.exists(charts_path):
+        logger.info(f"Loading dice charts from: {charts_path}")
+        return CompiledCharts.from_file(charts_path)
+    return compile_charts()
+
+class GameResult:
+    """
+    Typed record of one played game, returned by Game.play_game.
+
+    Fields are filled in as the game is played and stay unset until then, so the
+    mapping interface (result['home_runs'], result.get(...), keys/items) behaves
+    like the dict play_game used to return. Reliever breakdowns are keyed by
+    reliever name; innings are baseball notation strings ('1.2' = 1 2/3).
+    Quirk kept from ReliefPitching: each side's reliever breakdown lists the
+    BATTING team's relievers ('away_reliever_*' are the away team's own relievers).
+    """
+
+    __slots__ = (
+        'day', 'home_team_id', 'away_team_id', 'home_runs', 'away_runs',
+        'away_pitcher_throws', 'home_pitcher_throws', 'away_starter_name', 'home_starter_name',
+        'away_total_relief_value', 'away_starter_innings', 'away_reliever_innings_distribution',
+        'away_reliever_earned_runs', 'away_reliever_unearned_runs', 'away_chosen_relievers',
+        'home_total_relief_value', 'home_starter_innings', 'home_reliever_innings_distribution',
+        'home_reliever_earned_runs', 'home_reliever_unearned_runs', 'home_chosen_relievers',
+        'is_one_run', 'is_extra_innings', 'away_starter_decision', 'home_starter_decision',
+        'winning_reliever_name', 'losing_reliever_name', 'save_reliever_name',
+        'winning_reliever_team_id', 'losing_reliever_team_id', 'save_team_id',
+    )
+
+    day: int
+    home_team_id: object
+    away_team_id: object
+    home_runs: int
+    away_runs: int
+    away_pitcher_throws: str
+    home_pitcher_throws: str
+    away_starter_name: str
+    home_starter_name: str
+    away_total_relief_value: float
+    away_starter_innings: float  # innings by the HOME starter (away team batting)
+    away_reliever_innings_distribution: dict
+    away_reliever_earned_runs: dict
+    away_reliever_unearned_runs: dict
+    away_chosen_relievers: list
+    home_total_relief_value: float
+    home_starter_innings: float  # innings by the AWAY starter (home team batting)
+    home_reliever_innings_distribution: dict
+    home_reliever_earned_runs: dict
+    home_reliever_unearned_runs: dict
+    home_chosen_relievers: list
+    is_one_run: bool
+    is_extra_innings: bool
+    away_starter_decision: str
+    home_starter_decision: str
+    winning_reliever_name: str
+    losing_reliever_name: str
+    save_reliever_name: str
+    winning_reliever_team_id: object
+    losing_reliever_team_id: object
+    save_team_id: object
+
+    def __init__(self, **fields):
+        self.home_runs = 0
+        self.away_runs = 0
+        for key, value in fields.items():
+            setattr(self, key, value)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.__slots__ and hasattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def keys(self):
+        return [key for key in self.__slots__ if hasattr(self, key)]
+
+    def items(self):
+        return [(key, getattr(self, key)) for key in self.keys()]
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def pitching_lines(self):
+        """
+        Every pitcher's line for the season tracker and the game log, in the order
+        main() records them (home starter, away starter, away relievers, home relievers):
+        (team_id, pitcher_name, is_starter, innings, earned_runs, unearned_runs, decision, finished)
+        where finished is a complete game for starters and a save for relievers.
+        Starters are charged the runs the relievers on the other side of the ledger didn't allow.
+        """
+        lines = []
+        sides = (
+            (self.home_team_id, 'home', 'away'),  # home starter faced the away lineup
+            (self.away_team_id, 'away', 'home'),
+        )
+        for team_id, side, batting in sides:
+            name = self.get(f'{side}_starter_name')
+            if not name:
+                continue
+            innings = self.get(f'{batting}_starter_innings', 0)
+            reliever_runs = (sum(self._breakdown(f'{batting}_reliever_earned_runs').values())
+                             + sum(self._breakdown(f'{batting}_reliever_unearned_runs').values()))
+            runs = max(0, self[f'{batting}_runs'] - reliever_runs)
+            lines.append((team_id, name, True, innings, runs, 0, self.get(f'{side}_starter_decision'), innings >= 9.0))
+
+        for team_id, side in ((self.away_team_id, 'away'), (self.home_team_id, 'home')):
+            earned = self._breakdown(f'{side}_reliever_earned_runs')
+            unearned = self._breakdown(f'{side}_reliever_unearned_runs')
+            for name, innings in self._breakdown(f'{side}_reliever_innings_distribution').items():
+                decision = None
+                # Only credit W/L/S if this reliever's TEAM matches
+                if name == self.get('winning_reliever_name') and self.get('winning_reliever_team_id') == team_id:
+                    decision = 'W'
+                elif name == self.get('losing_reliever_name') and self.get('losing_reliever_team_id') == team_id:
+                    decision = 'L'
+                elif name == self.get('save_reliever_name') and self.get('save_team_id') == team_id:
+                    decision = 'S'
+                lines.append((team_id, name, False, float(innings) if innings else 0.0,
+                              earned.get(name, 0), unearned.get(name, 0), decision, decision == 'S'))
+        return lines
+
+    def _breakdown(self, key):
+        value = self.get(key, {})
+        return value if isinstance(value, dict) else {}
+
 class Game:
-    def __init__(self, home_team, away_team, day, power_chart, speed_bench_chart, relief_defense_chart):
+    def __init__(self, home_team, away_team, day, power_chart, speed_bench_chart, relief_defense_chart, matchup_cache=None, rng=None, charts=None):
         self.home_team = home_team
         self.away_team = away_team
         self.home_team_ballpark = home_team.ballpark  # Assign ballparks here
@@ -62,18 +471,28 @@ class Game:
         if self.day is None:
             logger.debug("Warning: Game day (self.day) is None. Defaulting to day 0.")
             self.day = 0  # This should now no longer default to 0, since 'day' is passed correctly
-        self.dice = Dice(6)
+        self.rng = rng  # Optional numpy Generator so replicate seasons can be replayed exactly
+        self.dice = Dice(6, rng)
         self.power_chart = power_chart  # Dictionary mapping to player indices or names
         self.speed_bench_chart = speed_bench_chart  # Similarly mapped
         self.relief_defense_chart = relief_defense_chart  # Similarly mapped
-        self.result = {'home_runs': 0, 'away_runs': 0}
+        # Compiled roster-slot arrays used by the chart lookups (built from the dicts above if not given)
+        self.charts = charts if charts is not None else compile_charts(power_chart, speed_bench_chart)
+        self.matchup_cache = matchup_cache  # Optional MatchupCache shared across the season
+        self.result = GameResult(day=self.day, home_team_id=home_team.team_id, away_team_id=away_team.team_id)
 
         self.used_relievers_home = []
         self.used_relievers_away = []
 
     def injury_check(self, team):
-        injury = Injury(team)
+        injury = Injury(team, self.rng)
         injured_player = injury.check_injury()
+        if TRACER is not None:
+            days = injured_player.injury_days
+            TRACER.emit(trace.INJURY, team.team_name, injured_player.name, -1 if days == 'Season' else days)
+        team.mark_lineup_changed()
+        if self.matchup_cache is not None:
+            self.matchup_cache.invalidate_team(team)
         return injured_player
 
     def roll_dice(self):
@@ -90,133 +509,73 @@ class Game:
         return sum(dice)
 
     def consult_power_chart(self, white_die, red_die, green_die, team, ballpark):
-        # Step 1: Check for doubles (white == red or white == green) or even triad (222, 444, 666)
-        if white_die == red_die or white_die == green_die:
-            # Step 2: Determine which dice are matching and select the chart key
-            if white_die == red_die:
-                # Matching white and red, use (white, red) as the chart key
-                chart_key = (white_die, red_die)
-                non_matching_die = green_die  # The non-matching die is the green one
-            else:
-                # Matching white and green, use (white, green) as the chart key
-                chart_key = (white_die, green_die)
-                non_matching_die = red_die  # The non-matching die is the red one
-
-            # Step 3: Look up the correct row in the power_chart
-            chart_row = self.power_chart.get(chart_key)
-            if chart_row is None:
-                logger.debug(f"Power chart did not return a valid entry for dice {white_die} + {red_die} + {green_die}")
-                return None
-
-            # Step 4: Use the non-matching die to select the correct spot
-            chart_entry = chart_row.get(non_matching_die)
-            if not chart_entry:
-                logger.debug(f"Power chart did not return a valid entry for dice {white_die} + {non_matching_die}")
-                return None
-
-            # Step 5: Determine if the chart entry is a lineup or bench spot
-            if "Spot" in chart_entry:
-                # It’s a starter, map to the correct lineup spot (1-9)
-                spot_number = int(chart_entry.split(" ")[1])
-                player = team.players[spot_number - 1]  # Assuming the lineup is 1-based
-                logger.debug(f"Power bonus from player in lineup Spot {spot_number}: {player.name}")
-                return player
-            elif "Bench" in chart_entry:
-                # It's a bench player, map to the correct bench spot (10-15)
-                bench_number = int(chart_entry.split(" ")[1])
-                player = team.players[9 + bench_number - 1]  # Bench starts at index 9
-                logger.debug(f"Power bonus from bench player Bench {bench_number}: {player.name}")
-                return player
-            else:
-                logger.debug(f"Invalid chart entry: {chart_entry}")
-                return None
-        else:
-            logger.debug(f"No power bonus. Dice combination: white={white_die}, red={red_die}, green={green_die}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # Doubles (white == red or white == green) select a chart row; the compiled
+        # chart already maps the roll to the lineup (0-8) or bench (9-14) index
+        slot = self.charts.power_slot(white_die, red_die, green_die)
+        if slot < 0:
+            if debug:
+                logger.debug("No power bonus. Dice combination: white=%s, red=%s, green=%s", white_die, red_die, green_die)
             return None
 
-    def consult_speed_bench_chart(self, red_die, green_die, white_die, team):
-        # Look up the chart entry based on the dice combination
-        chart_entry = self.speed_bench_chart.get((red_die, green_die), {}).get(white_die, None)
+        player = team.players[slot]
+        if slot < 9:
+            if debug:
+                logger.debug("Power bonus from player in lineup Spot %s: %s", slot + 1, player.name)
+        else:
+            if debug:
+                logger.debug("Power bonus from bench player Bench %s: %s", slot - 8, player.name)
+        return player
 
-        if chart_entry is None:
-            logger.debug(f"No valid chart entry for Red={red_die}, Green={green_die}, White={white_die}.")
+    def consult_speed_bench_chart(self, red_die, green_die, white_die, team):
+        debug = logger.isEnabledFor(logging.DEBUG)
+        slot = self.charts.speed_slot(red_die, green_die, white_die)
+        if slot < 0:
+            if debug:
+                logger.debug("No valid chart entry for Red=%s, Green=%s, White=%s.", red_die, green_die, white_die)
             return None
 
-        # Handle lineup (Spot) or bench (Bench) spots from the chart
-        if "Spot" in chart_entry:
-            # It's a starter, map to the correct lineup spot (1-9)
-            spot_number = int(chart_entry.split(" ")[1])
-            player = team.players[spot_number - 1]  # Assuming lineup is 1-based
-            logger.debug(f"Speed bonus from player in lineup Spot {spot_number}: {player.name} with speed value {player.speed}")
+        player = team.players[slot]
+        if slot < 9:
+            if debug:
+                logger.debug("Speed bonus from player in lineup Spot %s: %s with speed value %s", slot + 1, player.name, player.speed)
             return ("SP", player.speed)
-        
-        elif "Bench" in chart_entry:
-            # It's a bench player, map to the correct bench spot (10-15)
-            bench_number = int(chart_entry.split(" ")[1])
-            player = team.players[9 + bench_number - 1]  # Bench starts at index 9
-            logger.debug(f"Speed bonus from bench player Bench {bench_number}: {player.name} with speed value {player.speed}")
-            return ("BN", player.speed)
-
-        logger.debug(f"Invalid chart entry: {chart_entry}")
-        return None
+        if debug:
+            logger.debug("Speed bonus from bench player Bench %s: %s with speed value %s", slot - 8, player.name, player.speed)
+        return ("BN", player.speed)
 
-    # Define consult_relief_defense_chart inside Game class
     def consult_relief_defense_chart(self, dice_sum, green_die, team): # this is just the defense chart now, relief removed
-        # New chart based on dice sum and whether the green die is even or odd
-        relief_defense_chart = {
-            3: {"odd": "Bench 5", "even": "CF"}, # CF needs to be changed to P but we need P (or SP/RP) as a position in the player json first
-            4: {"odd": "Bench 4", "even": "Bench 6"},
-            5: {"odd": "Bench 2", "even": "Bench 3"},
-            6: {"odd": "C", "even": "Bench 1"},
-            7: {"odd": "SS", "even": "1B"},
-            8: {"odd": "3B", "even": "SS"},
-            9: {"odd": "CF", "even": "LF"},
-            10: {"odd": "2B", "even": "RF"}
-        }
-        
-        chart_entry = relief_defense_chart.get(dice_sum, None)
-        if not chart_entry:
-            logger.debug(f"No valid chart entry for dice sum {dice_sum}.")
-            return {"fielding_value": 0}
-        
-        # Determine if green die is odd or even and get the field position
-        field_position = chart_entry["odd"] if green_die % 2 == 1 else chart_entry["even"]
-        
-        # Find the player based on field position
-        if "Bench" in field_position:
-            # Get the bench spot number from the string
-            bench_number = int(field_position.split(" ")[1])
-            player_at_position = team.players[9 + bench_number - 1]  # Bench starts at index 9
-        else:
-            # Look for the player in the given fielding position
-            player_at_position = next((p for p in team.players if p.position == field_position), None)
-        
-        if player_at_position:
-            logger.debug(f"Using {player_at_position.name} at position {field_position} with fielding value {player_at_position.fielding}")
-            return {"fielding_value": player_at_position.fielding}
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # Fielder by dice sum and whether the green die is even or odd (DEFENSE_CHART):
+        # either a bench spot or a fielding position resolved through the team's position index
+        slot, field_position = self.charts.defense_entry(dice_sum, green_die)
+        if slot >= 0:
+            field_position = f"Bench {slot - 8}"
+        elif field_position is not None:
+            slot = team.position_slot(field_position)
+            if slot < 0:
+                if debug:
+                    logger.debug("No player found at position %s.", field_position)
+                return {"fielding_value": 0}
         else:
-            logger.debug(f"No player found at position {field_position}.")
+            if debug:
+                logger.debug("No valid chart entry for dice sum %s.", dice_sum)
             return {"fielding_value": 0}
 
+        if team.fielding_lookup is None:
+            team.rebuild_position_index()
+        fielding_value = team.fielding_lookup[slot]
+        if debug:
+            logger.debug("Using %s at position %s with fielding value %s", team.players[slot].name, field_position, fielding_value)
+        return {"fielding_value": fielding_value}
+
     def get_endurance_threshold_from_dice(self, dice_sum):
         """
         Get the endurance threshold from the Relief/Defense Chart based on dice sum.
         Based on original Avalon Hill tabletop game chart.
         If pitcher's endurance > threshold, they don't need relief help.
         """
-        # Relief/Defense Chart - Pitcher Endurance column
-        # Only applies when dice sum is 10 or less
-        endurance_chart = {
-            3: 2,
-            4: 2,
-            5: 1,
-            6: 1,
-            7: 2,
-            8: 3,
-            9: 4,
-            10: 5
-        }
-        return endurance_chart.get(dice_sum, 0)  # Default 0 means no relief needed for sum > 10
+        return self.charts.endurance_threshold(dice_sum)  # 0 means no relief needed for sum > 10
 
     def check_pitcher_shutout_or_complete_game(self, triad, pitcher, white_die):
         """
@@ -224,6 +583,7 @@ class Game:
         Uses the original Relief/Defense Chart logic from the tabletop game.
         A short-rested pitcher cannot achieve a CG or SHO.
         """
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         # Check if the pitcher is short-rested
         # Handle unstarted pitchers (first start of the season)
@@ -232,11 +592,13 @@ class Game:
         else:
             days_since_last_start = self.day - pitcher.last_start_day
 
-        logger.debug(f"Current day: {self.day}, Last start day: {pitcher.last_start_day}, Required rest: {pitcher.rest}, Days since last start: {days_since_last_start}")
+        if debug:
+            logger.debug("Current day: %s, Last start day: %s, Required rest: %s, Days since last start: %s", self.day, pitcher.last_start_day, pitcher.rest, days_since_last_start)
 
         # Pitcher must not be short-rested to qualify for CG or SHO
         if days_since_last_start < pitcher.rest:
-            logger.debug(f"{pitcher.name} is short-rested and ineligible for CG or SHO.")
+            if debug:
+                logger.debug("%s is short-rested and ineligible for CG or SHO.", pitcher.name)
             return False, False, False  # No shutout, no complete game, no CG/SHO combo
 
         # Step 1: Check for Complete Game using endurance + dice sum chart
@@ -245,20 +607,21 @@ class Game:
         if triad <= 10:
             endurance_threshold = self.get_endurance_threshold_from_dice(triad)
             is_complete_game = pitcher.endurance > endurance_threshold
-            logger.debug(f"Dice sum {triad} <= 10: Endurance threshold = {endurance_threshold}, "
-                        f"Pitcher endurance = {pitcher.endurance}, CG = {is_complete_game}")
+            if debug:
+                logger.debug("Dice sum %s <= 10: Endurance threshold = %s, Pitcher endurance = %s, CG = %s", triad, endurance_threshold, pitcher.endurance, is_complete_game)
         else:
             # Dice sum > 10: Pitcher had a good day, no heavy relief needed
             # CG is possible if pitcher has decent endurance (>= 4)
             is_complete_game = pitcher.endurance >= 4
-            logger.debug(f"Dice sum {triad} > 10: Pitcher had good day, CG = {is_complete_game} (endurance {pitcher.endurance})")
+            if debug:
+                logger.debug("Dice sum %s > 10: Pitcher had good day, CG = %s (endurance %s)", triad, is_complete_game, pitcher.endurance)
 
         # Step 2: Check for Shutout (independent of CG)
         # Shutout requires: good dice roll, decent white die, and quality starter
         sho_threshold = pitcher.sho_rating
         is_shutout = triad > sho_threshold and white_die >= 5 and pitcher.start_value >= 3.0
-        logger.debug(f"Shutout check: triad {triad} > sho_threshold {sho_threshold}? white_die {white_die} >= 5? "
-                    f"start_value {pitcher.start_value} >= 3.0? Result: {is_shutout}")
+        if debug:
+            logger.debug("Shutout check: triad %s > sho_threshold %s? white_die %s >= 5? start_value %s >= 3.0? Result: %s", triad, sho_threshold, white_die, pitcher.start_value, is_shutout)
 
         # Step 3: Handle the rare case of a complete game shutout (CG/SHO combo)
         if is_shutout and is_complete_game:
@@ -268,7 +631,8 @@ class Game:
 
         # Step 4: Handle the case where it's a shutout but NOT a complete game
         if is_shutout and not is_complete_game:
-            logger.debug(f"Shutout but not CG: endurance {pitcher.endurance} not sufficient for dice sum {triad}")
+            if debug:
+                logger.debug("Shutout but not CG: endurance %s not sufficient for dice sum %s", pitcher.endurance, triad)
             logger.info(f"{pitcher.name} throws a shutout but does not complete the game!")
             return True, False, False  # Shutout but not a complete game
 
@@ -282,6 +646,7 @@ class Game:
 
     def find_individual_bat_player(self, team, dice_sum):
         """Find the player whose lineup position corresponds to the specific dice sum."""
+        debug = logger.isEnabledFor(logging.DEBUG)
         # Map dice sums to lineup positions as specified
         dice_sum_to_slot = {
             11: 1,
@@ -298,14 +663,17 @@ class Game:
         if dice_sum in dice_sum_to_slot:
             slot = dice_sum_to_slot[dice_sum]
             player = team.players[slot - 1]  # Assuming lineup positions are 1-based
-            logger.debug(f"Step 5: Individual bat bonus from {player.name} with a batting value of {player.batting}.")
+            if debug:
+                logger.debug("Step 5: Individual bat bonus from %s with a batting value of %s.", player.name, player.batting)
             return player
         else:
             # If the dice sum isn't in the mapping, return None and log the result
-            logger.debug(f"Step 5: No individual bat bonus player found for dice sum {dice_sum}.")
+            if debug:
+                logger.debug("Step 5: No individual bat bonus player found for dice sum %s.", dice_sum)
             return None
 
     def calculate_runs_for_starter(self, total_earned_runs, total_unearned_runs, starter, relief_pitching, current_day):
+        debug = logger.isEnabledFor(logging.DEBUG)
         # Step 1: Calculate how many outs the starter pitched
         bullpen_innings = relief_pitching.innings_pitched_by_bullpen() if relief_pitching else 0
         total_outs = 27  # Total outs in a full game
@@ -314,20 +682,23 @@ class Game:
         
         # Convert starter_outs to innings format (1 out = 0.1 innings, 3 outs = 1.0 innings)
         starter_innings = starter_outs // 3 + (starter_outs % 3) * 0.1
-        logger.debug(f"Starter innings: {starter_innings}")
+        if debug:
+            logger.debug("Starter innings: %s", starter_innings)
 
         # Step 2: Check if the opposing team has exceeded a run threshold
         RUN_THRESHOLD = 8  # Default run threshold for pulling a starter early
 
         if total_earned_runs >= RUN_THRESHOLD:
-            logger.debug(f"Runs exceeded threshold of {RUN_THRESHOLD}. Starter will be pulled early.")
+            if debug:
+                logger.debug("Runs exceeded threshold of %s. Starter will be pulled early.", RUN_THRESHOLD)
 
             # Assume better starters last longer when runs exceed the threshold
             if starter.start_value >= 5:
                 starter_innings = max(starter_innings - 1, 3)  # Keep at least 3 innings
             else:
                 starter_innings = max(starter_innings - 2, 2)  # Lower quality starters pulled earlier
-            logger.debug(f"Adjusted innings due to exceeded runs: {starter_innings}")
+            if debug:
+                logger.debug("Adjusted innings due to exceeded runs: %s", starter_innings)
 
         # Check for short rest
         if starter.last_start_day is None or starter.last_start_day == 0:
@@ -336,10 +707,12 @@ class Game:
             days_since_last_start = current_day - starter.last_start_day
 
         if days_since_last_start < starter.rest:
-            logger.debug(f"Short rest: {days_since_last_start} days since last start (Rest needed: {starter.rest})")
+            if debug:
+                logger.debug("Short rest: %s days since last start (Rest needed: %s)", days_since_last_start, starter.rest)
             endurance_penalty = 1 if starter.endurance >= 4 else 2  # Higher endurance starters penalized less
             starter_innings = max(starter_innings - endurance_penalty, 2)  # Limit to at least 2 innings
-            logger.debug(f"Adjusted innings due to short rest: {starter_innings}")
+            if debug:
+                logger.debug("Adjusted innings due to short rest: %s", starter_innings)
 
         # Step 3: Calculate the portion of earned and unearned runs the starter is responsible for
         starter_proportion = starter_innings / 9.0  # Starter's portion of the game
@@ -359,7 +732,8 @@ class Game:
         # Ensure we don't exceed the total earned runs
         starter_earned_runs = min(starter_earned_runs, total_earned_runs)
 
-        logger.debug(f"Starter responsible for {starter_earned_runs} earned runs and {starter_unearned_runs} unearned runs out of {total_earned_runs + total_unearned_runs} total.")
+        if debug:
+            logger.debug("Starter responsible for %s earned runs and %s unearned runs out of %s total.", starter_earned_runs, starter_unearned_runs, total_earned_runs + total_unearned_runs)
 
         # Return the earned and unearned runs assigned to the starter, so the rest can be passed to relievers
         return starter_earned_runs, starter_unearned_runs, starter_innings
@@ -373,6 +747,7 @@ class Game:
         """
         Adjust the team's batting value based on the handedness of the chosen relievers, looping through the lineup until outs are distributed.
         """
+        debug = logger.isEnabledFor(logging.DEBUG)
         total_modifier = 0  # Will accumulate the net effect of all relievers
         total_outs_distributed = 0  # Track the total outs distributed to relievers
         lineup = [player for player in team.players if player.role == 'Starter']  # Filter starters
@@ -390,7 +765,8 @@ class Game:
                 continue
 
             outs_for_this_reliever = int(innings_pitched * 3)  # Convert innings to outs
-            logger.debug(f"{reliever.name} responsible for {outs_for_this_reliever} outs.")
+            if debug:
+                logger.debug("%s responsible for %s outs.", reliever.name, outs_for_this_reliever)
 
             # Distribute outs by looping through the lineup until all outs are accounted for
             while outs_for_this_reliever > 0:
@@ -401,7 +777,8 @@ class Game:
                 batter_modifier = 0  # Default modifier for switch-hitters
                 reliever_modifier = 0  # Initialize reliever modifier
 
-                logger.debug(f"Processing {player.name} (Bats: {player.bats}) vs. Reliever {reliever.name} (Throws: {reliever_throws})")
+                if debug:
+                    logger.debug("Processing %s (Bats: %s) vs. Reliever %s (Throws: %s)", player.name, player.bats, reliever.name, reliever_throws)
 
                 # Determine the batter's splits against the reliever's handedness
                 if reliever_throws == 'L':
@@ -435,13 +812,15 @@ class Game:
                 # Add to total modifier, weighted by innings pitched
                 total_modifier += (adjusted_player_bv) * (innings_pitched / 9.0)
 
-                logger.debug(f"{player.name} BV: {player_bv} / Modifier: {batter_modifier} vs {reliever.name} Modifier: {reliever_modifier}, Adjusted BV: {adjusted_player_bv}")
+                if debug:
+                    logger.debug("%s BV: %s / Modifier: %s vs %s Modifier: %s, Adjusted BV: %s", player.name, player_bv, batter_modifier, reliever.name, reliever_modifier, adjusted_player_bv)
 
                 # Update outs processed
                 total_outs_distributed += 1
                 outs_for_this_reliever -= 1  # Decrement outs for this reliever
 
-        logger.debug(f"Total modifier after reliever adjustments: {total_modifier}")
+        if debug:
+            logger.debug("Total modifier after reliever adjustments: %s", total_modifier)
 
         # Adjust the original BV based on the cumulative effect of all relievers
         if total_outs_distributed > 0:
@@ -452,35 +831,41 @@ class Game:
 
     def recalculate_relief_innings(self, starter_innings, relief_pitching, current_day):
         """Recalculate bullpen innings after starter adjustments using proper baseball notation."""
+        debug = logger.isEnabledFor(logging.DEBUG)
         fatigue_cache = relief_pitching.fatigue_cache
-        fatigue_debug_info = {r.name: fatigue_cache[r] for r in fatigue_cache}
-        logger.debug(f"LINE 430 Fatigue cache: {fatigue_debug_info}")
-
-        logger.debug(f"Recalculating relief innings due to starter adjustment. Starter innings: {starter_innings}")
+        if debug:
+            fatigue_debug_info = {r.name: fatigue_cache[r] for r in fatigue_cache}
+            logger.debug("LINE 430 Fatigue cache: %s", fatigue_debug_info)
+            logger.debug("Recalculating relief innings due to starter adjustment. Starter innings: %s", starter_innings)
 
         # Step 1: Calculate updated bullpen innings based on reduced starter innings
         total_game_outs = 27  # Total outs in a 9-inning game
         starter_outs = int(starter_innings) * 3 + round((starter_innings % 1) * 10)
         updated_bullpen_outs = total_game_outs - starter_outs
-        logger.debug(f"Starter pitched {starter_outs} outs, bullpen needs to cover {updated_bullpen_outs} outs.")
+        if debug:
+            logger.debug("Starter pitched %s outs, bullpen needs to cover %s outs.", starter_outs, updated_bullpen_outs)
 
         # Convert the updated bullpen outs back into innings notation
         bullpen_innings_whole = updated_bullpen_outs // 3
         bullpen_innings_fractional = updated_bullpen_outs % 3
         updated_bullpen_innings = float(f"{bullpen_innings_whole}.{bullpen_innings_fractional}")
-        logger.debug(f"Updated bullpen innings in baseball notation: {updated_bullpen_innings}")
+        if debug:
+            logger.debug("Updated bullpen innings in baseball notation: %s", updated_bullpen_innings)
 
         # Step 2: Recalculate how many relievers to use based on the new bullpen innings
         relievers_used = relief_pitching.number_of_relievers_used(updated_bullpen_innings)
-        logger.debug(f"Recalculating relievers used: {relievers_used} relievers for {updated_bullpen_innings} innings.")
+        if debug:
+            logger.debug("Recalculating relievers used: %s relievers for %s innings.", relievers_used, updated_bullpen_innings)
 
         # Step 3: Recalculate the innings distribution among the relievers
         chosen_relievers = relief_pitching.used_relievers  # Ensure this is the list of relievers chosen earlier
-        logger.debug(f"LINE 452 Chosen relievers: {chosen_relievers}")
+        if debug:
+            logger.debug("LINE 452 Chosen relievers: %s", chosen_relievers)
 
         fatigue_cache = relief_pitching.fatigue_cache
-        fatigue_debug_info = {r.name: fatigue_cache[r] for r in fatigue_cache}
-        logger.debug(f"LINE 456 Fatigue cache: {fatigue_debug_info}")
+        if debug:
+            fatigue_debug_info = {r.name: fatigue_cache[r] for r in fatigue_cache}
+            logger.debug("LINE 456 Fatigue cache: %s", fatigue_debug_info)
 
         # Ensure all relievers have precomputed fatigue multipliers
         for reliever in chosen_relievers:
@@ -492,10 +877,16 @@ class Game:
             chosen_relievers, updated_bullpen_innings, fatigue_cache
         )
 
-        logger.debug(f"LINE 524 Relief innings distribution after recalculation: {innings_distribution}")
+        if debug:
+            logger.debug("LINE 524 Relief innings distribution after recalculation: %s", innings_distribution)
         return innings_distribution
 
     def resolve_team_runs(self, team, opponent_pitcher, current_day, is_visiting=True):
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # Step timings for 1 in profiler.sample_every calls (clock is 0 when not timing this call)
+        profiler = PROFILER
+        clock = profiler.begin() if profiler is not None else 0
+
         # Step 0: Roll the dice
         dice = self.roll_dice()
         white_die, red_die, green_die = dice
@@ -507,10 +898,17 @@ class Game:
         # Set ballpark for the current game
         ballpark = self.home_team_ballpark if not is_visiting else self.away_team_ballpark
 
-        logger.debug(f"Step 0: Rolling dice for {'visiting' if is_visiting else 'home'} team: White={white_die}, Red={red_die}, Green={green_die}, Triad={triad}, Sum={dice_sum}")
+        if debug:
+            logger.debug("Step 0: Rolling dice for %s team: White=%s, Red=%s, Green=%s, Triad=%s, Sum=%s", 'visiting' if is_visiting else 'home', white_die, red_die, green_die, triad, dice_sum)
+        if TRACER is not None:
+            TRACER.emit(trace.DICE, team.team_name, None, white_die, red_die, green_die)
+        if clock:
+            clock = profiler.lap(profiling.DICE, clock)
 
         # Step 1: Check for Shutout, Complete Game, or CG/SHO combo
         is_shutout, is_complete_game, is_cg_sho_combo = self.check_pitcher_shutout_or_complete_game(triad, opponent_pitcher, white_die)
+        if clock:
+            clock = profiler.lap(profiling.SHUTOUT_CHECK, clock)
 
         # Initialize relief_pitching to None
         relief_pitching = None
@@ -518,7 +916,10 @@ class Game:
 
         # If it's a complete game shutout, return 0 runs and mark it as a CG/SHO
         if is_cg_sho_combo:
-            logger.debug(f"Step 1: Complete Game Shutout! {opponent_pitcher.name} prevents the {team.team_name} from scoring.")
+            if debug:
+                logger.debug("Step 1: Complete Game Shutout! %s prevents the %s from scoring.", opponent_pitcher.name, team.team_name)
+            if TRACER is not None:
+                TRACER.emit(trace.SHUTOUT, team.team_name, opponent_pitcher.name, step=1)
             
             # Since it's a complete game shutout, assume no bullpen innings, no earned/unearned runs for relievers
             starter_innings = 9.0  # The starter pitched a complete game
@@ -526,12 +927,17 @@ class Game:
             earned_runs_distribution = {}
             unearned_runs_distribution = {}
             total_relief_value = 0  # No relief needed, so total relief value is 0
+            if profiler is not None:
+                profiler.branches[profiling.CG_SHO] += 1
             
             return 0, total_relief_value, starter_innings, reliever_innings_distribution, earned_runs_distribution, unearned_runs_distribution, chosen_relievers
 
         # If it's a shutout but not a complete game, relief pitching will be needed for the team shutout
         if is_shutout and not is_complete_game:
-            logger.debug(f"Step 1: Shutout but not a complete game! {opponent_pitcher.name} holds the {team.team_name} scoreless, bullpen finishes the game.")
+            if debug:
+                logger.debug("Step 1: Shutout but not a complete game! %s holds the %s scoreless, bullpen finishes the game.", opponent_pitcher.name, team.team_name)
+            if TRACER is not None:
+                TRACER.emit(trace.SHUTOUT, team.team_name, opponent_pitcher.name, step=2)
             
             # Process relief pitching to complete the shutout
             relief_pitching = ReliefPitching(opponent_pitcher, team, dice, self)
@@ -545,21 +951,36 @@ class Game:
             earned_runs_distribution, unearned_runs_distribution = relief_pitching.distribute_runs_among_relievers(
                 chosen_relievers, 0, 0, current_day, fatigue_cache)  # No runs, since it's a shutout
             
-            logger.debug(f"Step 1a: Total relief value after adjustments: {total_relief_value}")
+            if debug:
+                logger.debug("Step 1a: Total relief value after adjustments: %s", total_relief_value)
             
             # No runs as it’s a team shutout
-            logger.debug(f"Step 1b: Team completes the shutout with relief pitching.")
+            if debug:
+                logger.debug("Step 1b: Team completes the shutout with relief pitching.")
+            if profiler is not None:
+                profiler.branches[profiling.SHUTOUT_RELIEF] += 1
+                if clock:
+                    profiler.lap(profiling.RELIEF, clock)
             
             return 0, total_relief_value, starter_innings, reliever_innings_distribution, earned_runs_distribution, unearned_runs_distribution, chosen_relievers
 
         # Step 2: If no shutout, continue to determine Batting Value (BV)
         total_relief_value = 0  # Initialize total relief value to 0
-        BV = team.get_batting_value(opponent_pitcher)
-        logger.debug(f"Step 2: No Shutout, Initial Batting Value (BV) for {team.team_name}: {BV}")
+        if self.matchup_cache is not None:
+            BV = self.matchup_cache.batting_value(team, opponent_pitcher)
+        else:
+            BV = team.get_batting_value(opponent_pitcher)
+        if debug:
+            logger.debug("Step 2: No Shutout, Initial Batting Value (BV) for %s: %s", team.team_name, BV)
+        if TRACER is not None:
+            TRACER.emit(trace.BV, team.team_name, None, BV, step=2)
+        if clock:
+            clock = profiler.lap(profiling.BATTING_VALUE, clock)
 
         # Step 3: Check for complete game and handle relief pitching
         if not is_complete_game:
-            logger.debug(f"Step 3: {opponent_pitcher.name} did not complete the game. Proceeding with relief pitching.")
+            if debug:
+                logger.debug("Step 3: %s did not complete the game. Proceeding with relief pitching.", opponent_pitcher.name)
             relief_pitching = ReliefPitching(opponent_pitcher, team, dice, self)
             total_relief_value, chosen_relievers, fatigue_cache = relief_pitching.process_relief_pitching(current_day)
 
@@ -573,11 +994,19 @@ class Game:
 
             # Apply the modifier to the original BV, rather than replacing it
             BV = max(0, BV + reliever_bv_modifier)  # Ensure BV doesn't drop below 0
-            logger.debug(f"Step 3a: Adjusted Batting Value (BV) for {team.team_name}: {BV}")
+            if debug:
+                logger.debug("Step 3a: Adjusted Batting Value (BV) for %s: %s", team.team_name, BV)
 
         # Cap the BV at 135 before applying any bonuses
         if BV > 135:
             BV = 135
+        if TRACER is not None and relief_pitching is not None:
+            TRACER.emit(trace.BV, team.team_name, None, BV, step=3)
+        if profiler is not None:
+            if is_complete_game:
+                profiler.branches[profiling.COMPLETE_GAME] += 1
+            if clock:
+                clock = profiler.lap(profiling.RELIEF, clock)
 
         # Step 4: Handle triples (all dice are the same)
         if triples:
@@ -588,14 +1017,19 @@ class Game:
 
                 # Check if power_player is valid
                 if power_player and hasattr(power_player, 'name') and hasattr(power_player, 'batting'):
-                    logger.debug(f"Step 4: Power bonus for {power_player.name} with a batting value of {power_player.batting}.")
+                    if debug:
+                        logger.debug("Step 4: Power bonus for %s with a batting value of %s.", power_player.name, power_player.batting)
                     power_bonus = power_player.power * white_die  # Changed from dice_sum to white_die to reduce scoring inflation
                     power_bonus += ballpark.stadium_value  # Apply the ballpark modifier
-                    logger.debug(f"Step 4: Stadium value for {ballpark.ballpark_name}: {ballpark.stadium_value}")
-                    logger.debug(f"Step 4a: Power bonus adjusted with ballpark ({ballpark.stadium_value}) for a total of: {power_bonus}")
+                    if debug:
+                        logger.debug("Step 4: Stadium value for %s: %s", ballpark.ballpark_name, ballpark.stadium_value)
+                        logger.debug("Step 4a: Power bonus adjusted with ballpark (%s) for a total of: %s", ballpark.stadium_value, power_bonus)
                     BV += power_bonus
+                    if TRACER is not None:
+                        TRACER.emit(trace.BONUS, team.team_name, power_player.name, power_bonus, step=trace.BONUS_POWER)
                 else:
-                    logger.debug(f"Step 4: Invalid power player or missing attributes in power_player: {power_player}")
+                    if debug:
+                        logger.debug("Step 4: Invalid power player or missing attributes in power_player: %s", power_player)
                 
                 speed_bench_result = self.consult_speed_bench_chart(red_die, green_die, white_die, team)
                 
@@ -604,18 +1038,24 @@ class Game:
                     # Handle the case where it's a tuple representing the bonus type and value
                     bonus_type, bonus_value = speed_bench_result
                     BV += bonus_value * white_die  # Changed from dice_sum to white_die
-                    logger.debug(f"Step 4b: Triple: {bonus_type} bonus (+{bonus_value * white_die})")
-                    logger.debug(f"BV after speed/bench bonus: {BV}")
+                    if debug:
+                        logger.debug("Step 4b: Triple: %s bonus (+%s)", bonus_type, bonus_value * white_die)
+                        logger.debug("BV after speed/bench bonus: %s", BV)
+                    if TRACER is not None:
+                        TRACER.emit(trace.BONUS, team.team_name, bonus_type, bonus_value * white_die, step=trace.BONUS_SPEED)
                 else:
                     # Check if speed_bench_result contains a valid player object
                     if speed_bench_result and isinstance(speed_bench_result, tuple):
                         bonus_type, bonus_value = speed_bench_result
-                        logger.debug(f"Step 4b: Speed/Bench bonus for bonus type {bonus_type} with value {bonus_value}.")
+                        if debug:
+                            logger.debug("Step 4b: Speed/Bench bonus for bonus type %s with value %s.", bonus_type, bonus_value)
                         BV += bonus_value * white_die  # Changed from dice_sum to white_die
-                        logger.debug(f"Step 4b: Triple: {bonus_type} bonus (+{bonus_value * white_die})")
-                        logger.debug(f"BV after speed/bench bonus: {BV}")
+                        if debug:
+                            logger.debug("Step 4b: Triple: %s bonus (+%s)", bonus_type, bonus_value * white_die)
+                            logger.debug("BV after speed/bench bonus: %s", BV)
                     else:
-                        logger.debug(f"Step 4b: Invalid speed/bench result or missing attributes in result: {speed_bench_result}")
+                        if debug:
+                            logger.debug("Step 4b: Invalid speed/bench result or missing attributes in result: %s", speed_bench_result)
 
             else:
                 # Odd triad - Trigger injury check
@@ -624,11 +1064,21 @@ class Game:
                 if injured_player and hasattr(injured_player, 'name') and hasattr(injured_player, 'injury_days'):
                     logger.info(f"Step 4c: Injury: {injured_player.name} is injured for {injured_player.injury_days} days.")
                 else:
-                    logger.debug(f"Step 4c: Injury check failed or invalid injured_player: {injured_player}")
+                    if debug:
+                        logger.debug("Step 4c: Injury check failed or invalid injured_player: %s", injured_player)
 
         # Cap the BV at 135 after handling triples
         if BV > 135:
             BV = 135
+        if TRACER is not None and triples:
+            TRACER.emit(trace.BV, team.team_name, None, BV, step=4)
+        if profiler is not None:
+            if triples:
+                profiler.branches[profiling.TRIPLE] += 1
+                if triad % 2:
+                    profiler.branches[profiling.TRIPLE_INJURY] += 1
+            if clock:
+                clock = profiler.lap(profiling.TRIPLES, clock)
 
         # Step 5: Handle individual bat bonus if the sum of dice is greater than 10
         if dice_sum > 10:
@@ -636,31 +1086,48 @@ class Game:
             if individual_bat_player:
                 bat_bonus = individual_bat_player.batting
                 BV += bat_bonus
-                logger.debug(f"Step 5: {dice_sum} is greater than 10, applying individual bat bonus from {individual_bat_player.name}.")
-                logger.debug(f"Step 5: Individual Bat Bonus: {individual_bat_player.name} adds {bat_bonus} to the Team Bat Value: {BV}.")
+                if TRACER is not None:
+                    TRACER.emit(trace.BONUS, team.team_name, individual_bat_player.name, bat_bonus, step=trace.BONUS_BAT)
+                if debug:
+                    logger.debug("Step 5: %s is greater than 10, applying individual bat bonus from %s.", dice_sum, individual_bat_player.name)
+                    logger.debug("Step 5: Individual Bat Bonus: %s adds %s to the Team Bat Value: %s.", individual_bat_player.name, bat_bonus, BV)
 
         # Cap the BV at 135 after individual bat bonus
         if BV > 135:
             BV = 135
+        if TRACER is not None and dice_sum > 10:
+            TRACER.emit(trace.BV, team.team_name, None, BV, step=5)
+        if profiler is not None:
+            if dice_sum > 10:
+                profiler.branches[profiling.BAT_BONUS] += 1
+            if clock:
+                clock = profiler.lap(profiling.INDIVIDUAL_BAT, clock)
 
         # Step 6: Handle doubles (power/speed/bench bonuses)
         if doubles:
             # consider adding an even/odd variation like i have for triples (maybe we get the eye modifier involved?)
             if white_die == red_die or white_die == green_die:
                 power_player = self.consult_power_chart(white_die, red_die, green_die, team, ballpark)
-                logger.debug(f"Step 6: Power bonus for {power_player.name} with a batting value of {power_player.batting}.")
+                if debug:
+                    logger.debug("Step 6: Power bonus for %s with a batting value of %s.", power_player.name, power_player.batting)
 
                 if power_player:
                     power_bonus = power_player.power * white_die  # Changed from dice_sum to white_die to reduce scoring inflation
                     power_bonus += ballpark.stadium_value  # Apply the ballpark modifier
-                    logger.debug(f"Step 6: Stadium value for {ballpark.ballpark_name}: {ballpark.stadium_value}")
-                    logger.debug(f"Step 6a: Power bonus adjusted with ballpark ({ballpark.stadium_value}) for a total of: {power_bonus}")
+                    if debug:
+                        logger.debug("Step 6: Stadium value for %s: %s", ballpark.ballpark_name, ballpark.stadium_value)
+                        logger.debug("Step 6a: Power bonus adjusted with ballpark (%s) for a total of: %s", ballpark.stadium_value, power_bonus)
                     BV += power_bonus
-                    logger.debug(f"Step 6b: Doubles: Power bonus from {power_player.name} (+{power_bonus})")
-                    logger.debug(f"BV after power bonus: {BV}")
+                    if debug:
+                        logger.debug("Step 6b: Doubles: Power bonus from %s (+%s)", power_player.name, power_bonus)
+                    if TRACER is not None:
+                        TRACER.emit(trace.BONUS, team.team_name, power_player.name, power_bonus, step=trace.BONUS_POWER)
+                    if debug:
+                        logger.debug("BV after power bonus: %s", BV)
 
             if red_die == green_die:
-                logger.debug(f"Step 6c: Red and Green dice are the same (doubles): {red_die} == {green_die}")
+                if debug:
+                    logger.debug("Step 6c: Red and Green dice are the same (doubles): %s == %s", red_die, green_die)
                 speed_bench_result = self.consult_speed_bench_chart(red_die, green_die, white_die, team)
                 
                 # Step 6c: Check if we got a valid player or a tuple for the bonus
@@ -668,81 +1135,120 @@ class Game:
                     # Handle the case where it's a tuple representing the bonus type and value
                     bonus_type, bonus_value = speed_bench_result
                     BV += bonus_value * white_die  # Changed from dice_sum to white_die
-                    logger.debug(f"Step 6c: Doubles: {bonus_type} bonus (+{bonus_value * white_die})")
-                    logger.debug(f"BV after doubles bonus: {BV}")
+                    if debug:
+                        logger.debug("Step 6c: Doubles: %s bonus (+%s)", bonus_type, bonus_value * white_die)
+                        logger.debug("BV after doubles bonus: %s", BV)
+                    if TRACER is not None:
+                        TRACER.emit(trace.BONUS, team.team_name, bonus_type, bonus_value * white_die, step=trace.BONUS_SPEED)
 
                 else:
                     # Check if speed_bench_result contains a valid player object
                     if isinstance(speed_bench_result, list) and len(speed_bench_result) > 0 and hasattr(speed_bench_result[0], 'name'):
-                        logger.debug(f"Step 6c: Speed/Bench bonus for {speed_bench_result[0].name} with a batting value of {speed_bench_result[0].batting}.")
+                        if debug:
+                            logger.debug("Step 6c: Speed/Bench bonus for %s with a batting value of %s.", speed_bench_result[0].name, speed_bench_result[0].batting)
                         bonus_type, bonus_value = speed_bench_result
                         BV += bonus_value * white_die  # Changed from dice_sum to white_die
-                        logger.debug(f"Step 6c: Doubles: {bonus_type} bonus (+{bonus_value * white_die})")
-                        logger.debug(f"BV after doubles bonus: {BV}")
+                        if debug:
+                            logger.debug("Step 6c: Doubles: %s bonus (+%s)", bonus_type, bonus_value * white_die)
+                            logger.debug("BV after doubles bonus: %s", BV)
                     else:
-                        logger.debug(f"Step 6c: No valid speed/bench bonus player found or invalid data in result: {speed_bench_result}")
+                        if debug:
+                            logger.debug("Step 6c: No valid speed/bench bonus player found or invalid data in result: %s", speed_bench_result)
 
         # Cap the BV at 135 after handling doubles
         if BV > 135:
             BV = 135
+        if TRACER is not None and doubles:
+            TRACER.emit(trace.BV, team.team_name, None, BV, step=6)
+        if profiler is not None:
+            if doubles:
+                profiler.branches[profiling.DOUBLE] += 1
+            if clock:
+                clock = profiler.lap(profiling.DOUBLES, clock)
 
         # Step 7: Handle relief/defense (when dice_sum <= 10)
         if dice_sum <= 10:
-            logger.debug(f"Step 7: Dice sum is {dice_sum}, <= 10. Proceeding with defense.")
-            logger.debug(f"Step 7a: Handling defense for dice sum {dice_sum}.")
+            if debug:
+                logger.debug("Step 7: Dice sum is %s, <= 10. Proceeding with defense.", dice_sum)
+                logger.debug("Step 7a: Handling defense for dice sum %s.", dice_sum)
             
             # Get fielding adjustment from the new consult_relief_defense_chart (now only for defense)
             relief_defense_result = self.consult_relief_defense_chart(dice_sum, green_die, team)
-            logger.debug(f"Step 7b: Checking relief_defense_chart")
+            if debug:
+                logger.debug("Step 7b: Checking relief_defense_chart")
             
             fielding_value = relief_defense_result["fielding_value"]
             
             # Adjust the white die by the fielder's value
             adjusted_white_die = max(white_die + fielding_value, 1)
-            logger.debug(f"Step 7c: Fielding adjustment: White die is now {adjusted_white_die} (was {white_die}, fielding {fielding_value}).")
+            if debug:
+                logger.debug("Step 7c: Fielding adjustment: White die is now %s (was %s, fielding %s).", adjusted_white_die, white_die, fielding_value)
             
             # Calculate runs based on Batting Value (BV) and the adjusted white die
             SV = opponent_pitcher.start_value
-            logger.debug(f"Step 7: Opponent Pitcher Start Value SV: {SV}")
+            if debug:
+                logger.debug("Step 7: Opponent Pitcher Start Value SV: %s", SV)
             product = SV * adjusted_white_die
-            logger.debug(f"Step 7: Product of SV {SV} * white_die {white_die}: {product}")
+            if debug:
+                logger.debug("Step 7: Product of SV %s * white_die %s: %s", SV, white_die, product)
             if product < 6:
                 product = 6  # Ensure total defense is at least 6
             runs = BV // product
-            logger.debug(f"Step 7d: Defense handled. BV: {BV} / {product}  Runs scored: {runs}")
+            if debug:
+                logger.debug("Step 7d: Defense handled. BV: %s / %s  Runs scored: %s", BV, product, runs)
+        if profiler is not None:
+            if dice_sum <= 10:
+                profiler.branches[profiling.DEFENSE_ROLL] += 1
+            if clock:
+                clock = profiler.lap(profiling.DEFENSE, clock)
 
         # Step 8: Calculate runs based on BV and SV (earned runs calculation)
         SV = opponent_pitcher.start_value
-        logger.debug(f"Step 8: Opponent Pitcher Start Value SV: {SV}")
+        if debug:
+            logger.debug("Step 8: Opponent Pitcher Start Value SV: %s", SV)
         product = SV * white_die
-        logger.debug(f"Step 8: Product of SV {SV} * white_die {white_die}: {product}")
+        if debug:
+            logger.debug("Step 8: Product of SV %s * white_die %s: %s", SV, white_die, product)
         if product < 6:
             product = 6
         earned_runs = BV // product
-        logger.debug(f"Step 8: BV: {BV} / {product} = Earned runs scored: {earned_runs}")
+        if debug:
+            logger.debug("Step 8: BV: %s / %s = Earned runs scored: %s", BV, product, earned_runs)
+        if clock:
+            clock = profiler.lap(profiling.EARNED_RUNS, clock)
 
         # Step 9: Calculate unearned runs if sum of dice is 10 or less
         unearned_runs = 0
-        logger.debug(f"Step 9: Checking if dice_sum {dice_sum} is <= 10.")
+        if debug:
+            logger.debug("Step 9: Checking if dice_sum %s is <= 10.", dice_sum)
         if dice_sum <= 10:
-            logger.debug(f"Dice sum {dice_sum} is <= 10, fetching unearned runs.")
+            if debug:
+                logger.debug("Dice sum %s is <= 10, fetching unearned runs.", dice_sum)
             unearned_runs = team.get_unearned_runs(dice_sum)
-            logger.debug(f"Step 9: Unearned runs retrieved for dice_sum {dice_sum}: {unearned_runs}")
+            if debug:
+                logger.debug("Step 9: Unearned runs retrieved for dice_sum %s: %s", dice_sum, unearned_runs)
         else:
-            logger.debug(f"Dice sum {dice_sum} is greater than 10, no unearned runs to fetch.")
+            if debug:
+                logger.debug("Dice sum %s is greater than 10, no unearned runs to fetch.", dice_sum)
+        if clock:
+            clock = profiler.lap(profiling.UNEARNED_RUNS, clock)
 
         # Step 10: Final earned and unearned runs total and assigning runs to relievers
         total_earned_runs = earned_runs
         total_unearned_runs = unearned_runs
         total_runs = total_earned_runs + total_unearned_runs  # Maintain the total_runs value for other calculations
-        logger.debug(f"Step 10: Final earned runs: {total_earned_runs}, unearned runs: {total_unearned_runs}, total runs: {total_runs}")
+        if debug:
+            logger.debug("Step 10: Final earned runs: %s, unearned runs: %s, total runs: %s", total_earned_runs, total_unearned_runs, total_runs)
 
         # Step 10a: Calculate runs assigned to the starter
         starter_earned_runs, starter_unearned_runs, starter_innings = self.calculate_runs_for_starter(total_earned_runs, total_unearned_runs, opponent_pitcher, relief_pitching, current_day)
+        if TRACER is not None:
+            TRACER.emit(trace.RUNS, team.team_name, None, total_earned_runs, total_unearned_runs, starter_innings)
 
         # If the starter's innings were reduced, recalculate the bullpen innings and get the distribution
         if starter_innings < 9.0 and relief_pitching is not None:
-            logger.debug("Starter innings were reduced, recalculating relief innings.")
+            if debug:
+                logger.debug("Starter innings were reduced, recalculating relief innings.")
             reliever_innings_distribution = self.recalculate_relief_innings(starter_innings, relief_pitching, current_day)
         else:
             reliever_innings_distribution = {}
@@ -757,8 +1263,11 @@ class Game:
             earned_runs_distribution, unearned_runs_distribution = relief_pitching.distribute_runs_among_relievers(
                 chosen_relievers, remaining_earned_runs, remaining_unearned_runs, current_day, fatigue_cache
             )
-            logger.debug(f"Step 10: Distributed earned runs among relievers: {earned_runs_distribution}")
-            logger.debug(f"Step 10: Distributed unearned runs among relievers: {unearned_runs_distribution}")
+            if debug:
+                logger.debug("Step 10: Distributed earned runs among relievers: %s", earned_runs_distribution)
+                logger.debug("Step 10: Distributed unearned runs among relievers: %s", unearned_runs_distribution)
+        if clock:
+            profiler.lap(profiling.STARTER_SPLIT, clock)
 
         # Return the total runs as before, since other calculations might still rely on total runs
         return total_runs, total_relief_value, starter_innings, reliever_innings_distribution, earned_runs_distribution, unearned_runs_distribution, chosen_relievers
@@ -767,18 +1276,19 @@ class Game:
         """
         Return available relievers for extra innings, excluding those who have already pitched.
         """
+        debug = logger.isEnabledFor(logging.DEBUG)
         used_relievers = self.used_relievers_home if team == self.home_team else self.used_relievers_away
-        available_relievers = [
-            p for p in team.pitchers
-            if p.type in ('RP', 'Reliever') and p not in used_relievers
-        ]
+        available_relievers = team.bullpen.available(used_relievers)
         
-        logger.debug(f"Available relievers for {team.team_name} (excluding those already used): {[p.name for p in available_relievers]}")
+        if debug:
+            logger.debug("Available relievers for %s (excluding those already used): %s", team.team_name, [p.name for p in available_relievers])
         
         return available_relievers
 
     def handle_extra_innings(self):
-        logger.debug("Game tied, proceeding to extra innings...")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Game tied, proceeding to extra innings...")
 
         # Roll the dice for both teams
         visiting_red_die, visiting_green_die = self.dice.roll(), self.dice.roll()
@@ -788,68 +1298,82 @@ class Game:
         visiting_two_digit = int(f"{visiting_red_die}{visiting_green_die}")
         home_two_digit = int(f"{home_red_die}{home_green_die}")
 
-        logger.debug(f"Visiting team's two-digit number: {visiting_two_digit}")
-        logger.debug(f"Home team's two-digit number: {home_two_digit}")
+        if debug:
+            logger.debug("Visiting team's two-digit number: %s", visiting_two_digit)
+            logger.debug("Home team's two-digit number: %s", home_two_digit)
 
         # Select batters for extra innings
         visiting_batter = self.away_team.get_batter_for_extra_innings(visiting_two_digit)
         home_batter = self.home_team.get_batter_for_extra_innings(home_two_digit)
 
-        logger.debug(f"Visiting team's selected batter: {visiting_batter.name}, Batting: {visiting_batter.batting}, Clutch: {visiting_batter.clutch}")
-        logger.debug(f"Home team's selected batter: {home_batter.name}, Batting: {home_batter.batting}, Clutch: {home_batter.clutch}")
+        if debug:
+            logger.debug("Visiting team's selected batter: %s, Batting: %s, Clutch: %s", visiting_batter.name, visiting_batter.batting, visiting_batter.clutch)
+            logger.debug("Home team's selected batter: %s, Batting: %s, Clutch: %s", home_batter.name, home_batter.batting, home_batter.clutch)
 
-        # Get available relievers for extra innings (excluding those already used)
-        available_relievers_away = self.get_available_relievers_for_extras(self.away_team, self.used_relievers_away)
-        available_relievers_home = self.get_available_relievers_for_extras(self.home_team, self.used_relievers_home)
+        # Best available relievers for extra innings (excluding those already used)
+        best_reliever_away = self.away_team.bullpen.best_available(self.used_relievers_away)
+        best_reliever_home = self.home_team.bullpen.best_available(self.used_relievers_home)
 
         # Handle away team relievers
-        if not available_relievers_away:
+        if best_reliever_away is None:
             last_used_away = self.away_team.get_last_used_reliever(self.used_relievers_away)
             if last_used_away:
                 # Apply fatigue penalty and clutch rating to relief value
                 visiting_reliever_value = max(last_used_away.relief_value - self.calculate_fatigue_penalty(last_used_away) + last_used_away.clutch, 0)
-                logger.debug(f"Using last used away reliever: {last_used_away.name} with penalty-adjusted relief value: {visiting_reliever_value} (Clutch: {last_used_away.clutch})")
+                if debug:
+                    logger.debug("Using last used away reliever: %s with penalty-adjusted relief value: %s (Clutch: %s)", last_used_away.name, visiting_reliever_value, last_used_away.clutch)
             else:
-                logger.debug("No relievers available, visiting reliever value defaults to 0")
+                if debug:
+                    logger.debug("No relievers available, visiting reliever value defaults to 0")
                 visiting_reliever_value = 0
         else:
             # Get best reliever value and adjust with clutch
-            best_reliever_away = max(available_relievers_away, key=lambda r: r.relief_value)
             visiting_reliever_value = best_reliever_away.relief_value + best_reliever_away.clutch
-            logger.debug(f"Visiting team's best reliever: {best_reliever_away.name}, Relief Value: {best_reliever_away.relief_value}, Clutch: 1{best_reliever_away.clutch}")
+            if debug:
+                logger.debug("Visiting team's best reliever: %s, Relief Value: %s, Clutch: 1%s", best_reliever_away.name, best_reliever_away.relief_value, best_reliever_away.clutch)
         
         # Handle home team relievers
-        if not available_relievers_home:
+        if best_reliever_home is None:
             last_used_home = self.home_team.get_last_used_reliever(self.used_relievers_home)
             if last_used_home:
                 # Apply fatigue penalty and clutch rating to relief value
                 home_reliever_value = max(last_used_home.relief_value - self.calculate_fatigue_penalty(last_used_home) + last_used_home.clutch, 0)
-                logger.debug(f"Using last used home reliever: {last_used_home.name} with penalty-adjusted relief value: {home_reliever_value} (Clutch: {last_used_home.clutch})")
+                if debug:
+                    logger.debug("Using last used home reliever: %s with penalty-adjusted relief value: %s (Clutch: %s)", last_used_home.name, home_reliever_value, last_used_home.clutch)
             else:
-                logger.debug("No relievers available, home reliever value defaults to 0")
+                if debug:
+                    logger.debug("No relievers available, home reliever value defaults to 0")
                 home_reliever_value = 0
         else:
             # Get best reliever value and adjust with clutch
-            best_reliever_home = max(available_relievers_home, key=lambda r: r.relief_value)
             home_reliever_value = best_reliever_home.relief_value + best_reliever_home.clutch
-            logger.debug(f"Home team's best reliever: {best_reliever_home.name}, Relief Value: {best_reliever_home.relief_value}, Clutch: {best_reliever_home.clutch}")
+            if debug:
+                logger.debug("Home team's best reliever: %s, Relief Value: %s, Clutch: %s", best_reliever_home.name, best_reliever_home.relief_value, best_reliever_home.clutch)
 
-        logger.debug(f"Visiting team's best reliever value (after clutch): {visiting_reliever_value}")
-        logger.debug(f"Home team's best reliever value (after clutch): {home_reliever_value}")
+        if debug:
+            logger.debug("Visiting team's best reliever value (after clutch): %s", visiting_reliever_value)
+            logger.debug("Home team's best reliever value (after clutch): %s", home_reliever_value)
 
         # Calculate extra-inning values
         visiting_special_value = visiting_batter.batting + visiting_batter.clutch - home_reliever_value
         home_special_value = home_batter.batting + home_batter.clutch - visiting_reliever_value
 
-        logger.debug(f"Visiting team's special value: {visiting_special_value}")
-        logger.debug(f"Home team's special value: {home_special_value}")
+        if debug:
+            logger.debug("Visiting team's special value: %s", visiting_special_value)
+            logger.debug("Home team's special value: %s", home_special_value)
+
+        if TRACER is not None:
+            outcome = 0 if visiting_special_value > home_special_value else 1 if home_special_value > visiting_special_value else 2
+            TRACER.emit(trace.EXTRAS, None, None, visiting_special_value, home_special_value, step=outcome)
 
         # Determine the winner based on special values
         if visiting_special_value > home_special_value:
-            logger.debug(f"Visiting team wins in extra innings!")
+            if debug:
+                logger.debug("Visiting team wins in extra innings!")
             return 'visiting'
         elif home_special_value > visiting_special_value:
-            logger.debug(f"Home team wins in extra innings!")
+            if debug:
+                logger.debug("Home team wins in extra innings!")
             return 'home'
         else:
             return self.break_tie_in_extra_innings()
@@ -869,8 +1393,10 @@ class Game:
             return 4  # Lose 4 relief value points
 
     def break_tie_in_extra_innings(self):
+        debug = logger.isEnabledFor(logging.DEBUG)
         # If the special values are tied, we resolve using the green, red, and white dice in that order
-        logger.debug("Extra innings are still tied, resolving with dice BV additions...")
+        if debug:
+            logger.debug("Extra innings are still tied, resolving with dice BV additions...")
 
         # Add green die to each team’s BV and compare
         green_die = self.dice.roll()
@@ -881,14 +1407,17 @@ class Game:
         # Home team BV gets the green die value plus home field advantage
         home_bv = green_die + self.home_team.home_field_advantage
 
-        logger.debug(f"Visiting team BV + green die: {visiting_bv}")
-        logger.debug(f"Home team BV + green die + home field advantage: {home_bv}")
+        if debug:
+            logger.debug("Visiting team BV + green die: %s", visiting_bv)
+            logger.debug("Home team BV + green die + home field advantage: %s", home_bv)
 
         if visiting_bv > home_bv:
-            logger.debug(f"Visiting team wins by green die adjustment!")
+            if debug:
+                logger.debug("Visiting team wins by green die adjustment!")
             return 'visiting'
         elif home_bv > visiting_bv:
-            logger.debug(f"Home team wins by green die and home field advantage!")
+            if debug:
+                logger.debug("Home team wins by green die and home field advantage!")
             return 'home'
         else:
             # If still tied, add red die
@@ -896,14 +1425,17 @@ class Game:
             visiting_bv += red_die
             home_bv += red_die
 
-            logger.debug(f"Visiting team BV + red die: {visiting_bv}")
-            logger.debug(f"Home team BV + red die: {home_bv}")
+            if debug:
+                logger.debug("Visiting team BV + red die: %s", visiting_bv)
+                logger.debug("Home team BV + red die: %s", home_bv)
 
             if visiting_bv > home_bv:
-                logger.debug(f"Visiting team wins by red die adjustment!")
+                if debug:
+                    logger.debug("Visiting team wins by red die adjustment!")
                 return 'visiting'
             elif home_bv > visiting_bv:
-                logger.debug(f"Home team wins by red die adjustment!")
+                if debug:
+                    logger.debug("Home team wins by red die adjustment!")
                 return 'home'
             else:
                 # If still tied, add white die
@@ -911,20 +1443,25 @@ class Game:
                 visiting_bv += white_die
                 home_bv += white_die
 
-                logger.debug(f"Visiting team BV + white die: {visiting_bv}")
-                logger.debug(f"Home team BV + white die: {home_bv}")
+                if debug:
+                    logger.debug("Visiting team BV + white die: %s", visiting_bv)
+                    logger.debug("Home team BV + white die: %s", home_bv)
 
                 if visiting_bv > home_bv:
-                    logger.debug(f"Visiting team wins by white die adjustment!")
+                    if debug:
+                        logger.debug("Visiting team wins by white die adjustment!")
                     return 'visiting'
                 else:
-                    logger.debug(f"Home team wins by white die adjustment!")
+                    if debug:
+                        logger.debug("Home team wins by white die adjustment!")
                     return 'home'
 
     def get_best_relief_value(self, team):
+        debug = logger.isEnabledFor(logging.DEBUG)
         # Find the best reliever who hasn’t been used yet
         available_relievers = [p for p in team.pitchers if p.relief_value is not None]
-        logger.debug(f"Available relievers for {team.team_name}: {[p.name for p in available_relievers]}")
+        if debug:
+            logger.debug("Available relievers for %s: %s", team.team_name, [p.name for p in available_relievers])
         if available_relievers:
             best_relief_value = max(available_relievers, key=lambda p: p.relief_value).relief_value
             return best_relief_value
@@ -1045,6 +1582,7 @@ class Game:
         """
         Determine if a reliever is eligible for a save and award it if appropriate.
         """
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         # 1. Check if the game went into extra innings; if so, no save is possible.
         if is_extra_innings:
@@ -1061,29 +1599,34 @@ class Game:
 
         # 2. Only consider relievers from the winning team
         team_relievers = chosen_relievers
-        logger.debug(f"Winning Team: {winning_team}")
-        logger.debug(f"Chosen Relievers: {chosen_relievers}")
-        logger.debug(f"Team Relievers: {team_relievers}")
+        if debug:
+            logger.debug("Winning Team: %s", winning_team)
+            logger.debug("Chosen Relievers: %s", chosen_relievers)
+            logger.debug("Team Relievers: %s", team_relievers)
 
         # 2a. If no relievers were used (complete game), no save possible
         if team_relievers is None or len(team_relievers) == 0:
-            logger.debug("No relievers used in this game, no save possible.")
+            if debug:
+                logger.debug("No relievers used in this game, no save possible.")
             return None
 
         # 3. Remove the reliever who got the win from consideration for the save
         eligible_relievers = [reliever for reliever in team_relievers if reliever != winning_reliever]
-        logger.debug(f"Eligible Relievers: {eligible_relievers}")
+        if debug:
+            logger.debug("Eligible Relievers: %s", eligible_relievers)
 
         # 4. Check if any relievers pitched at least 3 innings (automatic save qualification)
         long_relievers = [
             reliever for reliever in eligible_relievers 
             if float(reliever_innings_distribution.get(reliever.name, "0.0")) >= 3
         ]
-        logger.debug(f"Long Relievers: {long_relievers}")
+        if debug:
+            logger.debug("Long Relievers: %s", long_relievers)
 
         # 5. Check if there are eligible relievers remaining
         if not eligible_relievers:
-            logger.debug("No eligible relievers for the save.")
+            if debug:
+                logger.debug("No eligible relievers for the save.")
             return None  # No relievers available, so no save can be awarded
 
         # 5. If a reliever pitched 3 or more innings, they get the save
@@ -1095,13 +1638,16 @@ class Game:
 
         # 5. Award the save to the best reliever
         # best_reliever.award_save()
-        logger.debug(f"Save awarded to {best_reliever.name}")
+        if debug:
+            logger.debug("Save awarded to %s", best_reliever.name)
         return best_reliever
 
     def play_game(self, current_day):
+        debug = logger.isEnabledFor(logging.DEBUG)
         # Ensure self.day (current_day) is not None
         if self.day is None:
-            logger.debug(f"Warning: Game day (self.day) is None. Defaulting to day 0.")
+            if debug:
+                logger.debug("Warning: Game day (self.day) is None. Defaulting to day 0.")
             self.day = 0
 
         # Step 1: Initialize used relievers lists
@@ -1123,6 +1669,8 @@ class Game:
         self.result['home_pitcher_throws'] = home_pitcher.throws
         self.result['away_starter_name'] = away_pitcher.name
         self.result['home_starter_name'] = home_pitcher.name
+        if TRACER is not None:
+            TRACER.begin_game(self.day, self.home_team.team_name, self.away_team.team_name, home_pitcher.name, away_pitcher.name)
 
         # Step 3: Resolve runs for visiting team and store runs and reliever stats
         away_runs, away_total_relief_value, away_starter_innings, away_reliever_innings_distribution, away_earned_runs_distribution, away_unearned_runs_distribution, away_chosen_relievers = self.resolve_team_runs(
@@ -1149,6 +1697,11 @@ class Game:
         # Step 5: Check if it's a one-run game
         self.result['is_one_run'] = abs(home_runs - away_runs) == 1
 
+        if PROFILER is not None:
+            PROFILER.games += 1
+            if home_runs == away_runs:
+                PROFILER.branches[profiling.EXTRA_INNINGS] += 1
+
         # Step 6: If tied at the end, proceed to extra innings
         if home_runs == away_runs:
             self.result['is_extra_innings'] = True
@@ -1166,13 +1719,15 @@ class Game:
             chosen_relievers = self.result['home_chosen_relievers']
             starter_innings = self.result['home_starter_innings']
             reliever_innings_distribution = self.result['home_reliever_innings_distribution']
-            logger.debug(f"Winning team (home): {winning_team.team_name}")
+            if debug:
+                logger.debug("Winning team (home): %s", winning_team.team_name)
         else:
             winning_team = self.away_team
             chosen_relievers = self.result['away_chosen_relievers']
             starter_innings = self.result['away_starter_innings']
             reliever_innings_distribution = self.result['away_reliever_innings_distribution']
-            logger.debug(f"Winning team (away): {winning_team.team_name}")
+            if debug:
+                logger.debug("Winning team (away): %s", winning_team.team_name)
 
         # Log final game result
         logger.info(f"Game Day {self.day}: {self.away_team.team_name} {self.result['away_runs']} - "
@@ -1221,15 +1776,69 @@ class Game:
         home_pitcher.last_start_day = current_day
         away_pitcher.last_start_day = current_day
 
+        if TRACER is not None:
+            TRACER.emit(trace.GAME_END, None, None, self.result['home_runs'], self.result['away_runs'],
+                        step=int(self.result['is_extra_innings']))
         return self.result
 
+class BattingValueTable:
+    """
+    Per-player batting values for a team's starting lineup, split by the opposing
+    pitcher's hand, so a game-time Batting Value is a few array operations instead
+    of a pass over the roster.
+
+    For a pitcher throwing `hand`, each starter contributes
+        max(0, base + batter_splits[hand] - pitcher_weights @ (splits_L, splits_R))
+    where base = batting * 0.6 + eye * 0.3 + power * 0.15, and pitcher_weights picks
+    the pitcher split matching the batter's side (switch hitters get neither).
+    Values are summed in lineup order, so results match the old per-player loop exactly.
+    """
+
+    HANDS = ('L', 'R')
+
+    def __init__(self, players):
+        starters = [p for p in players if p.role == 'Starter']  # Assuming only starters contribute to batting value
+        self.size = len(starters)
+        # Reduced weights target ~3-4 BV per player (27-36 team BV) -> 4-6 runs
+        self.base = (roster_ratings(starters, 'batting') * 0.6) + (roster_ratings(starters, 'eye') * 0.3) + (roster_ratings(starters, 'power') * 0.15)
+        # Switch hitters (and unknown sides) get no handedness adjustment
+        sided = np.array([p.bats in self.HANDS for p in starters], dtype=bool)
+        self.batter_splits = {
+            hand: np.where(sided, roster_ratings(starters, f'splits_{hand}'), 0.0)
+            for hand in self.HANDS
+        }
+        self.pitcher_weights = np.array([[p.bats == 'L', p.bats == 'R'] for p in starters], dtype=np.float64).reshape(self.size, 2)
+        self.values = {}  # (throws, splits_L, splits_R) -> team batting value
+
+    def player_values(self, throws, splits_L, splits_R):
+        """Each starter's clamped batting value against a pitcher with this hand and splits."""
+        if throws not in self.HANDS:
+            return np.maximum(0, self.base + 0)
+        modifier = self.batter_splits[throws] - self.pitcher_weights @ np.array([splits_L, splits_R], dtype=np.float64)
+        return np.maximum(0, self.base + modifier)
+
+    def value(self, opponent_pitcher):
+        """Team Batting Value against one opposing pitcher (memoized on hand and splits)."""
+        key = (opponent_pitcher.throws, opponent_pitcher.splits_L, opponent_pitcher.splits_R)
+        value = self.values.get(key)
+        if value is None:
+            value = sum(self.player_values(*key).tolist())
+            self.values[key] = value
+        return value
+
+
 class Team:
+    __slots__ = ('team_id', 'team_name', '_pitchers', '_players', 'current_rotation_index', 'transactions',
+                 'injuries', 'stadium_value', 'home_field_advantage', 'weather_value', 'minors', 'budget',
+                 'current_day', 'unearned_runs_chart', 'ballpark', '_bullpen', '_position_slots',
+                 'fielding_lookup', '_batting_table')
+
     def __init__(self, team_id, team_name, pitchers, players, unearned_runs_chart=None, stadium_value=0, home_field_advantage=0, weather_value=0, minors=0, budget=0, ballpark_name="", ballpark_capacity=0, ballpark_weather=""):
         self.team_id = team_id
         self.team_name = team_name
-        self.pitchers = pitchers if pitchers else []
+        self.pitchers = pitchers if pitchers else []  # Setting pitchers rebuilds the bullpen on next use
         self.current_rotation_index = 0  # Track the current pitcher in the rotation  
-        self.players = players if players else []
+        self.players = players if players else []  # Setting players marks the lineup changed
         self.transactions = []
         self.injuries = []
         self.stadium_value = stadium_value  # Used in Park Effects
@@ -1244,6 +1853,74 @@ class Team:
         # Instantiate Ballpark object for the team
         self.ballpark = Ballpark(ballpark_name, ballpark_capacity, ballpark_weather, stadium_value)
 
+    @property
+    def pitchers(self):
+        return self._pitchers
+
+    @pitchers.setter
+    def pitchers(self, pitchers):
+        self._pitchers = pitchers
+        self.mark_bullpen_changed()
+
+    @property
+    def bullpen(self):
+        """Bullpen priority structure over this team's relievers, built on first use."""
+        if self._bullpen is None:
+            self._bullpen = Bullpen(self._pitchers)
+        return self._bullpen
+
+    def mark_bullpen_changed(self):
+        """Rebuild the bullpen on next use (staff changes, or rest state restored from outside the game loop)."""
+        self._bullpen = None
+
+    @property
+    def players(self):
+        return self._players
+
+    @players.setter
+    def players(self, players):
+        self._players = players
+        self.mark_lineup_changed()
+
+    def mark_lineup_changed(self):
+        """
+        Drop the position index and fielding lookup after a lineup change, substitution
+        or injury; they are rebuilt on the next lookup. In-place edits to self.players
+        (swapping a spot, changing a position) must call this too.
+        """
+        self._position_slots = None
+        self.fielding_lookup = None
+        self._batting_table = None
+
+    def rebuild_position_index(self):
+        """
+        Map each fielding position to the roster index of the first player listed
+        there (the same player the old roster scan found), and keep every roster
+        spot's fielding rating in a list indexed by slot.
+        """
+        position_slots = {}
+        for slot, player in enumerate(self._players):
+            position_slots.setdefault(player.position, slot)
+        self.fielding_lookup = [player.fielding for player in self._players]
+        self._position_slots = position_slots
+
+    @property
+    def batting_table(self):
+        """BattingValueTable for the current lineup, built on first use after a lineup change."""
+        if self._batting_table is None:
+            self._batting_table = BattingValueTable(self._players)
+        return self._batting_table
+
+    def position_slot(self, position):
+        """Roster index of the player at a fielding position, or -1 if nobody plays it."""
+        if self._position_slots is None:
+            self.rebuild_position_index()
+        return self._position_slots.get(position, -1)
+
+    def missing_positions(self, positions):
+        """The given fielding positions that no one on the roster is listed at."""
+        return [position for position in positions if self.position_slot(position) < 0]
+
     def get_avg_bv(self):
         """Calculate average BV for the starting lineup (batting + eye + power*0.4)."""
         starters = [p for p in self.players if p.role == 'Starter'][:9]
@@ -1278,29 +1955,32 @@ class Team:
         with open(file_path, 'w') as file:
             json.dump({
                 'team_name': self.team_name,
-                'players': [p.__dict__ for p in self.players],
-                'pitchers': [p.__dict__ for p in self.pitchers],
+                'players': [p.to_dict() for p in self.players],
+                'pitchers': [p.to_dict() for p in self.pitchers],
                 'transactions': self.transactions,
-                'injuries': self.injuries
+                'injuries': self.injuries,
+                'current_rotation_index': self.current_rotation_index
             }, file, indent=4)
     
-    def load_team_data(self, file_path):
-        """Load the team's data from a JSON file."""
+    def load_team_data(self, file_path, roster=None):
+        """Load the team's data from a JSON file (players go into `roster`, or the default RosterStore)."""
         with open(file_path, 'r') as file:
             data = json.load(file)
 
         # Set other team attributes
         self.team_name = data['team_name']
-        self.pitchers = [Pitcher(**p) for p in data['pitchers']]
-        self.players = [Player(**p) for p in data['players']]
+        self.pitchers = [Pitcher.from_dict(p, roster) for p in data['pitchers']]
+        self.players = [Player.from_dict(p, roster) for p in data['players']]
         self.transactions = data.get('transactions', [])
         self.injuries = data.get('injuries', [])
+        self.current_rotation_index = data.get('current_rotation_index', 0)
 
         # Explicitly set unearned_runs_chart
         self.unearned_runs_chart = data.get('unearned_runs_chart', {str(i): 0 for i in range(3, 11)})
         logger.debug(f"Loaded unearned_runs_chart: {self.unearned_runs_chart}")
 
     def select_starting_pitcher(self, current_day):
+        debug = logger.isEnabledFor(logging.DEBUG)
         # Ensure rotation index is constrained to starters only (1-5)
         num_starters = min(5, len(self.pitchers))  # In case a team has less than 5 starters
         
@@ -1308,14 +1988,16 @@ class Team:
         selected_pitcher = self.pitchers[self.current_rotation_index % num_starters]
         
         # Log the selected pitcher's details for debugging
-        logger.debug(f"Checking pitcher: {selected_pitcher.name} for team {self.team_name}")
-        logger.debug(f"current_day: {current_day}, last_start_day: {selected_pitcher.last_start_day}, rest: {selected_pitcher.rest}, start_value: {selected_pitcher.start_value}, endurance: {selected_pitcher.endurance}")
+        if debug:
+            logger.debug("Checking pitcher: %s for team %s", selected_pitcher.name, self.team_name)
+            logger.debug("current_day: %s, last_start_day: %s, rest: %s, start_value: %s, endurance: %s", current_day, selected_pitcher.last_start_day, selected_pitcher.rest, selected_pitcher.start_value, selected_pitcher.endurance)
         
         # Update the rotation index (1-5 loop only)
         self.current_rotation_index = (self.current_rotation_index + 1) % num_starters
         
-        logger.debug(f"{self.current_rotation_index} is the current rotation index")
-        logger.debug(f"Selected starter: {selected_pitcher.name} for team {self.team_name}")
+        if debug:
+            logger.debug("%s is the current rotation index", self.current_rotation_index)
+            logger.debug("Selected starter: %s for team %s", selected_pitcher.name, self.team_name)
         
         return selected_pitcher
 
@@ -1331,79 +2013,37 @@ class Team:
             return None
 
     def get_available_relievers(self, current_day):
+        debug = logger.isEnabledFor(logging.DEBUG)
         available_relievers = []
-        for pitcher in self.pitchers:
-            if pitcher.type in ('RP', 'Reliever'):  # Only look at relievers
-                logger.debug(f"Checking reliever: {pitcher.name}")
-                logger.debug(f"current_day: {current_day}, last_relief_day: {pitcher.last_relief_day}, fatigue: {pitcher.fatigue}, relief_value: {pitcher.relief_value}")
-                
-                # Initialize last_relief_day if it's None
-                if pitcher.last_relief_day is None:
-                    pitcher.last_relief_day = 0  # Default to 0 if uninitialized
-                    logger.debug(f"Reliever {pitcher.name} had an uninitialized last_relief_day. Set to 0.")
-                
-                # Check if reliever is available based on custom logic, e.g., not used for 3 consecutive days
-                days_since_last_relief = current_day - pitcher.last_relief_day
-                if days_since_last_relief > 0:  # Customize this condition as needed
-                    available_relievers.append(pitcher)
+        for pitcher in self.bullpen.relievers:  # Only look at relievers
+            if debug:
+                logger.debug("Checking reliever: %s", pitcher.name)
+                logger.debug("current_day: %s, last_relief_day: %s, fatigue: %s, relief_value: %s", current_day, pitcher.last_relief_day, pitcher.fatigue, pitcher.relief_value)
+
+            # Initialize last_relief_day if it's None
+            if pitcher.last_relief_day is None:
+                pitcher.last_relief_day = 0  # Default to 0 if uninitialized
+                if debug:
+                    logger.debug("Reliever %s had an uninitialized last_relief_day. Set to 0.", pitcher.name)
+
+            # Check if reliever is available based on custom logic, e.g., not used for 3 consecutive days
+            days_since_last_relief = current_day - pitcher.last_relief_day
+            if days_since_last_relief > 0:  # Customize this condition as needed
+                available_relievers.append(pitcher)
 
         if not available_relievers:
-            logger.debug(f"No rested relievers for team {self.team_name} on day {current_day}.")
+            if debug:
+                logger.debug("No rested relievers for team %s on day %s.", self.team_name, current_day)
         return available_relievers
 
     def get_batting_value(self, opponent_pitcher):
         """
         Calculate the team's batting value dynamically based on the handedness of the opponent pitcher.
-        For each player: Batting Value = batting + eye (+ player-specific handedness modifier)
+        For each starter: batting * 0.6 + eye * 0.3 + power * 0.15, plus the batter's split against
+        the pitcher's hand minus the pitcher's split against the batter's side, floored at 0.
+        Served from batting_table, which is rebuilt after lineup changes and injuries.
         """
-        total_batting_value = 0
-        
-        for player in self.players:
-            if player.role == 'Starter':  # Assuming only starters contribute to batting value
-                # Calculate base batting value with reduced weights to target ~4.5 runs/team/game
-                # Old formula produced ~6-10 BV per player (50-70 team BV) → 8-11 runs
-                # New formula targets ~3-4 BV per player (27-36 team BV) → 4-6 runs
-                player_bv = (player.batting * 0.6) + (player.eye * 0.3) + (player.power * 0.15)
-
-                # Initialize default modifiers
-                batter_modifier = 0
-                pitcher_modifier = 0
-
-                logger.debug(f"Line 1217 Opponent pitcher {opponent_pitcher.name} splits_L: {opponent_pitcher.splits_L}, splits_R: {opponent_pitcher.splits_R}")
-
-                # Check handedness and apply split ratings based on the opponent pitcher
-                if opponent_pitcher.throws == 'L':  # Facing a left-handed pitcher
-                    if player.bats == 'L':
-                        batter_modifier = player.splits_L  # Player's rating against left-handed pitchers
-                        pitcher_modifier = opponent_pitcher.splits_L
-                    elif player.bats == 'R':
-                        batter_modifier = player.splits_L  # Player's rating against right-handed pitchers
-                        pitcher_modifier = opponent_pitcher.splits_R
-                    elif player.bats == 'S':
-                        batter_modifier = 0  # Switch hitter gets no handedness adjustment
-                        pitcher_modifier = 0
-                elif opponent_pitcher.throws == 'R':  # Facing a right-handed pitcher
-                    if player.bats == 'L':
-                        batter_modifier = player.splits_R  # Player's rating against right-handed pitchers
-                        pitcher_modifier = opponent_pitcher.splits_L
-                    elif player.bats == 'R':
-                        batter_modifier = player.splits_R  # Player's rating against left-handed pitchers
-                        pitcher_modifier = opponent_pitcher.splits_R
-                    elif player.bats == 'S':
-                        batter_modifier = 0  # Switch hitter gets no handedness adjustment
-                        pitcher_modifier = 0
-
-                # Adjust player batting value by batter's split and pitcher's split modifier
-                player_bv += batter_modifier - pitcher_modifier
-                logger.debug(f"LINE 1239 Player {player.name} batting value: {player_bv}, Batter Modifier: {batter_modifier}, Pitcher Modifier: {pitcher_modifier}")
-
-                # Clamp player_bv to a minimum of 0
-                player_bv = max(0, player_bv)
-
-                # Add player's final BV to the total batting value
-                total_batting_value += player_bv
-
-        return total_batting_value
+        return self.batting_table.value(opponent_pitcher)
 
     def get_lineup_position(self, dice_number):
         """Return the lineup position based on the two-digit dice roll."""
@@ -1436,25 +2076,268 @@ class Team:
         return self.players[lineup_position - 1]  # assuming lineup positions are 1-based
 
     def get_unearned_runs(self, dice_sum):
+        debug = logger.isEnabledFor(logging.DEBUG)
         # Log the dice_sum and the current unearned_runs_chart
-        logger.debug(f"get_unearned_runs called with dice_sum: {dice_sum}")
-        logger.debug(f"Current unearned_runs_chart for {self.team_name}: {self.unearned_runs_chart}")
+        if debug:
+            logger.debug("get_unearned_runs called with dice_sum: %s", dice_sum)
+            logger.debug("Current unearned_runs_chart for %s: %s", self.team_name, self.unearned_runs_chart)
         
         # Ensure dice_sum is within the expected range
         if not (3 <= dice_sum <= 10):
-            logger.debug(f"Warning: dice_sum {dice_sum} is outside the valid range (3-10). Returning 0.")
+            if debug:
+                logger.debug("Warning: dice_sum %s is outside the valid range (3-10). Returning 0.", dice_sum)
             return 0
 
         # Convert dice_sum to string for lookup and perform lookup in the chart
         unearned_runs = self.unearned_runs_chart.get(str(dice_sum), 0)
 
         # Log the result of the lookup
-        logger.debug(f"Unearned runs for dice_sum {dice_sum}: {unearned_runs}")
+        if debug:
+            logger.debug("Unearned runs for dice_sum %s: %s", dice_sum, unearned_runs)
         
         return unearned_runs
 
+NO_DAY = np.iinfo(np.int64).min  # last_start_day / last_relief_day of None in a roster column
+
+
+class RosterTable:
+    """
+    Column storage for one kind of roster object: a float64 array per rating and an
+    int64 array per day field, one row per Player or Pitcher. Rows are appended as
+    objects are created and never reused; the arrays double when full.
+    """
+
+    def __init__(self, ratings, days=(), capacity=64):
+        self.ratings = tuple(ratings)
+        self.days = tuple(days)
+        self.count = 0
+        self.columns = {name: np.zeros(capacity, dtype=np.float64) for name in self.ratings}
+        self.columns.update({name: np.full(capacity, NO_DAY, dtype=np.int64) for name in self.days})
+        self._shared = None  # column name -> SharedMemory while shared
+
+    @property
+    def capacity(self):
+        return len(next(iter(self.columns.values())))
+
+    def add(self):
+        """Reserve the next row and return its index."""
+        if self.count == self.capacity:
+            for name, column in self.columns.items():
+                grown = np.full(max(16, self.count * 2), NO_DAY if name in self.days else 0, dtype=column.dtype)
+                grown[:self.count] = column[:self.count]
+                self.columns[name] = grown
+        row = self.count
+        self.count += 1
+        return row
+
+    @classmethod
+    def from_columns(cls, ratings, days, columns, count):
+        """A table over existing column arrays (e.g. read from a league bundle), `count` rows in use."""
+        table = cls.__new__(cls)
+        table.ratings = tuple(ratings)
+        table.days = tuple(days)
+        table.count = count
+        table.columns = dict(columns)
+        table._shared = None
+        return table
+
+    def column(self, name):
+        """The live array of one rating or day field, trimmed to the rows in use."""
+        return self.columns[name][:self.count]
+
+    def share(self):
+        """Move the columns into shared memory; pickling then sends block names instead of data."""
+        if self._shared is not None:
+            return
+        from multiprocessing import shared_memory
+        self._shared = {}
+        for name, column in self.columns.items():
+            size = max(1, self.count) * column.itemsize
+            block = shared_memory.SharedMemory(create=True, size=size)
+            shared = np.ndarray(max(1, self.count), dtype=column.dtype, buffer=block.buf)
+            shared[:self.count] = column[:self.count]
+            self.columns[name] = shared
+            self._shared[name] = block
+
+    def unshare(self, unlink=True):
+        """Copy the columns back to private memory and release the shared blocks."""
+        if self._shared is None:
+            return
+        self.columns = {name: column.copy() for name, column in self.columns.items()}
+        for block in self._shared.values():
+            block.close()
+            if unlink:
+                block.unlink()
+        self._shared = None
+
+    def __getstate__(self):
+        state = {'ratings': self.ratings, 'days': self.days, 'count': self.count}
+        if self._shared is not None:
+            state['shared'] = {name: (block.name, self.columns[name].dtype.str, len(self.columns[name]))
+                               for name, block in self._shared.items()}
+        else:
+            state['columns'] = {name: column[:self.count].copy() for name, column in self.columns.items()}
+        return state
+
+    def __setstate__(self, state):
+        self.ratings = state['ratings']
+        self.days = state['days']
+        self.count = state['count']
+        self._shared = None
+        if 'shared' in state:
+            from multiprocessing import shared_memory
+            self._shared = {}
+            self.columns = {}
+            for name, (block_name, dtype, length) in state['shared'].items():
+                block = shared_memory.SharedMemory(name=block_name)
+                self.columns[name] = np.ndarray(length, dtype=np.dtype(dtype), buffer=block.buf)
+                self._shared[name] = block
+        else:
+            self.columns = state['columns']
+
+    def __deepcopy__(self, memo):
+        # Copies always get private arrays, so a replicate never writes into shared memory
+        table = RosterTable.__new__(RosterTable)
+        table.ratings = self.ratings
+        table.days = self.days
+        table.count = self.count
+        table.columns = {name: column[:max(1, self.count)].copy() for name, column in self.columns.items()}
+        table._shared = None
+        memo[id(self)] = table
+        return table
+
+
+class RosterStore:
+    """
+    League-wide ratings and rest state for every Player and Pitcher, one row each.
+
+    Player and Pitcher objects are thin views onto their row, so vectorized code can
+    read a whole rating column at once (roster_ratings, RosterTable.column) while the
+    engine keeps using attribute access. load_league() gives each league its own
+    store; objects built without one go into the module default.
+    """
+
+    PLAYER_RATINGS = ('batting', 'power', 'eye', 'splits_L', 'splits_R', 'speed', 'fielding',
+                      'clutch', 'injury', 'salary')
+    PITCHER_RATINGS = ('start_value', 'endurance', 'rest', 'sho_rating', 'splits_L', 'splits_R',
+                       'relief_value', 'fatigue', 'clutch', 'injury', 'morale', 'salary')
+    PITCHER_DAYS = ('last_start_day', 'last_relief_day')
+
+    def __init__(self, capacity=64):
+        self.players = RosterTable(self.PLAYER_RATINGS, capacity=capacity)
+        self.pitchers = RosterTable(self.PITCHER_RATINGS, self.PITCHER_DAYS, capacity=capacity)
+
+    def share(self):
+        self.players.share()
+        self.pitchers.share()
+
+    def unshare(self):
+        self.players.unshare()
+        self.pitchers.unshare()
+
+    @contextlib.contextmanager
+    def shared(self):
+        """Keep the store in shared memory for the duration of a process pool."""
+        self.share()
+        try:
+            yield self
+        finally:
+            self.unshare()
+
+
+_DEFAULT_ROSTER = None
+
+
+def default_roster():
+    """The store used by Players and Pitchers created without an explicit roster."""
+    global _DEFAULT_ROSTER
+    if _DEFAULT_ROSTER is None:
+        _DEFAULT_ROSTER = RosterStore()
+    return _DEFAULT_ROSTER
+
+
+def roster_view(cls, table, row, **fields):
+    """A Player or Pitcher over an existing roster row (no new row), with its string fields set."""
+    view = cls.__new__(cls)
+    view._table = table
+    view._row = row
+    for key, value in fields.items():
+        setattr(view, key, value)
+    return view
+
+
+def roster_ratings(objects, name):
+    """
+    One rating for a list of Players or Pitchers as a float64 array, gathered from
+    the roster column in one step when they share a store.
+    """
+    if not objects:
+        return np.zeros(0, dtype=np.float64)
+    table = objects[0]._table
+    if all(obj._table is table for obj in objects):
+        return table.columns[name][[obj._row for obj in objects]].astype(np.float64)
+    return np.array([getattr(obj, name) for obj in objects], dtype=np.float64)
+
+
+class RatingColumn:
+    """
+    A rating stored in the float64 roster column of the same name. Integral values read
+    back as int, and None is stored as NaN and reads back as None (so `is None` checks hold).
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        value = view._table.columns[self.name].item(view._row)
+        if math.isnan(value):
+            return None
+        return int(value) if value.is_integer() else value
+
+    def __set__(self, view, value):
+        view._table.columns[self.name][view._row] = np.nan if value is None else value
+
+
+class DayColumn:
+    """A day number stored in an int64 roster column; None is kept as NO_DAY."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        value = view._table.columns[self.name].item(view._row)
+        return None if value == NO_DAY else value
+
+    def __set__(self, view, value):
+        view._table.columns[self.name][view._row] = NO_DAY if value is None else value
+
+
 class Player:
-    def __init__(self, role, name, batting=0, power=0, speed=0, fielding=0, position=None, sec_position=None, bats='R', clutch=0, injury=0, salary=0, eye=0, splits_L=0, splits_R=0):
+    __slots__ = ('_table', '_row', 'name', 'role', 'position', 'sec_position', 'bats', 'injury_days')
+
+    # Serialized fields, in save-file order; injury_days is written once a player has been hurt
+    FIELDS = ('name', 'role', 'position', 'sec_position', 'batting', 'power', 'eye', 'splits_L', 'splits_R',
+              'speed', 'fielding', 'bats', 'clutch', 'injury', 'salary')
+    STATE_FIELDS = ('injury_days',)
+
+    batting = RatingColumn()
+    power = RatingColumn()
+    eye = RatingColumn()
+    splits_L = RatingColumn()
+    splits_R = RatingColumn()
+    speed = RatingColumn()
+    fielding = RatingColumn()
+    clutch = RatingColumn()
+    injury = RatingColumn()
+    salary = RatingColumn()
+
+    def __init__(self, role, name, batting=0, power=0, speed=0, fielding=0, position=None, sec_position=None, bats='R', clutch=0, injury=0, salary=0, eye=0, splits_L=0, splits_R=0, roster=None):
+        self._table = (roster if roster is not None else default_roster()).players
+        self._row = self._table.add()
         self.name = name
         self.role = role
         self.position = position
@@ -1471,25 +2354,201 @@ class Player:
         self.injury = injury
         self.salary = salary
 
+    @classmethod
+    def from_dict(cls, data, roster=None):
+        """Rebuild a player from to_dict() output (a saved team file)."""
+        fields = {key: value for key, value in data.items() if key not in cls.STATE_FIELDS}
+        player = cls(**fields, roster=roster)
+        for key in cls.STATE_FIELDS:
+            if key in data:
+                setattr(player, key, data[key])
+        return player
+
+    def to_dict(self):
+        data = {field: getattr(self, field) for field in self.FIELDS}
+        for field in self.STATE_FIELDS:
+            if hasattr(self, field):
+                data[field] = getattr(self, field)
+        return data
+
 class Pitcher:
-    def __init__(self, name, type, start_value, endurance, rest, relief_value, fatigue, sho_rating=666, throws='R', clutch=0, injury=0, salary=0, splits_L=0, splits_R=0):
+    __slots__ = ('_table', '_row', 'name', 'throws', 'type', 'decision', 'total_relief_value', 'injury_days')
+
+    # Serialized fields, in save-file order; the game-time fields follow once they are set
+    FIELDS = ('name', 'throws', 'type', 'start_value', 'endurance', 'rest', 'sho_rating', 'splits_L', 'splits_R',
+              'relief_value', 'fatigue', 'last_start_day', 'last_relief_day', 'clutch', 'injury', 'morale', 'salary')
+    STATE_FIELDS = ('last_start_day', 'last_relief_day', 'morale', 'decision', 'total_relief_value', 'injury_days')
+
+    start_value = RatingColumn()  # Starting value (pitching quality)
+    endurance = RatingColumn()  # How long they can pitch in a game (also determines CG eligibility via chart)
+    rest = RatingColumn()  # Days required between starts/appearances
+    sho_rating = RatingColumn()  # Shutout rating (611-666 scale)
+    splits_L = RatingColumn()
+    splits_R = RatingColumn()
+    relief_value = RatingColumn()  # Relief value (higher = better, range -7 to +5)
+    fatigue = RatingColumn()
+    clutch = RatingColumn()
+    injury = RatingColumn()  # Injury status
+    morale = RatingColumn()
+    salary = RatingColumn()  # Salary
+    last_start_day = DayColumn()  # None allows an immediate start
+    last_relief_day = DayColumn()  # None for relievers not yet used
+
+    def __init__(self, name, type, start_value, endurance, rest, relief_value, fatigue, sho_rating=666, throws='R', clutch=0, injury=0, salary=0, splits_L=0, splits_R=0, roster=None):
+        self._table = (roster if roster is not None else default_roster()).pitchers
+        self._row = self._table.add()
         self.name = name
         self.throws = throws  # Handedness (R or L)
         self.type = type  # "SP" for starter or "RP" for reliever
-        self.start_value = start_value  # Starting value (pitching quality)
-        self.endurance = endurance  # How long they can pitch in a game (also determines CG eligibility via chart)
-        self.rest = rest  # Days required between starts/appearances
-        self.sho_rating = sho_rating  # Shutout rating (611-666 scale)
+        self.start_value = start_value
+        self.endurance = endurance
+        self.rest = rest
+        self.sho_rating = sho_rating
         self.splits_L = splits_L
         self.splits_R = splits_R
-        self.relief_value = relief_value  # Relief value (higher = better, range -7 to +5)
+        self.relief_value = relief_value
         self.fatigue = fatigue
-        self.last_start_day = None  # Initialize to allow immediate start
-        self.last_relief_day = None  # Initialize as None for relievers
         self.clutch = clutch
-        self.injury = injury  # Injury status
+        self.injury = injury
         self.morale = 0
-        self.salary = salary  # Salary
+        self.salary = salary
+
+    @classmethod
+    def from_dict(cls, data, roster=None):
+        """Rebuild a pitcher from to_dict() output (a saved team file)."""
+        fields = {key: value for key, value in data.items() if key not in cls.STATE_FIELDS}
+        pitcher = cls(**fields, roster=roster)
+        for key in cls.STATE_FIELDS:
+            if key in data:
+                setattr(pitcher, key, data[key])
+        return pitcher
+
+    def to_dict(self):
+        data = {field: getattr(self, field) for field in self.FIELDS}
+        for field in ('decision', 'total_relief_value', 'injury_days'):
+            if hasattr(self, field):
+                data[field] = getattr(self, field)
+        return data
+
+class Bullpen:
+    """
+    A team's relievers ordered by fatigue-adjusted relief value for the current day.
+
+    The order is a heap of (-relief_value * fatigue multiplier, roster order), so
+    ties break in roster order as the old stable sort did. It is rebuilt from
+    last_relief_day and fatigue when the day rolls over; within a day, take()
+    pops the best relievers and release() pushes them back at their post-outing
+    value, both O(log n). Extra innings pick by raw relief value from a fixed order.
+    """
+
+    def __init__(self, pitchers):
+        self.relievers = [p for p in pitchers if p.type in ('RP', 'Reliever')]
+        # Keyed by the relievers themselves, not id(): a deep-copied or unpickled team's bullpen rehashes
+        # its copies, while id() keys would go stale
+        self.order = {reliever: i for i, reliever in enumerate(self.relievers)}
+        # Best raw relief value first, roster order among equals (max() picks the first maximum)
+        self.by_relief_value = sorted(self.relievers, key=lambda p: -p.relief_value)
+        self.day = None
+        self.heap = []
+        self.multipliers = {}  # reliever -> today's fatigue multiplier (as last computed)
+        self.out = set()  # relievers taken and not yet released
+
+    @staticmethod
+    def fatigue_multiplier(reliever, current_day):
+        """Apply fatigue adjustment based on consecutive usage."""
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # If the reliever has never pitched, initialize last_relief_day to assume they are fully rested.
+        if reliever.last_relief_day is None or reliever.last_relief_day == 0:
+            reliever.last_relief_day = None  # Leave it as None or 0 to treat them as fully rested for the first game.
+            days_since_last_relief = float('inf')  # Treat as infinitely rested if they've never pitched before.
+        else:
+            days_since_last_relief = current_day - reliever.last_relief_day
+            reliever.last_relief_day = int(reliever.last_relief_day)  # Ensure it's an integer
+
+        if debug:
+            logger.debug("LINE 1332 Apply Fatigue: Days since last relief for %s: %s", reliever.name, days_since_last_relief)
+
+        # Default multiplier assumes the pitcher is fully rested
+        fatigue_multiplier = 1.0
+
+        # Apply penalties based on consecutive days pitched (reverse the logic for the penalty)
+        if days_since_last_relief == 0:
+            # Pitched the previous day, apply full fatigue penalty (based on fatigue rating)
+            fatigue_multiplier = (reliever.fatigue / 8) * 0.5  # Larger penalty
+        elif days_since_last_relief == 1:
+            # Pitched two consecutive days, moderate penalty
+            fatigue_multiplier = (reliever.fatigue / 8) * 0.75
+        elif days_since_last_relief == 2:
+            # Pitched three consecutive days, small penalty
+            fatigue_multiplier = reliever.fatigue / 8  # Lesser penalty
+
+        if debug:
+            logger.debug("LINE 1347 Apply Fatigue: Fatigue multiplier for %s: %s", reliever.name, fatigue_multiplier)
+
+        # Return the multiplier to adjust relief value accordingly
+        return float(fatigue_multiplier)
+
+    def _entry(self, reliever, current_day):
+        multiplier = self.fatigue_multiplier(reliever, current_day)
+        self.multipliers[reliever] = multiplier
+        return (-(reliever.relief_value * multiplier), self.order[reliever], reliever)
+
+    def roll_over(self, current_day):
+        """Re-rank every reliever for a new day (multipliers only change between days or after an outing)."""
+        self.day = current_day
+        self.out = set()
+        self.multipliers = {}
+        self.heap = [self._entry(reliever, current_day) for reliever in self.relievers]
+        heapq.heapify(self.heap)
+
+    def _ensure_day(self, current_day):
+        if self.day != current_day:
+            self.roll_over(current_day)
+
+    def take(self, count, current_day, exclude=()):
+        """
+        Pop the `count` best relievers for today, skipping any in `exclude`.
+        Returns [(reliever, fatigue multiplier)], best first.
+        """
+        self._ensure_day(current_day)
+        excluded = set(exclude)
+        chosen = []
+        skipped = []
+        while self.heap and len(chosen) < count:
+            entry = heapq.heappop(self.heap)
+            reliever = entry[2]
+            if reliever in excluded:
+                skipped.append(entry)
+                continue
+            self.out.add(reliever)
+            chosen.append((reliever, self.multipliers[reliever]))
+        for entry in skipped:
+            heapq.heappush(self.heap, entry)
+        return chosen
+
+    def release(self, reliever, current_day):
+        """Return a taken reliever to the pen, re-ranked from its (updated) last_relief_day."""
+        self._ensure_day(current_day)
+        if reliever not in self.out:
+            return
+        self.out.discard(reliever)
+        heapq.heappush(self.heap, self._entry(reliever, current_day))
+
+    def ranking(self, current_day):
+        """Every reliever in today's selection order with its multiplier, without taking any."""
+        self._ensure_day(current_day)
+        return [(entry[2], self.multipliers[entry[2]]) for entry in sorted(self.heap, key=lambda e: e[:2])]
+
+    def available(self, used_relievers):
+        """Relievers (roster order) not in used_relievers."""
+        used = set(used_relievers)
+        return [p for p in self.relievers if p not in used]
+
+    def best_available(self, used_relievers):
+        """Highest raw relief value among relievers not in used_relievers (None if all are used)."""
+        used = set(used_relievers)
+        return next((p for p in self.by_relief_value if p not in used), None)
+
 
 class ReliefPitching:
     def __init__(self, opponent_pitcher, team, dice, game, splits_L=0, splits_R=0, used_relievers=None):
@@ -1509,6 +2568,7 @@ class ReliefPitching:
 
     def innings_pitched_by_bullpen(self):
         """Determine the number of innings pitched by the bullpen based on the starter's endurance and the white die."""
+        debug = logger.isEnabledFor(logging.DEBUG)
         white_die = self.dice[0]  # Assuming the dice are passed as a tuple (white, red, green)
         endurance = self.opponent_pitcher.endurance
 
@@ -1530,7 +2590,8 @@ class ReliefPitching:
                 # Reverse the white die roll: 6 -> 0, 5 -> 1, ..., 1 -> 5
                 adjusted_white_die = 6 - white_die
                 bullpen_innings = innings_list[adjusted_white_die]
-                logger.debug(f"LINE 1250: Relief pitching: {bullpen_innings} innings pitched by the bullpen (Endurance: {endurance}, White die: {white_die})")
+                if debug:
+                    logger.debug("LINE 1250: Relief pitching: %s innings pitched by the bullpen (Endurance: %s, White die: %s)", bullpen_innings, endurance, white_die)
                 return bullpen_innings
 
         logger.error(f"Invalid endurance value: {endurance}")
@@ -1542,6 +2603,7 @@ class ReliefPitching:
 
     def number_of_relievers_used(self, bullpen_innings):
         """Determine the number of relievers based on the bullpen innings and red die."""
+        debug = logger.isEnabledFor(logging.DEBUG)
         red_die = self.dice[1]
         
         # Relievers to Use chart (cross-referenced by bullpen innings and red die)
@@ -1564,12 +2626,14 @@ class ReliefPitching:
 
         # Check if bullpen_innings exceeds chart, use 5 relievers if so
         if bullpen_innings >= 5.0:
-            logger.debug(f"LINE 1282 Bullpen innings {bullpen_innings} exceed chart max, defaulting to 5 relievers.")
+            if debug:
+                logger.debug("LINE 1282 Bullpen innings %s exceed chart max, defaulting to 5 relievers.", bullpen_innings)
             return 5
 
         if bullpen_innings in relievers_chart:
             relievers_used = relievers_chart[bullpen_innings][red_die - 1]
-            logger.debug(f"LINE 1287: Relief pitching: {relievers_used} relievers used (Bullpen innings: {bullpen_innings}, Red die: {red_die})")
+            if debug:
+                logger.debug("LINE 1287: Relief pitching: %s relievers used (Bullpen innings: %s, Red die: %s)", relievers_used, bullpen_innings, red_die)
             return relievers_used
         else:
             logger.error(f"Invalid bullpen innings: {bullpen_innings}")
@@ -1581,14 +2645,17 @@ class ReliefPitching:
         return fatigue_cache[reliever]
 
     def calculate_relief_value(self, relievers_used, current_day, fatigue_cache):
-        available_relievers = sorted(
-            [p for p in self.team.pitchers if p.type in ('RP', 'Reliever') and p not in self.used_relievers],
-            key=lambda p: p.relief_value * self.get_fatigue_multiplier(p, current_day, fatigue_cache),
-            reverse=True
-        )
-
-        chosen_relievers = available_relievers[:relievers_used]
-        logger.debug(f"LINE 1308: Relief pitching: Chosen relievers: {[r.name for r in chosen_relievers]}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # Best fatigue-adjusted relievers from the team's bullpen, returned to it below once used
+        bullpen = self.team.bullpen
+        taken = bullpen.take(relievers_used, current_day, exclude=self.used_relievers)
+        chosen_relievers = [reliever for reliever, _ in taken]
+        for reliever, multiplier in taken:
+            fatigue_cache[reliever] = multiplier
+            if TRACER is not None:
+                TRACER.emit(trace.RELIEVER, self.team.team_name, reliever.name, reliever.relief_value, multiplier)
+        if debug:
+            logger.debug("LINE 1308: Relief pitching: Chosen relievers: %s", [r.name for r in chosen_relievers])
         self.used_relievers.extend(chosen_relievers)
 
         # Output each reliever's relief value before summing
@@ -1597,52 +2664,27 @@ class ReliefPitching:
             reliever_total_value = reliever.relief_value * fatigue_cache[reliever]
             individual_relief_values[reliever.name] = reliever_total_value
             reliever.total_relief_value = reliever_total_value
-            logger.debug(f"Reliever {reliever.name} relief value: {reliever.relief_value}, "
-                        f"fatigue multiplier: {fatigue_cache[reliever]}, "
-                        f"total: {reliever_total_value}")
+            if debug:
+                logger.debug("Reliever %s relief value: %s, fatigue multiplier: %s, total: %s", reliever.name, reliever.relief_value, fatigue_cache[reliever], reliever_total_value)
 
         total_relief_value = sum([r.relief_value * fatigue_cache[r] for r in chosen_relievers])
-        logger.debug(f"LINE 1312: Relief pitching: Total relief value: {total_relief_value} for {relievers_used} relievers")
+        if debug:
+            logger.debug("LINE 1312: Relief pitching: Total relief value: %s for %s relievers", total_relief_value, relievers_used)
 
         for reliever in chosen_relievers:
             self.update_last_relief_day(reliever, current_day)
+            bullpen.release(reliever, current_day)
 
-        fatigue_debug_info = {r.name: fatigue_cache[r] for r in chosen_relievers if r in fatigue_cache}
-        logger.debug(f"LINE 1318: Relief pitching: Fatigue Cache: {fatigue_debug_info}")
-        logger.debug(f"Chosen reliever total relief values: {individual_relief_values}")
-        logger.debug(f"LINE 1320: Relief pitching: Total relief value after adjustments: {total_relief_value}")
+        if debug:
+            fatigue_debug_info = {r.name: fatigue_cache[r] for r in chosen_relievers if r in fatigue_cache}
+            logger.debug("LINE 1318: Relief pitching: Fatigue Cache: %s", fatigue_debug_info)
+            logger.debug("Chosen reliever total relief values: %s", individual_relief_values)
+            logger.debug("LINE 1320: Relief pitching: Total relief value after adjustments: %s", total_relief_value)
         return total_relief_value, chosen_relievers
 
     def apply_fatigue(self, reliever, current_day):
         """Apply fatigue adjustment based on consecutive usage."""
-        # If the reliever has never pitched, initialize last_relief_day to assume they are fully rested.
-        if reliever.last_relief_day is None or reliever.last_relief_day == 0:
-            reliever.last_relief_day = None  # Leave it as None or 0 to treat them as fully rested for the first game.
-            days_since_last_relief = float('inf')  # Treat as infinitely rested if they've never pitched before.
-        else:
-            days_since_last_relief = current_day - reliever.last_relief_day
-            reliever.last_relief_day = int(reliever.last_relief_day)  # Ensure it's an integer
-
-        logger.debug(f"LINE 1332 Apply Fatigue: Days since last relief for {reliever.name}: {days_since_last_relief}")
-        
-        # Default multiplier assumes the pitcher is fully rested
-        fatigue_multiplier = 1.0
-
-        # Apply penalties based on consecutive days pitched (reverse the logic for the penalty)
-        if days_since_last_relief == 0:
-            # Pitched the previous day, apply full fatigue penalty (based on fatigue rating)
-            fatigue_multiplier = (reliever.fatigue / 8) * 0.5  # Larger penalty
-        elif days_since_last_relief == 1:
-            # Pitched two consecutive days, moderate penalty
-            fatigue_multiplier = (reliever.fatigue / 8) * 0.75
-        elif days_since_last_relief == 2:
-            # Pitched three consecutive days, small penalty
-            fatigue_multiplier = reliever.fatigue / 8  # Lesser penalty
-
-        logger.debug(f"LINE 1347 Apply Fatigue: Fatigue multiplier for {reliever.name}: {fatigue_multiplier}")
-
-        # Return the multiplier to adjust relief value accordingly
-        return float(fatigue_multiplier)
+        return Bullpen.fatigue_multiplier(reliever, current_day)
 
     def process_relief_pitching(self, current_day):
         # Determine bullpen innings pitched
@@ -1663,6 +2705,7 @@ class ReliefPitching:
         return total_relief_value, chosen_relievers, self.fatigue_cache
 
     def distribute_runs_among_relievers(self, relievers, remaining_earned_runs, remaining_unearned_runs, current_day, fatigue_cache):
+        debug = logger.isEnabledFor(logging.DEBUG)
         # Adjust relief_value based on fatigue and calculate total relief strength
         total_relief_value = sum([self.get_fatigue_multiplier(r, current_day, fatigue_cache) for r in relievers])
 
@@ -1671,7 +2714,8 @@ class ReliefPitching:
         unearned_runs_distribution = {}
         remaining_earned = remaining_earned_runs
         remaining_unearned = remaining_unearned_runs
-        logger.debug(f"LINE 1379 Distributing {remaining_earned_runs} earned runs and {remaining_unearned_runs} unearned runs among relievers.")
+        if debug:
+            logger.debug("LINE 1379 Distributing %s earned runs and %s unearned runs among relievers.", remaining_earned_runs, remaining_unearned_runs)
 
         for i, reliever in enumerate(relievers):
             adjusted_value = self.get_fatigue_multiplier(reliever, current_day, fatigue_cache)
@@ -1692,21 +2736,24 @@ class ReliefPitching:
             remaining_earned -= reliever_earned_runs
             remaining_unearned -= reliever_unearned_runs
 
-        logger.debug(f"LINE 1400 Distributed earned runs among relievers: {earned_runs_distribution}")
-        logger.debug(f"LINE 1401 Distributed unearned runs among relievers: {unearned_runs_distribution}")
+        if debug:
+            logger.debug("LINE 1400 Distributed earned runs among relievers: %s", earned_runs_distribution)
+            logger.debug("LINE 1401 Distributed unearned runs among relievers: %s", unearned_runs_distribution)
     
         return earned_runs_distribution, unearned_runs_distribution
 
 
     def distribute_innings_among_relievers(self, relievers, total_innings, fatigue_cache):
         """Distribute innings among relievers using precomputed fatigue multipliers."""
+        debug = logger.isEnabledFor(logging.DEBUG)
         
         # Sum the total relief value using the cached fatigue multipliers
         total_relief_value = sum([fatigue_cache[r] for r in relievers])
 
         # Convert total innings into total outs
         total_outs = int(total_innings) * 3 + round((total_innings % 1) * 10)
-        logger.debug(f"LINE 1414: Total outs to distribute: {total_outs} from {total_innings} innings")
+        if debug:
+            logger.debug("LINE 1414: Total outs to distribute: %s from %s innings", total_outs, total_innings)
 
         outs_distribution = {}
         remaining_outs = total_outs
@@ -1733,18 +2780,285 @@ class ReliefPitching:
 
             # Subtract assigned outs from remaining outs
             remaining_outs -= reliever_outs
-            logger.debug(f"{reliever.name} has pitched {innings_pitched} innings (outs: {reliever_outs})")
+            if debug:
+                logger.debug("%s has pitched %s innings (outs: %s)", reliever.name, innings_pitched, reliever_outs)
 
-        logger.debug(f"LINE 1443: Distributed innings: {outs_distribution}")
+        if debug:
+            logger.debug("LINE 1443: Distributed innings: %s", outs_distribution)
         return outs_distribution
 
 class Dice:
-    def __init__(self, sides=6):
+    def __init__(self, sides=6, rng=None):
         self.sides = sides
+        self.rng = rng  # Optional numpy Generator; falls back to the global random module
 
     def roll(self):
+        if self.rng is not None:
+            return int(self.rng.integers(1, self.sides + 1))
         return random.randint(1, self.sides)
 
+class MatchupCache:
+    """
+    Bounded LRU memo for matchup-derived quantities: team batting values for the
+    season path, and the batch engine's per-dice outcome table and exact run PMF.
+
+    Keys are content hashes of the lineup ratings, the opposing Pitcher ratings
+    and Ballpark.stadium_value, plus the rest/fatigue state that changes the
+    outcome table from day to day. Batting values depend only on the lineup and
+    the pitcher's hand and splits, so they are keyed on just those. Signatures are
+    computed once per team and pitcher and reused until invalidate_team() is
+    called (roster change, injury).
+    """
+
+    LINEUP_FIELDS = ('name', 'role', 'position', 'bats', 'batting', 'power', 'eye', 'speed',
+                     'fielding', 'clutch', 'splits_L', 'splits_R')
+    PITCHER_FIELDS = ('name', 'type', 'throws', 'start_value', 'endurance', 'rest', 'sho_rating',
+                      'relief_value', 'fatigue', 'clutch', 'splits_L', 'splits_R')
+
+    def __init__(self, max_entries=4096):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # key -> (batting_team_id, pitcher_id, value)
+        self.lineup_signatures = {}  # team_id -> digest
+        self.pitcher_signatures = {}  # id(pitcher) -> (pitcher, digest)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.kind_counts = {}  # kind -> [hits, misses]
+
+    @staticmethod
+    def content_hash(values):
+        """Stable digest of a tuple of ratings."""
+        return hashlib.blake2b(repr(values).encode(), digest_size=16).hexdigest()
+
+    def lineup_signature(self, team):
+        """Digest of every roster spot the charts can reach, plus the unearned runs chart."""
+        signature = self.lineup_signatures.get(team.team_id)
+        if signature is None:
+            players = tuple(tuple(getattr(p, f, None) for f in self.LINEUP_FIELDS) for p in team.players)
+            relievers = tuple(tuple(getattr(p, f, None) for f in self.PITCHER_FIELDS) for p in team.pitchers)
+            chart = tuple(sorted((str(k), v) for k, v in team.unearned_runs_chart.items()))
+            signature = self.content_hash((players, relievers, chart))
+            self.lineup_signatures[team.team_id] = signature
+        return signature
+
+    def pitcher_signature(self, pitcher):
+        cached = self.pitcher_signatures.get(id(pitcher))
+        if cached is None or cached[0] is not pitcher:
+            cached = (pitcher, self.content_hash(tuple(getattr(pitcher, f, None) for f in self.PITCHER_FIELDS)))
+            self.pitcher_signatures[id(pitcher)] = cached
+        return cached[1]
+
+    @staticmethod
+    def state_signature(team, opponent_pitcher, current_day):
+        """Rest and fatigue state that the outcome table depends on for this day."""
+        last_start_day = opponent_pitcher.last_start_day
+        if last_start_day is None or last_start_day == 0:
+            short_rested = False
+        else:
+            short_rested = current_day - last_start_day < opponent_pitcher.rest
+        # ReliefPitching.apply_fatigue only distinguishes 0, 1, 2 and 3+ days of rest
+        bullpen_rest = tuple(
+            3 if not p.last_relief_day else min(current_day - p.last_relief_day, 3)
+            for p in team.pitchers if p.type in ('RP', 'Reliever')
+        )
+        return short_rested, bullpen_rest
+
+    def matchup_key(self, kind, team, opponent_pitcher, ballpark, current_day, *extra):
+        return (kind, self.lineup_signature(team), self.pitcher_signature(opponent_pitcher),
+                ballpark.stadium_value, self.state_signature(team, opponent_pitcher, current_day)) + extra
+
+    def memoize(self, kind, key, team, opponent_pitcher, compute):
+        """Return the cached value for key, computing and storing it on a miss."""
+        counts = self.kind_counts.setdefault(kind, [0, 0])
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            counts[0] += 1
+            return entry[2]
+
+        self.misses += 1
+        counts[1] += 1
+        value = compute()
+        self.entries[key] = (team.team_id, id(opponent_pitcher), value)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def batting_value(self, team, opponent_pitcher):
+        """Team.get_batting_value, keyed on the lineup signature and the pitcher's hand and splits."""
+        key = ('batting_value', self.lineup_signature(team), opponent_pitcher.throws,
+               opponent_pitcher.splits_L, opponent_pitcher.splits_R)
+        return self.memoize('batting_value', key, team, opponent_pitcher,
+                            lambda: team.get_batting_value(opponent_pitcher))
+
+    def outcome_table(self, team, opponent_pitcher, ballpark, current_day, compute, *extra):
+        key = self.matchup_key('outcome_table', team, opponent_pitcher, ballpark, current_day, *extra)
+        return self.memoize('outcome_table', key, team, opponent_pitcher, compute)
+
+    def run_pmf(self, team, opponent_pitcher, ballpark, current_day, compute, *extra):
+        key = self.matchup_key('run_pmf', team, opponent_pitcher, ballpark, current_day, *extra)
+        return self.memoize('run_pmf', key, team, opponent_pitcher, compute)
+
+    def invalidate_team(self, team):
+        """Drop every entry involving this team's lineup or its pitchers (roster change, injury)."""
+        self.lineup_signatures.pop(team.team_id, None)
+        pitcher_ids = {id(p) for p in team.pitchers}
+        for pitcher_id in pitcher_ids:
+            self.pitcher_signatures.pop(pitcher_id, None)
+        stale = [key for key, (team_id, pitcher_id, _) in self.entries.items()
+                 if team_id == team.team_id or pitcher_id in pitcher_ids]
+        for key in stale:
+            del self.entries[key]
+        self.invalidations += 1
+        logger.debug(f"Matchup cache invalidated for {team.team_name}: {len(stale)} entries dropped")
+
+    def clear(self):
+        self.entries.clear()
+        self.lineup_signatures.clear()
+        self.pitcher_signatures.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'entries': len(self.entries),
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'by_kind': {kind: {'hits': h, 'misses': m} for kind, (h, m) in self.kind_counts.items()},
+        }
+
+class StateJournal:
+    """
+    Write-behind persistence for the season state that changes game to game:
+    pitcher last_start_day / last_relief_day, player injury_days and the team's
+    rotation index.
+
+    record_team() diffs a team against the last state it saw and buffers only the
+    changed fields. The buffer is appended to a JSONL journal in batches,
+    at checkpoint() or once batch_size records are pending. compact() writes full
+    team files once (Team.save_team_data) and truncates the journal. replay()
+    re-applies a journal onto freshly loaded teams after a crash.
+
+    Roster entries are addressed by their index in team.players / team.pitchers.
+    """
+
+    PITCHER_FIELDS = ('last_start_day', 'last_relief_day', 'injury_days')
+    PLAYER_FIELDS = ('injury_days',)
+
+    def __init__(self, journal_path, batch_size=256, checkpoint_days=1):
+        self.journal_path = journal_path
+        self.batch_size = batch_size
+        self.checkpoint_days = checkpoint_days
+        self.pending = []
+        self.known_state = {}  # team_id -> last recorded state, used for diffing
+        self.records_written = 0
+        self.flushes = 0
+
+    @classmethod
+    def team_state(cls, team):
+        return {
+            'rotation': team.current_rotation_index,
+            'pitchers': [tuple(getattr(p, f, None) for f in cls.PITCHER_FIELDS) for p in team.pitchers],
+            'players': [tuple(getattr(p, f, None) for f in cls.PLAYER_FIELDS) for p in team.players],
+        }
+
+    def prime(self, team_lookup):
+        """Remember the starting state of every team so the first records are diffs too."""
+        for team_id, team in team_lookup.items():
+            self.known_state[team_id] = self.team_state(team)
+
+    def record_team(self, team, day):
+        """Buffer whatever changed on this team since it was last recorded."""
+        state = self.team_state(team)
+        previous = self.known_state.get(team.team_id)
+        record = {'day': day, 'team_id': team.team_id}
+
+        if previous is None or state['rotation'] != previous['rotation']:
+            record['rotation'] = state['rotation']
+        for group, fields in (('pitchers', self.PITCHER_FIELDS), ('players', self.PLAYER_FIELDS)):
+            changes = {}
+            for index, values in enumerate(state[group]):
+                old_values = previous[group][index] if previous and index < len(previous[group]) else None
+                if values != old_values:
+                    changes[index] = {f: v for f, v, old in zip(fields, values, old_values or (None,) * len(fields))
+                                      if old_values is None or v != old}
+            if changes:
+                record[group] = changes
+
+        self.known_state[team.team_id] = state
+        if len(record) > 2:
+            self.pending.append(record)
+            if len(self.pending) >= self.batch_size:
+                self.flush()
+
+    def checkpoint(self, day):
+        """End-of-day hook: flush every checkpoint_days days."""
+        if self.checkpoint_days and day % self.checkpoint_days == 0:
+            self.flush()
+
+    def flush(self):
+        """Append all pending records to the journal in one write."""
+        if not self.pending:
+            return
+        lines = ''.join(json.dumps(record, separators=(',', ':')) + '\n' for record in self.pending)
+        with open(self.journal_path, 'a') as file:
+            file.write(lines)
+            file.flush()
+            os.fsync(file.fileno())
+        self.records_written += len(self.pending)
+        self.flushes += 1
+        logger.debug(f"State journal: flushed {len(self.pending)} records to {self.journal_path}")
+        self.pending = []
+
+    def read_records(self):
+        """Yield journal records, stopping at a torn final line from an interrupted write."""
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, 'r') as file:
+            for line in file:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"State journal: ignoring incomplete record in {self.journal_path}")
+                    return
+
+    def replay(self, team_lookup):
+        """Apply the journal to freshly loaded teams; returns the last day recovered (0 if none)."""
+        last_day = 0
+        for record in self.read_records():
+            team = team_lookup.get(record['team_id'])
+            if team is None:
+                continue
+            if 'rotation' in record:
+                team.current_rotation_index = record['rotation']
+            for group in ('pitchers', 'players'):
+                roster = getattr(team, group)
+                for index, changes in record.get(group, {}).items():
+                    for field, value in changes.items():
+                        setattr(roster[int(index)], field, value)
+            team.mark_bullpen_changed()
+            last_day = max(last_day, record['day'])
+        self.prime(team_lookup)
+        logger.info(f"State journal: replayed {self.journal_path} through day {last_day}")
+        return last_day
+
+    def compact(self, team_lookup):
+        """Write each team's full state once and start a fresh, empty journal."""
+        self.flush()
+        for team in team_lookup.values():
+            team.save_team_data()
+        self.truncate()
+        logger.info(f"State journal: compacted {self.records_written} records in {self.flushes} flushes into team files")
+
+    def truncate(self):
+        self.pending = []
+        open(self.journal_path, 'w').close()
+
 class TeamStats:
     def __init__(self, team_name):
         self.team_name = team_name
@@ -2001,8 +3315,68 @@ class SimulateStats:
         return season_stats, season_pitching_stats
 
 class Schedule:
-    def __init__(self, schedule_file):
-        self.schedule = self.read_schedule(schedule_file)
+    """
+    Compiled season schedule with O(1) access by day, team and series.
+
+    The XML-like schedule text file is parsed once and the parsed games are cached
+    in a binary file next to it (<schedule_file>.cache). The cache is reused while
+    the source's mtime and size are unchanged, or its sha256 still matches.
+
+    The object only holds plain tuples, lists and dicts, so it pickles cheaply for worker
+    processes; treat it as read-only once built.
+    """
+
+    CACHE_VERSION = 1
+
+    def __init__(self, schedule_file=None, games=None, use_cache=True):
+        self.schedule_file = schedule_file
+        if games is None:
+            games = self.load_games(schedule_file, use_cache)
+        self.schedule = games  # Flat list of {'day', 'time', 'away', 'home'} dicts, file order
+        self.build_indexes()
+
+    # --- Loading ---------------------------------------------------------------
+
+    def load_games(self, schedule_file, use_cache=True):
+        """Return the parsed games, from the binary cache when it is still valid."""
+        cache_file = f"{schedule_file}.cache"
+        stat = os.stat(schedule_file)
+        source_hash = None
+
+        if use_cache and os.path.exists(cache_file):
+            try:
+                with open(cache_file, 'rb') as file:
+                    cached = pickle.load(file)
+                if cached.get('version') == self.CACHE_VERSION:
+                    if cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+                        logger.debug(f"Schedule cache hit (mtime): {cache_file}")
+                        return cached['games']
+                    # Touched but possibly unchanged (e.g. copied or checked out again)
+                    source_hash = file_hash(schedule_file)
+                    if cached['sha256'] == source_hash:
+                        logger.debug(f"Schedule cache hit (sha256): {cache_file}")
+                        self.write_cache(cache_file, cached['games'], stat, source_hash)
+                        return cached['games']
+            except Exception as e:
+                logger.debug(f"Ignoring unreadable schedule cache {cache_file}: {e}")
+
+        games = self.read_schedule(schedule_file)
+        if use_cache:
+            self.write_cache(cache_file, games, stat, source_hash or file_hash(schedule_file))
+        return games
+
+    def write_cache(self, cache_file, games, stat, source_hash):
+        try:
+            with open(cache_file, 'wb') as file:
+                pickle.dump({
+                    'version': self.CACHE_VERSION,
+                    'mtime_ns': stat.st_mtime_ns,
+                    'size': stat.st_size,
+                    'sha256': source_hash,
+                    'games': games,
+                }, file, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logger.debug(f"Could not write schedule cache {cache_file}: {e}")
 
     def read_schedule(self, schedule_file):
         games = []
@@ -2023,150 +3397,232 @@ class Schedule:
         end = text.find('"', start)
         return text[start:end]
 
+    # --- Indexes ---------------------------------------------------------------
+
+    def build_indexes(self):
+        """Index games by day (list slot per day), by team, and into series (also by team)."""
+        self.num_days = max((game['day'] for game in self.schedule), default=0)
+
+        days = [[] for _ in range(self.num_days + 1)]
+        team_games = {}
+        for game in self.schedule:
+            days[game['day']].append(game)
+            team_games.setdefault(game['home'], []).append(game)
+            team_games.setdefault(game['away'], []).append(game)
+        self.days = [tuple(games) for games in days]
+        self.team_games = {team: tuple(games) for team, games in team_games.items()}
+
+        # A series is a run of games between the same home/away pair with no other
+        # opponent in between for either club
+        self.series = []
+        self.series_by_game = {}
+        open_series = {}  # (home, away) -> series index still accepting games
+        for game_index, game in enumerate(self.schedule):
+            key = (game['home'], game['away'])
+            series_index = open_series.get(key)
+            if series_index is None:
+                series_index = len(self.series)
+                self.series.append({'home': game['home'], 'away': game['away'], 'games': []})
+                # Either club starting a new series closes whatever they were playing before
+                for other_key in [k for k in open_series if k[0] in key or k[1] in key]:
+                    del open_series[other_key]
+                open_series[key] = series_index
+            self.series[series_index]['games'].append(game)
+            self.series_by_game[game_index] = series_index
+        team_series = {}
+        for series in self.series:
+            series['games'] = tuple(series['games'])
+            series['start_day'] = series['games'][0]['day']
+            series['end_day'] = series['games'][-1]['day']
+            team_series.setdefault(series['home'], []).append(series)
+            team_series.setdefault(series['away'], []).append(series)
+        self.team_series = {team: tuple(series) for team, series in team_series.items()}
+
+    # --- Access ----------------------------------------------------------------
+
     def get_games_for_day(self, day):
         """Return all games scheduled for the given day."""
-        return [game for game in self.schedule if game['day'] == day]
+        if 0 <= day <= self.num_days:
+            return self.days[day]
+        return ()
+
+    def get_games_for_team(self, team):
+        """Return every game (home or away) for a schedule team id, in date order."""
+        return self.team_games.get(team, ())
+
+    def get_series_for_team(self, team):
+        """Every series (home or away) for a schedule team id, in schedule order."""
+        return list(self.team_series.get(team, ()))
+
+    def game_days(self):
+        """Days that have at least one game scheduled."""
+        return [day for day in range(1, self.num_days + 1) if self.days[day]]
+
+    @classmethod
+    def concatenate(cls, schedules, gap_days=0):
+        """
+        Chain several schedules into one multi-season schedule. Each season's days are
+        offset past the previous one (plus gap_days), and games gain a 'season' index.
+        """
+        games = []
+        offset = 0
+        for season, schedule in enumerate(schedules):
+            for game in schedule.schedule:
+                games.append(dict(game, day=game['day'] + offset, season=season))
+            offset += schedule.num_days + gap_days
+        return cls(games=games)
 
 class BatterStats:
     def __init__(self, batter_stats_file):
         self.batter_stats = self.read_batter_stats(batter_stats_file)
 
-class PitcherStats:
-    def __init__(self, name="", team="", pitcher_type=""):
-        self.name = name
-        self.team = team
-        self.pitcher_type = pitcher_type  # 'Starter' or 'Reliever'
-        self.games_played = 0
-        self.games_started = 0
-        self.complete_games = 0
-        self.games_finished = 0
-        self.innings_pitched = 0.0
-        self.runs_allowed = 0
-        self.earned_runs = 0
-        self.strikeouts = 0
-        self.walks = 0
-        self.hits_allowed = 0
-        self.home_runs_allowed = 0
-        self.wins = 0
-        self.losses = 0
-        self.saves = 0
-        self.blown_saves = 0
-
-    def update_stats(self, innings, runs, earned_runs, strikeouts=0, walks=0, hits=0, home_runs=0,
-                     decision=None, is_start=False, is_complete_game=False, is_game_finished=False):
-        self.games_played += 1
-        self.innings_pitched += innings
-        self.runs_allowed += runs
-        self.earned_runs += earned_runs
-        self.strikeouts += strikeouts
-        self.walks += walks
-        self.hits_allowed += hits
-        self.home_runs_allowed += home_runs
 
+class SeasonPitcherTracker:
+    """
+    Season pitching lines for every team, one row per (team, pitcher) in an int64
+    array with a column per counting stat (innings are kept as outs). Appearances
+    update a row in place; rate stats (IP, ERA) are computed for the whole table at
+    export time. The engine doesn't simulate hits or walks allowed, so there is no WHIP.
+    """
+
+    COLUMNS = ('G', 'GS', 'CG', 'GF', 'OUTS', 'R', 'ER', 'W', 'L', 'SV', 'BS')
+    G, GS, CG, GF, OUTS, R, ER, W, L, SV, BS = range(len(COLUMNS))
+    DECISIONS = {'W': W, 'L': L, 'S': SV, 'BS': BS}
+
+    def __init__(self, capacity=512):
+        self.rows = {}  # (team_id, pitcher_name) -> row
+        self.team_ids = []
+        self.team_names = []
+        self.names = []
+        self.types = []  # 'Starter' or 'Reliever', from the pitcher's first appearance
+        self.stats = np.zeros((capacity, len(self.COLUMNS)), dtype=np.int64)
+
+    def __len__(self):
+        return len(self.names)
+
+    def row_for(self, team_id, team_name, pitcher_name, pitcher_type):
+        """Row of a pitcher's season line, added on first appearance."""
+        row = self.rows.get((team_id, pitcher_name))
+        if row is None:
+            row = len(self.names)
+            if row == len(self.stats):
+                self.stats = np.concatenate([self.stats, np.zeros_like(self.stats)])
+            self.rows[(team_id, pitcher_name)] = row
+            self.team_ids.append(team_id)
+            self.team_names.append(team_name)
+            self.names.append(pitcher_name)
+            self.types.append(pitcher_type)
+        return row
+
+    def record_appearance(self, row, innings, earned_runs, unearned_runs=0, decision=None,
+                          is_start=False, is_complete_game=False, is_game_finished=False):
+        line = self.stats[row]
+        line[self.G] += 1
+        line[self.OUTS] += innings_to_outs(innings)
+        line[self.R] += earned_runs + unearned_runs
+        line[self.ER] += earned_runs
         if is_start:
-            self.games_started += 1
+            line[self.GS] += 1
         if is_complete_game:
-            self.complete_games += 1
+            line[self.CG] += 1
         if is_game_finished:
-            self.games_finished += 1
-
-        if decision == 'W':
-            self.wins += 1
-        elif decision == 'L':
-            self.losses += 1
-        elif decision == 'S':
-            self.saves += 1
-        elif decision == 'BS':
-            self.blown_saves += 1
-
-    def calculate_era(self):
-        return (self.earned_runs / self.innings_pitched) * 9 if self.innings_pitched > 0 else 0
-
-    def calculate_whip(self):
-        return (self.walks + self.hits_allowed) / self.innings_pitched if self.innings_pitched > 0 else 0
-
-    def to_dict(self):
-        """Convert stats to dictionary for DataFrame export."""
-        return {
-            'Name': self.name,
-            'Team': self.team,
-            'W': self.wins,
-            'L': self.losses,
-            'G': self.games_played,
-            'GS': self.games_started,
-            'CG': self.complete_games,
-            'SV': self.saves,
-            'GF': self.games_finished,
-            'IP': round(self.innings_pitched, 1),
-            'R': self.runs_allowed,
-            'ER': self.earned_runs,
-            'ERA': round(self.calculate_era(), 2) if self.innings_pitched > 0 else 0.00,
-        }
-
-
-class SeasonPitcherTracker:
-    """Track pitcher stats across an entire season for all teams."""
-
-    def __init__(self):
-        # Dictionary: {team_id: {pitcher_name: PitcherStats}}
-        self.pitcher_stats = {}
-
-    def get_or_create_pitcher(self, team_id, team_name, pitcher_name, pitcher_type):
-        """Get existing pitcher stats or create new entry."""
-        if team_id not in self.pitcher_stats:
-            self.pitcher_stats[team_id] = {}
-
-        if pitcher_name not in self.pitcher_stats[team_id]:
-            self.pitcher_stats[team_id][pitcher_name] = PitcherStats(
-                name=pitcher_name,
-                team=team_name,
-                pitcher_type=pitcher_type
-            )
-
-        return self.pitcher_stats[team_id][pitcher_name]
+            line[self.GF] += 1
+        column = self.DECISIONS.get(decision)
+        if column is not None:
+            line[column] += 1
 
     def update_starter_stats(self, team_id, team_name, pitcher_name, innings, earned_runs,
                               unearned_runs=0, decision=None, is_complete_game=False):
         """Update stats for a starting pitcher."""
-        stats = self.get_or_create_pitcher(team_id, team_name, pitcher_name, 'Starter')
-        total_runs = earned_runs + unearned_runs
-        stats.update_stats(
-            innings=innings,
-            runs=total_runs,
-            earned_runs=earned_runs,
-            decision=decision,
-            is_start=True,
-            is_complete_game=is_complete_game
-        )
+        row = self.row_for(team_id, team_name, pitcher_name, 'Starter')
+        self.record_appearance(row, innings, earned_runs, unearned_runs, decision,
+                               is_start=True, is_complete_game=is_complete_game)
 
     def update_reliever_stats(self, team_id, team_name, pitcher_name, innings, earned_runs,
                                unearned_runs=0, decision=None, is_game_finished=False):
         """Update stats for a relief pitcher."""
-        stats = self.get_or_create_pitcher(team_id, team_name, pitcher_name, 'Reliever')
-        total_runs = earned_runs + unearned_runs
-        stats.update_stats(
-            innings=innings,
-            runs=total_runs,
-            earned_runs=earned_runs,
-            decision=decision,
-            is_game_finished=is_game_finished
+        row = self.row_for(team_id, team_name, pitcher_name, 'Reliever')
+        self.record_appearance(row, innings, earned_runs, unearned_runs, decision,
+                               is_game_finished=is_game_finished)
+
+    def record_game(self, result, team_names):
+        """Add every pitching line of a GameResult; team_names maps team_id -> team name."""
+        for team_id, pitcher_name, is_starter, innings, earned_runs, unearned_runs, decision, finished in result.pitching_lines():
+            if is_starter:
+                self.update_starter_stats(team_id, team_names[team_id], pitcher_name, innings, earned_runs,
+                                          unearned_runs, decision, is_complete_game=finished)
+            else:
+                self.update_reliever_stats(team_id, team_names[team_id], pitcher_name, innings, earned_runs,
+                                           unearned_runs, decision, is_game_finished=finished)
+
+    @classmethod
+    def from_game_log(cls, pitching, team_names=None):
+        """Build the season table from a pennant_fever_game_log pitching frame in one grouped pass."""
+        tracker = cls(capacity=1)
+        if pitching.empty:
+            return tracker
+        frame = pitching.assign(
+            G=1, GS=pitching['starter'], CG=pitching['starter'] & pitching['finished'],
+            GF=~pitching['starter'] & pitching['finished'], OUTS=pitching['outs'],
+            R=pitching['earned_runs'] + pitching['unearned_runs'], ER=pitching['earned_runs'],
+            W=pitching['decision'] == 'W', L=pitching['decision'] == 'L', SV=pitching['decision'] == 'S',
         )
+        grouped = frame.groupby(['team', 'pitcher'], sort=False)
+        counts = grouped[['G', 'GS', 'CG', 'GF', 'OUTS', 'R', 'ER', 'W', 'L', 'SV']].sum()
+        first_start = grouped['starter'].first()
+        tracker.stats = np.zeros((max(1, len(counts)), len(cls.COLUMNS)), dtype=np.int64)
+        for column in counts.columns:
+            tracker.stats[:len(counts), cls.COLUMNS.index(column)] = counts[column].to_numpy()
+        for row, ((team_id, pitcher_name), starter) in enumerate(first_start.items()):
+            tracker.rows[(team_id, pitcher_name)] = row
+            tracker.team_ids.append(team_id)
+            tracker.team_names.append(team_names.get(team_id, team_id) if team_names else team_id)
+            tracker.names.append(pitcher_name)
+            tracker.types.append('Starter' if starter else 'Reliever')
+        return tracker
+
+    def to_frame(self):
+        """The season table with IP (baseball notation) and ERA computed for every row at once."""
+        count = len(self.names)
+        stats = self.stats[:count]
+        outs = stats[:, self.OUTS]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            era = np.where(outs > 0, stats[:, self.ER] * 27 / outs, 0.0)
+        import pandas as pd
+        return pd.DataFrame({
+            'Name': self.names,
+            'Team': self.team_names,
+            'Type': self.types,
+            'W': stats[:, self.W],
+            'L': stats[:, self.L],
+            'G': stats[:, self.G],
+            'GS': stats[:, self.GS],
+            'CG': stats[:, self.CG],
+            'SV': stats[:, self.SV],
+            'GF': stats[:, self.GF],
+            'IP': outs // 3 + (outs % 3) / 10,
+            'R': stats[:, self.R],
+            'ER': stats[:, self.ER],
+            'ERA': np.round(era, 2),
+        })
+
+    def export(self, filepath):
+        """Write the season table as CSV or Parquet (by extension), or Excel for .xlsx."""
+        if filepath.endswith('.xlsx'):
+            return self.export_to_excel(filepath)
+        frame = self.to_frame()
+        if filepath.endswith('.parquet'):
+            frame.to_parquet(filepath, index=False)
+        else:
+            frame.to_csv(filepath, index=False)
+        logger.info(f"Pitcher stats exported to: {filepath} ({len(frame)} pitchers)")
 
     def export_to_excel(self, filepath):
-        """Export all pitcher stats to Excel with separate sheets for starters and relievers."""
-        starters_data = []
-        relievers_data = []
-
-        for team_id, pitchers in self.pitcher_stats.items():
-            for pitcher_name, stats in pitchers.items():
-                if stats.pitcher_type in ('SP', 'Starter'):
-                    starters_data.append(stats.to_dict())
-                else:
-                    relievers_data.append(stats.to_dict())
-
-        # Create DataFrames
-        starters_df = pd.DataFrame(starters_data)
-        relievers_df = pd.DataFrame(relievers_data)
+        """Export all pitcher stats to Excel with separate sheets for starters and relievers (slow; needs openpyxl)."""
+        import pandas as pd
+        frame = self.to_frame()
+        starters_df = frame[frame['Type'] == 'Starter'].drop(columns='Type')
+        relievers_df = frame[frame['Type'] != 'Starter'].drop(columns='Type')
 
         # Sort by ERA (ascending) for meaningful order
         if not starters_df.empty:
@@ -2182,137 +3638,551 @@ class SeasonPitcherTracker:
                 relievers_df.to_excel(writer, sheet_name='Relievers', index=False)
 
         logger.info(f"Pitcher stats exported to: {filepath}")
-        logger.info(f"  Starters: {len(starters_data)} pitchers")
-        logger.info(f"  Relievers: {len(relievers_data)} pitchers")
+        logger.info(f"  Starters: {len(starters_df)} pitchers")
+        logger.info(f"  Relievers: {len(relievers_df)} pitchers")
+
+class SeasonBattingStats:
+    """
+    Synthesized season batting lines for every lineup regular, one int64 row per
+    (team, player). The engine only produces team runs, so each team-game's hits,
+    home runs and walks are drawn from its runs and lineup ratings, then apportioned
+    to the lineup slots with multinomial draws for a whole day (or season) at once:
+        hits      runs + Poisson(EXTRA_HITS)
+        home runs Binomial(hits, HR_RATE + HR_RATE_PER_POWER * lineup power)
+        walks     Poisson(WALKS + WALKS_PER_EYE * lineup eye)
+    Home runs go by power, other hits by batting, walks by eye, runs scored by
+    batting + eye + speed and RBIs by batting + power. Plate appearances are
+    27 outs + hits + walks, handed out from the top of the order, then raised
+    wherever a spot's hits and walks exceed its share (so PA >= AB + BB).
+    """
+
+    COLUMNS = ('G', 'PA', 'AB', 'R', 'H', '2B', 'HR', 'RBI', 'BB')
+    LINEUP_SIZE = 9
+    EXTRA_HITS = 4.0
+    HR_RATE = 0.06
+    HR_RATE_PER_POWER = 0.015
+    WALKS = 1.5
+    WALKS_PER_EYE = 0.4
+    DOUBLE_RATE = 0.2
+
+    def __init__(self, teams):
+        self.team_index = {}  # team_id -> lineup index
+        self.team_ids = []
+        self.team_names = []
+        self.names = []
+        slots, weights, hr_rates, walk_means = [], {key: [] for key in ('hr', 'hit', 'bb', 'run', 'rbi')}, [], []
+        for team in teams:
+            lineup = [p for p in team.players if p.role == 'Starter'][:self.LINEUP_SIZE]
+            if not lineup:
+                continue
+            self.team_index[team.team_id] = len(slots)
+            rows = np.full(self.LINEUP_SIZE, -1, dtype=np.int64)
+            for spot, player in enumerate(lineup):
+                rows[spot] = len(self.names)
+                self.names.append(player.name)
+                self.team_ids.append(team.team_id)
+                self.team_names.append(team.team_name)
+            slots.append(rows)
+
+            batting, power, eye, speed = (roster_ratings(lineup, name) for name in ('batting', 'power', 'eye', 'speed'))
+            for key, rating in (('hr', power), ('hit', batting), ('bb', eye),
+                                ('run', batting + eye + speed), ('rbi', batting + power)):
+                # Ratings can be negative; every regular keeps some share
+                share = np.zeros(self.LINEUP_SIZE)
+                share[:len(lineup)] = np.maximum(rating, 0) + 1
+                weights[key].append(share / share.sum())
+            hr_rates.append(min(0.3, max(0.02, self.HR_RATE + self.HR_RATE_PER_POWER * power.mean())))
+            walk_means.append(max(0.0, self.WALKS + self.WALKS_PER_EYE * eye.mean()))
+
+        self.slots = np.array(slots, dtype=np.int64).reshape(-1, self.LINEUP_SIZE)
+        self.lineup_sizes = (self.slots >= 0).sum(axis=1)
+        self.weights = {key: np.array(value).reshape(-1, self.LINEUP_SIZE) for key, value in weights.items()}
+        self.hr_rates = np.array(hr_rates)
+        self.walk_means = np.array(walk_means)
+        self.stats = np.zeros((len(self.names), len(self.COLUMNS)), dtype=np.int64)
+
+    def add_games(self, team_ids, runs, rng=None):
+        """Draw and accumulate batting lines for many team-games at once (one entry per team per game)."""
+        rng = rng if rng is not None else np.random.default_rng()
+        lineups = np.array([self.team_index.get(team_id, -1) for team_id in team_ids], dtype=np.int64)
+        known = lineups >= 0
+        lineups = lineups[known]
+        runs = np.asarray(runs, dtype=np.int64)[known]
+        if not len(lineups):
+            return
+
+        hits = runs + rng.poisson(self.EXTRA_HITS, len(runs))
+        home_runs = rng.binomial(hits, self.hr_rates[lineups])
+        walks = rng.poisson(self.walk_means[lineups])
+
+        spot_home_runs = rng.multinomial(home_runs, self.weights['hr'][lineups])
+        spot_singles_doubles = rng.multinomial(hits - home_runs, self.weights['hit'][lineups])
+        spot_hits = spot_home_runs + spot_singles_doubles
+        spot_doubles = rng.binomial(spot_singles_doubles, self.DOUBLE_RATE)
+        spot_walks = rng.multinomial(walks, self.weights['bb'][lineups])
+        spot_runs = rng.multinomial(runs, self.weights['run'][lineups])
+        spot_rbi = rng.multinomial(runs, self.weights['rbi'][lineups])
+
+        sizes = self.lineup_sizes[lineups][:, None]
+        appearances = 27 + hits + walks
+        order = np.arange(self.LINEUP_SIZE)[None, :]
+        spot_pa = np.where(order < sizes, appearances[:, None] // sizes + (order < appearances[:, None] % sizes), 0)
+        spot_ab = np.maximum(spot_pa - spot_walks, spot_hits)
+        # A spot with more hits + walks than its share of appearances batted more often
+        spot_pa = np.maximum(spot_pa, spot_ab + spot_walks)
+
+        slots = self.slots[lineups]
+        columns = {'G': (slots >= 0).astype(np.int64), 'PA': spot_pa, 'AB': spot_ab, 'R': spot_runs, 'H': spot_hits,
+                   '2B': spot_doubles, 'HR': spot_home_runs, 'RBI': spot_rbi, 'BB': spot_walks}
+        lines = np.stack([columns[column] for column in self.COLUMNS], axis=-1)
+        filled = slots >= 0
+        np.add.at(self.stats, slots[filled], lines[filled])
+
+    def add_results(self, results, rng=None):
+        """Batting lines for a batch of GameResults (typically one day's games)."""
+        team_ids, runs = [], []
+        for result in results:
+            team_ids.extend((result.home_team_id, result.away_team_id))
+            runs.extend((result.home_runs, result.away_runs))
+        self.add_games(team_ids, runs, rng)
+
+    def add_game_log(self, games, rng=None):
+        """Batting lines for a whole season from a pennant_fever_game_log games frame (team ids stored as text)."""
+        by_text = {str(team_id): team_id for team_id in self.team_index}
+        team_ids = [by_text.get(team_id) for team_id in np.concatenate([games['home_team'], games['away_team']])]
+        runs = np.concatenate([games['home_runs'], games['away_runs']])
+        self.add_games(team_ids, runs, rng)
+
+    def to_frame(self):
+        """The season table with AVG, OBP, SLG and OPS computed for every row at once."""
+        import pandas as pd
+        stats = {column: self.stats[:, i] for i, column in enumerate(self.COLUMNS)}
+        total_bases = stats['H'] + stats['2B'] + 3 * stats['HR']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg = np.where(stats['AB'] > 0, stats['H'] / stats['AB'], 0.0)
+            obp = np.where(stats['PA'] > 0, (stats['H'] + stats['BB']) / stats['PA'], 0.0)
+            slg = np.where(stats['AB'] > 0, total_bases / stats['AB'], 0.0)
+        frame = pd.DataFrame({'Name': self.names, 'Team': self.team_names, **stats})
+        frame['AVG'] = np.round(avg, 3)
+        frame['OBP'] = np.round(obp, 3)
+        frame['SLG'] = np.round(slg, 3)
+        frame['OPS'] = np.round(obp + slg, 3)
+        return frame
+
+    def leaders(self, stat, n=10, min_pa=0):
+        frame = self.to_frame()
+        frame = frame[frame['PA'] >= min_pa]
+        return frame.sort_values([stat, 'PA'], ascending=False, kind='stable').head(n)
+
+    def export(self, filepath):
+        """Write the season table as CSV, or Parquet for a .parquet path."""
+        frame = self.to_frame()
+        if filepath.endswith('.parquet'):
+            frame.to_parquet(filepath, index=False)
+        else:
+            frame.to_csv(filepath, index=False)
+        logger.info(f"Batting stats exported to: {filepath} ({len(frame)} players)")
+
+class ReadOnlyDict(dict):
+    """A dict built from the standings arrays; writing to it raises instead of being silently lost."""
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Standings views are read-only; record games through Standings.record_game")
+
+    __setitem__ = __delitem__ = __ior__ = setdefault = pop = popitem = clear = update = _read_only
+
+    def __reduce__(self):
+        # Copies and pickles are plain (writable) dicts
+        return dict, (dict(self),)
+
 
 class Standings:
-    def __init__(self, sub_leagues, team_lookup):
-        self.teams_stats = {}  # Dictionary to store team stats keyed by team ID or name
+    """
+    League standings backed by flat per-team counter arrays.
+
+    Every team owns one row (slot) of self.counters, and team_index maps
+    team_id -> (league, division, slot), so recording a game is a handful of O(1)
+    increments. League-wide queries (win pct, leaders, games behind) are vectorized
+    over the arrays. The nested `standings` and `teams_stats` dicts the rest of the
+    game reads are read-only snapshots built from the arrays on every access, so
+    fetch them once outside a loop (or read counters/team_index directly).
+    """
+
+    COLUMNS = (
+        'wins', 'losses', 'run_scored', 'run_allowed',
+        'one_run_wins', 'one_run_losses', 'extra_innings_wins', 'extra_innings_losses',
+        'vs_rhp_wins', 'vs_rhp_losses', 'vs_lhp_wins', 'vs_lhp_losses',
+        'home_wins', 'home_losses', 'away_wins', 'away_losses',
+        'current_streak', 'longest_winning_streak', 'longest_losing_streak',
+    )
+    COL = {name: index for index, name in enumerate(COLUMNS)}
+
+    # Column offsets for a win or a loss: (record, one-run, extra innings, vs RHP, vs LHP, home, away)
+    RESULT_COLS = {
+        'wins': (0, 4, 6, 8, 10, 12, 14),
+        'losses': (1, 5, 7, 9, 11, 13, 15),
+    }
+
+    def __init__(self, sub_leagues, team_lookup, store=None):
         self.team_lookup = team_lookup  # Store the team lookup here
-        """Initialize standings, storing data by sub-league and division."""
-        self.standings = {}
+        self.store = store  # Optional StandingsStore (append-only game log + snapshots)
+        self.team_index = {}  # team_id -> (league, division, slot)
+        self.team_ids = []  # slot -> team_id
+        self.team_names = []  # slot -> team name
+        self.division_slots = {}  # (league, division) -> slots in league-file order
+        self.division_order = {}  # (league, division) -> team_ids kept sorted by win pct
+        self.rating_averages = {}  # team_id -> (avg BV, SV, RV); ratings don't change in-season
         for sub_league in sub_leagues:
             league_name = sub_league['sub_league_name']
-            self.standings[league_name] = {}
             for division in sub_league['divisions']:
                 division_name = division['division_name']
-                self.standings[league_name][division_name] = {team_id: {"wins": 0, "losses": 0} for team_id in division['teams']}
-    
-    def add_team(self, team_id, team_name):
-        if team_id not in self.teams_stats:
-            self.teams_stats[team_id] = {
-                'team_name': team_name,
-                'wins': 0,
-                'losses': 0,
-                'run_scored': 0,
-                'run_allowed': 0,
-                'one_run_games': {'wins': 0, 'losses': 0},
-                'extra_innings_games': {'wins': 0, 'losses': 0},
-                'vs_rhp': {'wins': 0, 'losses': 0},
-                'vs_lhp': {'wins': 0, 'losses': 0},
-                'pyth_wins': 0,  # Pythagorean wins
-                'pyth_losses': 0,  # Pythagorean losses
-                'luck': 0,  # Actual wins minus Pythagorean wins
-                'home_record': {'wins': 0, 'losses': 0},  # Home record
-                'away_record': {'wins': 0, 'losses': 0},  # Away record
-                'longest_winning_streak': 0,  # Longest winning streak
-                'longest_losing_streak': 0,  # Longest losing streak
-                'current_streak': 0  # Track the current streak (positive for winning, negative for losing)
-            }
-        
-    def update_team_stats(self, team_id, runs_scored, runs_allowed, is_one_run_game=False, is_extra_innings=False, pitcher_throws=None, team_lookup=None):
-        """Update team stats within the proper league and division."""
-        team_name = team_lookup[team_id].team_name
-        for league_name, divisions in self.standings.items():
-            for division_name, teams in divisions.items():
-                if team_id in teams:
-                    # Update wins/losses for the team
-                    if runs_scored > runs_allowed:
-                        teams[team_id]["wins"] += 1
-                    else:
-                        teams[team_id]["losses"] += 1
-                    break
+                key = (league_name, division_name)
+                slots = [self.add_slot(team_id, league_name, division_name) for team_id in division['teams']]
+                self.division_slots[key] = np.array(slots, dtype=np.intp)
+                self.division_order[key] = list(division['teams'])
+        self.counters = np.zeros((len(self.team_ids), len(self.COLUMNS)), dtype=np.int64)
+
+    def add_slot(self, team_id, league_name, division_name):
+        slot = len(self.team_ids)
+        team = self.team_lookup.get(team_id) if self.team_lookup else None
+        self.team_index[team_id] = (league_name, division_name, slot)
+        self.team_ids.append(team_id)
+        self.team_names.append(team.team_name if team is not None else str(team_id))
+        return slot
 
-        """Update stats for the team after a game, using the team_lookup to get team info."""
-        # Ensure team is added to standings if it doesn't exist
-        if team_id not in self.teams_stats:
+    def add_team(self, team_id, team_name):
+        """Add a team that isn't in any division (it gets a counters row but no division table)."""
+        if team_id not in self.team_index:
+            slot = self.add_slot(team_id, None, None)
+            self.team_names[slot] = team_name
+            self.counters = np.vstack([self.counters, np.zeros((1, len(self.COLUMNS)), dtype=np.int64)])
+
+    def record_game(self, day, home_team_id, away_team_id, result, team_lookup=None, log=True):
+        """Apply one game's deltas to both teams, re-sort their divisions and log the game."""
+        team_lookup = team_lookup if team_lookup is not None else self.team_lookup
+        is_one_run = result.get('is_one_run', False)
+        is_extra_innings = result.get('is_extra_innings', False)
+        self.update_team_stats(home_team_id, result['home_runs'], result['away_runs'], is_one_run, is_extra_innings, pitcher_throws=result['away_pitcher_throws'], team_lookup=team_lookup, is_home_game=True)
+        self.update_team_stats(away_team_id, result['away_runs'], result['home_runs'], is_one_run, is_extra_innings, pitcher_throws=result['home_pitcher_throws'], team_lookup=team_lookup, is_home_game=False)
+        home_division = self.team_index[home_team_id][:2]
+        self.resort_division(home_division)
+        if self.team_index[away_team_id][:2] != home_division:
+            self.resort_division(self.team_index[away_team_id][:2])
+
+        if log and self.store is not None:
+            self.store.append({
+                'day': day,
+                'home': home_team_id,
+                'away': away_team_id,
+                'home_runs': result['home_runs'],
+                'away_runs': result['away_runs'],
+                'is_one_run': is_one_run,
+                'is_extra_innings': is_extra_innings,
+                'home_pitcher_throws': result['home_pitcher_throws'],
+                'away_pitcher_throws': result['away_pitcher_throws'],
+            })
+
+    def update_team_stats(self, team_id, runs_scored, runs_allowed, is_one_run_game=False, is_extra_innings=False, pitcher_throws=None, team_lookup=None, is_home_game=None):
+        """Update one team's counters after a game (O(1) via the team index)."""
+        entry = self.team_index.get(team_id)
+        if entry is None:
             if team_lookup is None:
                 raise ValueError(f"team_lookup is required to add team {team_id} to standings")
-            
-            team_name = team_lookup[team_id].team_name  # Use the team_lookup to get the name
-            self.add_team(team_id, team_name)
-
-        # Fetch the team's stats
-        team_stats = self.teams_stats[team_id]
-        team_stats['run_scored'] += runs_scored
-        team_stats['run_allowed'] += runs_allowed
-        
-        # Update wins/losses and specific game type stats
-        if runs_scored > runs_allowed:
-            team_stats['wins'] += 1
-            if is_one_run_game:
-                team_stats['one_run_games']['wins'] += 1
-            if is_extra_innings:
-                team_stats['extra_innings_games']['wins'] += 1
-            # Track wins vs RHP/LHP using pitcher_throws
-            if pitcher_throws == 'R':
-                team_stats['vs_rhp']['wins'] += 1
-            elif pitcher_throws == 'L':
-                team_stats['vs_lhp']['wins'] += 1
+            self.add_team(team_id, team_lookup[team_id].team_name)
+            entry = self.team_index[team_id]
+
+        row = self.counters[entry[2]]
+        col = self.COL
+        row[col['run_scored']] += runs_scored
+        row[col['run_allowed']] += runs_allowed
+
+        won = runs_scored > runs_allowed
+        record, one_run, extra, vs_rhp, vs_lhp, home, away = self.RESULT_COLS['wins' if won else 'losses']
+        row[record] += 1
+        if is_one_run_game:
+            row[one_run] += 1
+        if is_extra_innings:
+            row[extra] += 1
+        # Track wins/losses vs RHP/LHP using pitcher_throws
+        if pitcher_throws == 'R':
+            row[vs_rhp] += 1
+        elif pitcher_throws == 'L':
+            row[vs_lhp] += 1
+        if is_home_game is True:
+            row[home] += 1
+        elif is_home_game is False:
+            row[away] += 1
+
+        # Streaks: positive for winning, negative for losing
+        streak = int(row[col['current_streak']])
+        if won:
+            streak = streak + 1 if streak >= 0 else 1
+            row[col['longest_winning_streak']] = max(row[col['longest_winning_streak']], streak)
         else:
-            team_stats['losses'] += 1
-            if is_one_run_game:
-                team_stats['one_run_games']['losses'] += 1
-            if is_extra_innings:
-                team_stats['extra_innings_games']['losses'] += 1
-            # Track losses vs RHP/LHP using pitcher_throws
-            if pitcher_throws == 'R':
-                team_stats['vs_rhp']['losses'] += 1
-            elif pitcher_throws == 'L':
-                team_stats['vs_lhp']['losses'] += 1
-
-    def calculate_championship_probability(self):
-        # Simulate the rest of the season multiple times (Monte Carlo)
-        simulations = 10000
-        playoff_wins = {team_id: 0 for team_id in self.teams_stats}
-
-        for _ in range(simulations):
-            simulated_standings = self.simulate_remaining_games()
-            playoff_winners = self.get_playoff_teams(simulated_standings)
-            for team_id in playoff_winners:
-                playoff_wins[team_id] += 1
-        
-        # Update playoff probability for each team
-        for team_id in self.teams_stats:
-            self.teams_stats[team_id]['playoff_prob'] = playoff_wins[team_id] / simulations
-
-    def calculate_cli(self, team_id, game_id):
-        # Simulate two scenarios for CLI: win and loss for a specific game
-        win_scenario = self.simulate_game_outcome(team_id, game_id, win=True)
-        lose_scenario = self.simulate_game_outcome(team_id, game_id, win=False)
-
-        win_prob = self.get_team_playoff_prob(team_id, win_scenario)
-        lose_prob = self.get_team_playoff_prob(team_id, lose_scenario)
+            streak = streak - 1 if streak <= 0 else -1
+            row[col['longest_losing_streak']] = max(row[col['longest_losing_streak']], -streak)
+        row[col['current_streak']] = streak
+
+    # --- Vectorized league-wide queries ------------------------------------------
+
+    def column(self, name):
+        return self.counters[:, self.COL[name]]
+
+    def win_pct(self):
+        wins = self.column('wins')
+        games = wins + self.column('losses')
+        return np.divide(wins, games, out=np.zeros(len(games), dtype=np.float64), where=games > 0)
+
+    def division_leaders(self):
+        """(league, division) -> slot of the team with the best win pct (first listed on ties)."""
+        pct = self.win_pct()
+        return {key: int(slots[np.argmax(pct[slots])]) for key, slots in self.division_slots.items() if len(slots)}
+
+    def games_behind(self):
+        """Games behind the division leader for every team, as {team_id: GB}."""
+        leader_slot = np.arange(len(self.team_ids))  # teams outside a division are their own leader
+        for key, leader in self.division_leaders().items():
+            leader_slot[self.division_slots[key]] = leader
+        wins = self.column('wins')
+        losses = self.column('losses')
+        gb = ((wins[leader_slot] - wins) + (losses - losses[leader_slot])) / 2
+        return {team_id: float(gb[slot]) for slot, team_id in enumerate(self.team_ids)}
+
+    def leaders(self, column='wins', n=5):
+        """Top n team_ids league-wide by a counter column (or 'win_pct' / 'run_differential')."""
+        if column == 'win_pct':
+            values = self.win_pct()
+        elif column == 'run_differential':
+            values = self.column('run_scored') - self.column('run_allowed')
+        else:
+            values = self.column(column)
+        top = np.argsort(-values, kind='stable')[:n]
+        return [(self.team_ids[slot], values[slot].item()) for slot in top]
+
+    def resort_division(self, key):
+        """Keep one division's order sorted by win pct (stable, so ties keep their current order)."""
+        order = self.division_order.get(key)
+        if not order:
+            return
+        pct = self.win_pct()[[self.team_index[team_id][2] for team_id in order]]
+        self.division_order[key] = [order[i] for i in np.argsort(-pct, kind='stable')]
+
+    def get_rating_averages(self, team_id):
+        averages = self.rating_averages.get(team_id)
+        if averages is None:
+            team_obj = self.team_lookup.get(team_id)
+            averages = (team_obj.get_avg_bv(), team_obj.get_avg_sv(), team_obj.get_avg_rv()) if team_obj else (0.0, 0.0, 0.0)
+            self.rating_averages[team_id] = averages
+        return averages
+
+    # --- Dict views for existing readers (Playoffs, snapshots, save_standings) ------
+
+    @property
+    def standings(self):
+        """{league: {division: {team_id: {'wins', 'losses'}}}} in league-file order (read-only)."""
+        view = {}
+        wins = self.column('wins')
+        losses = self.column('losses')
+        for (league_name, division_name), slots in self.division_slots.items():
+            view.setdefault(league_name, {})[division_name] = ReadOnlyDict(
+                (self.team_ids[slot], ReadOnlyDict(wins=int(wins[slot]), losses=int(losses[slot]))) for slot in slots
+            )
+        return ReadOnlyDict((league_name, ReadOnlyDict(divisions)) for league_name, divisions in view.items())
+
+    @property
+    def teams_stats(self):
+        """Per-team stats dict in the original standings.json layout (read-only)."""
+        stats = {}
+        for slot, team_id in enumerate(self.team_ids):
+            row = {name: int(value) for name, value in zip(self.COLUMNS, self.counters[slot])}
+            stats[team_id] = ReadOnlyDict({
+                'team_name': self.team_names[slot],
+                'wins': row['wins'],
+                'losses': row['losses'],
+                'run_scored': row['run_scored'],
+                'run_allowed': row['run_allowed'],
+                'one_run_games': ReadOnlyDict(wins=row['one_run_wins'], losses=row['one_run_losses']),
+                'extra_innings_games': ReadOnlyDict(wins=row['extra_innings_wins'], losses=row['extra_innings_losses']),
+                'vs_rhp': ReadOnlyDict(wins=row['vs_rhp_wins'], losses=row['vs_rhp_losses']),
+                'vs_lhp': ReadOnlyDict(wins=row['vs_lhp_wins'], losses=row['vs_lhp_losses']),
+                'pyth_wins': 0,  # Pythagorean wins (tracked on TeamStats)
+                'pyth_losses': 0,  # Pythagorean losses
+                'luck': 0,  # Actual wins minus Pythagorean wins
+                'home_record': ReadOnlyDict(wins=row['home_wins'], losses=row['home_losses']),
+                'away_record': ReadOnlyDict(wins=row['away_wins'], losses=row['away_losses']),
+                'longest_winning_streak': row['longest_winning_streak'],
+                'longest_losing_streak': row['longest_losing_streak'],
+                'current_streak': row['current_streak'],
+            })
+        return ReadOnlyDict(stats)
+
+    @teams_stats.setter
+    def teams_stats(self, stats):
+        """Load counters back from a teams_stats dict (JSON may have turned team ids into strings)."""
+        ids = {str(team_id): team_id for team_id in self.team_ids}
+        for raw_id, team in stats.items():
+            team_id = ids.get(str(raw_id), raw_id)
+            if team_id not in self.team_index:
+                self.add_team(team_id, team.get('team_name', str(team_id)))
+            row = self.counters[self.team_index[team_id][2]]
+            row[self.COL['wins']] = team.get('wins', 0)
+            row[self.COL['losses']] = team.get('losses', 0)
+            row[self.COL['run_scored']] = team.get('run_scored', 0)
+            row[self.COL['run_allowed']] = team.get('run_allowed', 0)
+            for group, prefix in (('one_run_games', 'one_run_'), ('extra_innings_games', 'extra_innings_'),
+                                  ('vs_rhp', 'vs_rhp_'), ('vs_lhp', 'vs_lhp_'),
+                                  ('home_record', 'home_'), ('away_record', 'away_')):
+                record = team.get(group, {})
+                row[self.COL[f"{prefix}wins"]] = record.get('wins', 0)
+                row[self.COL[f"{prefix}losses"]] = record.get('losses', 0)
+            for name in ('current_streak', 'longest_winning_streak', 'longest_losing_streak'):
+                row[self.COL[name]] = team.get(name, 0)
+        for key in self.division_order:
+            self.resort_division(key)
+
+    # --- Remaining-season Monte Carlo --------------------------------------------
+
+    def remaining_games(self, schedule, schedule_id_map, from_day):
+        """(home_team_id, away_team_id) for every scheduled game on or after from_day."""
+        games = []
+        for day in range(from_day, schedule.num_days + 1):
+            for game in schedule.get_games_for_day(day):
+                games.append((schedule_id_map[game['home']], schedule_id_map[game['away']]))
+        return games
 
-        # Return the Championship Leverage Index for this game
-        return abs(win_prob - lose_prob)
+    def default_win_probabilities(self, remaining_games, prior_games=20):
+        """
+        Home win probability for each remaining game via log5 on each team's win pct,
+        regressed toward .500 by prior_games so early-season records don't dominate.
+        """
+        wins = self.column('wins')
+        games = wins + self.column('losses')
+        strength = (wins + prior_games / 2) / (games + prior_games)
+        home = strength[[self.team_index[home_id][2] for home_id, _ in remaining_games]]
+        away = strength[[self.team_index[away_id][2] for _, away_id in remaining_games]]
+        return home * (1 - away) / (home * (1 - away) + away * (1 - home))
+
+    def game_slots(self, remaining_games):
+        home_slots = np.array([self.team_index[home_id][2] for home_id, _ in remaining_games], dtype=np.int64)
+        away_slots = np.array([self.team_index[away_id][2] for _, away_id in remaining_games], dtype=np.int64)
+        return home_slots, away_slots
+
+    def simulate_outcomes(self, win_probabilities, simulations=10000, rng=None):
+        """(simulations x games) boolean matrix, True where the home team wins."""
+        rng = rng if rng is not None else np.random.default_rng()
+        win_probabilities = np.asarray(win_probabilities, dtype=np.float32)
+        return rng.random((simulations, len(win_probabilities)), dtype=np.float32) < win_probabilities
+
+    def accumulate_wins(self, outcomes, home_slots, away_slots, chunk_size=1000):
+        """Scatter-add simulated wins onto the current win totals; returns (simulations x teams)."""
+        num_teams = len(self.team_ids)
+        simulations = outcomes.shape[0]
+        final_wins = np.empty((simulations, num_teams), dtype=np.int32)
+        current_wins = self.column('wins').astype(np.int32)
+        for start in range(0, simulations, chunk_size):
+            block = outcomes[start:start + chunk_size]
+            rows = block.shape[0]
+            winners = np.where(block, home_slots, away_slots)
+            winners += (np.arange(rows, dtype=np.int64) * num_teams)[:, None]
+            added = np.bincount(winners.ravel(), minlength=rows * num_teams).reshape(rows, num_teams)
+            final_wins[start:start + rows] = current_wins + added
+        return final_wins
+
+    def simulate_remaining_games(self, remaining_games, win_probabilities=None, simulations=10000, rng=None):
+        """Simulate the rest of the season; returns final wins as a (simulations x teams) array."""
+        if win_probabilities is None:
+            win_probabilities = self.default_win_probabilities(remaining_games)
+        home_slots, away_slots = self.game_slots(remaining_games)
+        outcomes = self.simulate_outcomes(win_probabilities, simulations, rng)
+        return self.accumulate_wins(outcomes, home_slots, away_slots)
+
+    def simulate_game_outcome(self, team_id, game_id, win, remaining_games, win_probabilities=None, simulations=10000, rng=None):
+        """Simulate the rest of the season with remaining game `game_id` forced to a win/loss for team_id."""
+        if win_probabilities is None:
+            win_probabilities = self.default_win_probabilities(remaining_games)
+        win_probabilities = np.array(win_probabilities, dtype=np.float64)
+        home_id, _ = remaining_games[game_id]
+        win_probabilities[game_id] = 1.0 if (team_id == home_id) == win else 0.0
+        return self.simulate_remaining_games(remaining_games, win_probabilities, simulations, rng)
+
+    def league_slots(self):
+        """League name -> list of division slot arrays, in league-file order."""
+        leagues = {}
+        for (league_name, _), slots in self.division_slots.items():
+            leagues.setdefault(league_name, []).append(slots)
+        return leagues
+
+    def get_playoff_teams(self, final_wins):
+        """
+        Seed every simulation with the same rules as Playoffs.seed_teams: the division
+        winner is the first team in league-file order with the most wins, and the
+        wildcard is the first non-winner in the sub-league with the most wins.
+        Returns boolean (simulations x teams) masks: division winners, wildcards.
+        """
+        division_winners = np.zeros(final_wins.shape, dtype=bool)
+        wildcards = np.zeros(final_wins.shape, dtype=bool)
+        for divisions in self.league_slots().values():
+            league = np.concatenate(divisions)
+            league_winners, league_wildcards = self.seed_league(final_wins[:, league], divisions)
+            division_winners[:, league] = league_winners
+            wildcards[:, league] = league_wildcards
+        return division_winners, wildcards
 
-    def simulate_remaining_games(self):
-        # Randomly simulate outcomes of the remaining games for the season
-        # Update standings based on random outcomes
-        pass
-    
-    def simulate_game_outcome(self, team_id, game_id, win):
-        # Simulate the season with a specific game outcome (win/loss)
-        pass
+    @staticmethod
+    def seed_league(league_wins, divisions):
+        """
+        Seed one sub-league. league_wins holds the league's columns (divisions concatenated
+        in order); returns (division winner, wildcard) masks of the same shape.
+        """
+        rows = np.arange(league_wins.shape[0])
+        division_winners = np.zeros(league_wins.shape, dtype=bool)
+        wildcards = np.zeros(league_wins.shape, dtype=bool)
+        offset = 0
+        for slots in divisions:
+            block = league_wins[:, offset:offset + len(slots)]
+            division_winners[rows, offset + np.argmax(block, axis=1)] = True
+            offset += len(slots)
+        if league_wins.shape[1] > len(divisions):  # otherwise every team already won its division
+            candidate_wins = np.where(division_winners, -1, league_wins)
+            wildcards[rows, np.argmax(candidate_wins, axis=1)] = True
+        return division_winners, wildcards
+
+    def calculate_championship_probability(self, remaining_games, win_probabilities=None, simulations=10000, rng=None):
+        """
+        Monte Carlo the remaining schedule and return {team_id: playoff probability}.
+        Division and playoff odds are also kept on self.playoff_odds.
+        """
+        final_wins = self.simulate_remaining_games(remaining_games, win_probabilities, simulations, rng)
+        division_winners, wildcards = self.get_playoff_teams(final_wins)
+        division_odds = division_winners.mean(axis=0)
+        playoff_odds = (division_winners | wildcards).mean(axis=0)
+        mean_wins = final_wins.mean(axis=0)
+
+        self.playoff_odds = {
+            team_id: {
+                'playoff_prob': float(playoff_odds[slot]),
+                'division_prob': float(division_odds[slot]),
+                'mean_wins': float(mean_wins[slot]),
+            }
+            for slot, team_id in enumerate(self.team_ids)
+        }
+        return {team_id: odds['playoff_prob'] for team_id, odds in self.playoff_odds.items()}
 
-    def get_playoff_teams(self, standings):
-        # Determine which teams make the playoffs based on standings
-        pass
+    def calculate_cli(self, team_id, game_id, remaining_games, win_probabilities=None, simulations=10000, rng=None):
+        """
+        Championship Leverage Index of one remaining game for team_id: the absolute
+        difference between its playoff probability with a win and with a loss. Both
+        scenarios share one set of simulated outcomes (see LeverageIndex for the
+        whole-schedule version, whose per-team values keep the sign).
+        """
+        leverage = LeverageIndex(self, remaining_games, win_probabilities, simulations, rng)
+        return abs(leverage.team_leverage(team_id, game_id))
 
-    def get_team_playoff_prob(self, team_id, standings):
-        # Get the probability of a specific team making playoffs from standings
-        return standings[team_id]['playoff_prob']
+    def get_team_playoff_prob(self, team_id, final_wins):
+        # Get the probability of a specific team making playoffs from simulated final wins
+        division_winners, wildcards = self.get_playoff_teams(final_wins)
+        slot = self.team_index[team_id][2]
+        return float((division_winners[:, slot] | wildcards[:, slot]).mean())
 
     def save_standings(self, file_name='standings.json'):
         """Save the standings to a JSON file."""
@@ -2327,6 +4197,7 @@ class Standings:
     
     def display_standings(self, team_stats_lookup):
         """Display the standings for each sub-league and division."""
+        games_behind_lookup = self.games_behind()
         for league_name, divisions in self.standings.items():
             logger.info(f"\n{league_name} Standings")
             logger.info("=" * (len(league_name) + 10))
@@ -2335,23 +4206,17 @@ class Standings:
                 logger.info("-" * (len(division_name) + 10))
                 logger.info(f"{'Team':<20} {'W':<5} {'L':<5} {'PCT':<6} {'GB':<5} {'R/G':<5} {'RS':<5} {'RA':<5} {'BV':<5} {'SV':<5} {'RV':<5} {'Pyth W-L':<10} {'Luck':<5} {'Home':<10} {'Away':<10} {'1-Run':<10} {'Extra':<10} {'vs RHP':<10} {'vs LHP':<10}")
 
-                # Get the stats for the teams and sort them by win percentage
+                # Teams come out of the incrementally maintained division order (by win percentage)
                 team_list = []
-                for team_id, record in teams.items():
+                for team_id in self.division_order[(league_name, division_name)]:
+                    record = teams[team_id]
                     team_stats = team_stats_lookup[team_id]
                     win_pct = team_stats.calculate_win_loss_percentage()
                     team_list.append((team_id, record['wins'], record['losses'], win_pct, team_stats))
-                
-                # Sort the teams based on win percentage, descending
-                team_list.sort(key=lambda x: x[3], reverse=True)
-
-                # Determine the division leader
-                leader_wins = team_list[0][1]
-                leader_losses = team_list[0][2]
 
                 # logger.debug the sorted teams with all stats
                 for team_id, wins, losses, win_pct, team_stats in team_list:
-                    games_behind = team_stats.games_behind(leader_wins, leader_losses)
+                    games_behind = games_behind_lookup[team_id]
                     games_played = wins + losses
                     runs_per_game = round(team_stats.run_scored / games_played, 1) if games_played > 0 else 0.0
                     home_record = f"{team_stats.home_wins}-{team_stats.home_losses}"
@@ -2361,21 +4226,221 @@ class Standings:
                     vs_rhp_record = f"{team_stats.vs_rhp['wins']}-{team_stats.vs_rhp['losses']}"
                     vs_lhp_record = f"{team_stats.vs_lhp['wins']}-{team_stats.vs_lhp['losses']}"
 
-                    # Get team rating averages (BV, SV, RV)
-                    team_obj = self.team_lookup.get(team_id)
-                    avg_bv = team_obj.get_avg_bv() if team_obj else 0.0
-                    avg_sv = team_obj.get_avg_sv() if team_obj else 0.0
-                    avg_rv = team_obj.get_avg_rv() if team_obj else 0.0
+                    # Get team rating averages (BV, SV, RV), computed once per team
+                    avg_bv, avg_sv, avg_rv = self.get_rating_averages(team_id)
 
                     logger.info(f"{team_stats.team_name:<20} {wins:<5} {losses:<5} {win_pct:<6} {games_behind:<5} {runs_per_game:<5} {team_stats.run_scored:<5} {team_stats.run_allowed:<5} {avg_bv:<5} {avg_sv:<5} {avg_rv:<5} {team_stats.pyth_wins}-{team_stats.pyth_losses:<10} {team_stats.luck:<5} {home_record:<10} {away_record:<10} {one_run_record:<10} {extra_innings_record:<10} {vs_rhp_record:<10} {vs_lhp_record:<10}")
 
+class LeverageIndex:
+    """
+    Championship Leverage Index (CLI) for remaining games using common random numbers.
+
+    One (simulations x games) outcome matrix is simulated up front and shared by
+    every query. The leverage of a game is found by flipping that single game's
+    column for the sims where it went the other way. Only the sub-league(s) of the two
+    teams involved are re-seeded; every other game and team keeps the same outcomes,
+    so the difference isolates the game itself instead of Monte Carlo noise.
+    """
+
+    def __init__(self, standings, remaining_games, win_probabilities=None, simulations=10000, rng=None, days=None):
+        self.standings = standings
+        self.remaining_games = list(remaining_games)
+        self.days = days  # optional day for each remaining game (see from_schedule)
+        if win_probabilities is None:
+            win_probabilities = standings.default_win_probabilities(self.remaining_games)
+        self.win_probabilities = np.asarray(win_probabilities, dtype=np.float64)
+        self.home_slots, self.away_slots = standings.game_slots(self.remaining_games)
+        self.outcomes = standings.simulate_outcomes(self.win_probabilities, simulations, rng)
+        self.final_wins = standings.accumulate_wins(self.outcomes, self.home_slots, self.away_slots)
+
+        # Column layout per sub-league so a flip only re-seeds the leagues it touches
+        self.leagues = {}
+        self.slot_league = {}
+        for league_name, divisions in standings.league_slots().items():
+            league = np.concatenate(divisions)
+            self.leagues[league_name] = (league, divisions)
+            for position, slot in enumerate(league):
+                self.slot_league[int(slot)] = (league_name, position)
+
+        division_winners, wildcards = standings.get_playoff_teams(self.final_wins)
+        self.playoff_probs = (division_winners | wildcards).mean(axis=0)
+
+    @classmethod
+    def from_schedule(cls, standings, schedule, schedule_id_map, from_day, **kwargs):
+        games, days = [], []
+        for day in range(from_day, schedule.num_days + 1):
+            for game in schedule.get_games_for_day(day):
+                games.append((schedule_id_map[game['home']], schedule_id_map[game['away']]))
+                days.append(day)
+        return cls(standings, games, days=days, **kwargs)
+
+    def playoff_probability(self, team_id):
+        return float(self.playoff_probs[self.standings.team_index[team_id][2]])
+
+    def flipped_playoff_masks(self, game_id):
+        """
+        Playoff membership of the home and away team, per simulation, with the game
+        forced to a home win and to a home loss: returns (home_if_win, home_if_loss,
+        away_if_win, away_if_loss), where win/loss is from the home team's side.
+        """
+        home_slot = int(self.home_slots[game_id])
+        away_slot = int(self.away_slots[game_id])
+        home_won = self.outcomes[:, game_id]
+
+        results = []
+        for home_wins_game in (True, False):
+            # Sims where the shared outcome disagrees with the forced result move one win across
+            flip = ~home_won if home_wins_game else home_won
+            delta = np.where(flip, 1 if home_wins_game else -1, 0).astype(np.int32)
+            masks = {}
+            for league_name in {self.slot_league[home_slot][0], self.slot_league[away_slot][0]}:
+                league, divisions = self.leagues[league_name]
+                wins = self.final_wins[:, league].copy()
+                for slot, sign in ((home_slot, 1), (away_slot, -1)):
+                    owner, position = self.slot_league[slot]
+                    if owner == league_name:
+                        wins[:, position] += sign * delta
+                division_winners, wildcards = self.standings.seed_league(wins, divisions)
+                playoffs = division_winners | wildcards
+                for slot in (home_slot, away_slot):
+                    owner, position = self.slot_league[slot]
+                    if owner == league_name:
+                        masks[slot] = playoffs[:, position]
+            results.append((masks[home_slot], masks[away_slot]))
+        (home_if_win, away_if_home_win), (home_if_loss, away_if_home_loss) = results
+        return home_if_win, home_if_loss, away_if_home_win, away_if_home_loss
+
+    def game_leverage(self, game_id):
+        """CLI row for one remaining game."""
+        home_if_win, home_if_loss, away_if_home_win, away_if_home_loss = self.flipped_playoff_masks(game_id)
+        home_id, away_id = self.remaining_games[game_id]
+        home_cli = float(home_if_win.mean() - home_if_loss.mean())
+        away_cli = float(away_if_home_loss.mean() - away_if_home_win.mean())
+        return {
+            'game_id': game_id,
+            'day': self.days[game_id] if self.days is not None else None,
+            'home': home_id,
+            'away': away_id,
+            'home_win_prob': float(self.win_probabilities[game_id]),
+            'home_playoff_prob': self.playoff_probability(home_id),
+            'away_playoff_prob': self.playoff_probability(away_id),
+            'home_cli': home_cli,
+            'away_cli': away_cli,
+            'max_cli': max(home_cli, away_cli),
+        }
+
+    def team_leverage(self, team_id, game_id):
+        """Signed CLI of one game for one of its two teams (win minus loss playoff probability)."""
+        home_id, away_id = self.remaining_games[game_id]
+        if team_id not in (home_id, away_id):
+            raise ValueError(f"Team {team_id} does not play remaining game {game_id} ({home_id} vs {away_id})")
+        row = self.game_leverage(game_id)
+        return row['home_cli'] if team_id == home_id else row['away_cli']
+
+    def leverage_table(self, game_ids=None):
+        """Per-game CLI rows, highest leverage first."""
+        if game_ids is None:
+            game_ids = range(len(self.remaining_games))
+        rows = [self.game_leverage(game_id) for game_id in game_ids]
+        rows.sort(key=lambda row: row['max_cli'], reverse=True)
+        return rows
+
+    def leverage_for_day(self, day):
+        """CLI rows for every game on one day (requires days, e.g. from from_schedule)."""
+        if self.days is None:
+            raise ValueError("leverage_for_day needs the day of each game; build the LeverageIndex "
+                             "with days=... or LeverageIndex.from_schedule")
+        return self.leverage_table([game_id for game_id, game_day in enumerate(self.days) if game_day == day])
+
+class StandingsStore:
+    """
+    Incremental persistence for Standings: an append-only JSONL log with one line
+    per game, plus a periodic snapshot of the full standings. The snapshot records
+    how many log lines it already includes, so load() only replays the tail.
+    """
+
+    def __init__(self, log_path, snapshot_path, snapshot_interval=STANDINGS_SNAPSHOT_INTERVAL):
+        self.log_path = log_path
+        self.snapshot_path = snapshot_path
+        self.snapshot_interval = snapshot_interval
+        self.pending = []
+        self.games_logged = 0
+
+    def reset(self):
+        """Start a new season: empty log, no snapshot."""
+        self.pending = []
+        self.games_logged = 0
+        open(self.log_path, 'w').close()
+        if os.path.exists(self.snapshot_path):
+            os.remove(self.snapshot_path)
+
+    def append(self, record):
+        self.pending.append(record)
+
+    def flush(self):
+        if not self.pending:
+            return
+        with open(self.log_path, 'a') as file:
+            file.write(''.join(json.dumps(record, separators=(',', ':')) + '\n' for record in self.pending))
+        self.games_logged += len(self.pending)
+        self.pending = []
+
+    def end_of_day(self, standings, day):
+        """Flush the day's games and snapshot every snapshot_interval days."""
+        self.flush()
+        if self.snapshot_interval and day % self.snapshot_interval == 0:
+            self.snapshot(standings, day)
+
+    def snapshot(self, standings, day):
+        """Write the full standings atomically (temp file + rename)."""
+        self.flush()
+        temp_path = f"{self.snapshot_path}.tmp"
+        with open(temp_path, 'w') as file:
+            json.dump({
+                'day': day,
+                'games_logged': self.games_logged,
+                'teams_stats': standings.teams_stats,
+            }, file)
+        os.replace(temp_path, self.snapshot_path)
+        logger.debug(f"Standings snapshot written for day {day} ({self.games_logged} games)")
+
+    def load(self, standings):
+        """Restore standings from the latest snapshot plus the log tail; returns the last day seen."""
+        last_day = 0
+        games_in_snapshot = 0
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'r') as file:
+                snapshot = json.load(file)
+            standings.teams_stats = snapshot['teams_stats']
+            last_day = snapshot['day']
+            games_in_snapshot = snapshot['games_logged']
+
+        self.games_logged = 0
+        if os.path.exists(self.log_path):
+            with open(self.log_path, 'r') as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break  # torn final line from an interrupted write
+                    self.games_logged += 1
+                    if self.games_logged <= games_in_snapshot:
+                        continue
+                    standings.record_game(record['day'], record['home'], record['away'], record, log=False)
+                    last_day = max(last_day, record['day'])
+        return last_day
+
 class Playoffs:
-    def __init__(self, standings, team_stats_lookup, power_chart, speed_bench_chart, relief_defense_chart):
+    def __init__(self, standings, team_stats_lookup, power_chart, speed_bench_chart, relief_defense_chart, matchup_cache=None, rng=None, charts=None):
         self.standings = standings
         self.team_stats_lookup = team_stats_lookup
         self.power_chart = power_chart
         self.speed_bench_chart = speed_bench_chart
         self.relief_defense_chart = relief_defense_chart
+        self.charts = charts
+        self.matchup_cache = matchup_cache
+        self.rng = rng
+        self.league_champions = {}  # 'AL'/'NL' -> pennant winner team_id, filled by simulate_playoffs
 
         # Initialize playoff teams, seeded by their regular season record
         self.playoff_teams = {
@@ -2408,12 +4473,15 @@ class Playoffs:
             "National League": "NL"
         }
         
+        # Both views are rebuilt from the counters on every access; take them once
+        standings_view = self.standings.standings
+        teams_stats = self.standings.teams_stats
         for league_name in ['American League', 'National League']:
             logger.debug(f"Seeding teams from league: {league_name}")
             
             # Get the sub-leagues from the standings
             league_abbr = league_mapping[league_name]  # Use 'AL' or 'NL'
-            league_standings = self.standings.standings[league_name]
+            league_standings = standings_view[league_name]
             division_winners = []
             wildcard_candidates = []
 
@@ -2436,7 +4504,7 @@ class Playoffs:
             self.playoff_teams[league_abbr]['division_winners'] = division_winners
 
             # Determine the wildcard team (team with most wins from wildcard candidates)
-            wildcard_team = max(wildcard_candidates, key=lambda team_id: self.standings.teams_stats[team_id]['wins'])
+            wildcard_team = max(wildcard_candidates, key=lambda team_id: teams_stats[team_id]['wins'])
             self.playoff_teams[league_abbr]['wildcard'] = wildcard_team
 
         logger.info(f"Playoff teams seeded: {self.playoff_teams}")
@@ -2464,7 +4532,7 @@ class Playoffs:
                     pitcher.last_start_day = 0  # Safety check
 
             # Simulate a single game between home and away teams
-            game = Game(home_team, away_team, self.current_day, power_chart=self.power_chart, speed_bench_chart=self.speed_bench_chart, relief_defense_chart=self.relief_defense_chart)
+            game = Game(home_team, away_team, self.current_day, power_chart=self.power_chart, speed_bench_chart=self.speed_bench_chart, relief_defense_chart=self.relief_defense_chart, matchup_cache=self.matchup_cache, rng=self.rng, charts=self.charts)
 
             result = game.play_game(self.current_day)
 
@@ -2500,12 +4568,12 @@ class Playoffs:
             logger.info(f"{team2.team_name} wins the series 4 games to {team1_wins}")
             return team2  # Team 2 wins the series
 
-    def simulate_playoffs(self):
+    def simulate_playoffs(self, regular_season_days=186):
         """Simulate the entire playoffs."""
         self.seed_teams()
 
         # Set the playoff start day to be 3 days after the last regular season game
-        playoff_start_day = 186 + 3  # Day 189
+        playoff_start_day = regular_season_days + 3  # Day 189 for a 186-day season
         self.current_day = playoff_start_day  # Ensure playoff games use the new start day
         logger.debug(f"Playoffs starting on day: {self.current_day}")
         
@@ -2553,6 +4621,8 @@ class Playoffs:
         # NL Championship Series
         nl_champion = self.simulate_series(nl_series_1_winner, nl_series_2_winner)
 
+        self.league_champions = {'AL': al_champion.team_id, 'NL': nl_champion.team_id}
+
         # World Series
         world_series_winner = self.simulate_series(al_champion, nl_champion)
 
@@ -2579,8 +4649,9 @@ class Ballpark:
         self.home_team_ballpark = None
 
 class Injury:
-    def __init__(self, team):
+    def __init__(self, team, rng=None):
         self.team = team  # Store the team information for player selection
+        self.rng = rng
 
     def check_injury(self):
         # Roll to determine which player might get injured
@@ -2602,11 +4673,12 @@ class Injury:
 
     def roll_dice(self):
         # Roll three dice and return the results
-        return [random.randint(1, 6) for _ in range(3)]
+        dice = Dice(6, self.rng)
+        return [dice.roll() for _ in range(3)]
 
     def roll_for_injured_player(self):
         # Randomly select a player from the team's roster using a d66 roll equivalent
-        dice = Dice(6)
+        dice = Dice(6, self.rng)
         player_index = dice.roll() - 1  # Adjusting for 1-based index
         return self.team.players[player_index]
 
@@ -2642,7 +4714,8 @@ class General_Manager:
     def __init__(self, general_manager_data):
         self.general_manager_data = general_manager_data
 
-def load_team_from_json(file_path):
+def load_team_from_json(file_path, roster=None):
+    """Build a Team from its JSON file; players and pitchers get rows in `roster` (default store if None)."""
     logger.debug(f"Loading team data from file: {file_path}")
     
     try:
@@ -2652,7 +4725,7 @@ def load_team_from_json(file_path):
         logger.debug(f"Error reading JSON file: {file_path} - {e}")
         return None
 
-    logger.debug(f"Team data loaded successfully: {data}")  # Check if JSON is being loaded correctly
+    logger.debug(f"Team data loaded successfully: {data.get('team_name')}")
 
     # Extract the team_id from the JSON (assume it's included in the JSON data)
     team_id = data.get('team_id')
@@ -2677,7 +4750,8 @@ def load_team_from_json(file_path):
                 salary=p.get('salary', 0),
                 sho_rating=p.get('sho_rating', p.get('SHO_rating', 666)),  # Support both cases
                 fatigue=p.get('fatigue', 0),
-                clutch=p.get('clutch', 0)
+                clutch=p.get('clutch', 0),
+                roster=roster
             )
             # Ensure `last_start_day` is initialized
             pitcher.last_start_day = p.get('last_start_day', 0)  # Default to 0 if not available
@@ -2705,7 +4779,8 @@ def load_team_from_json(file_path):
                 bats=pl.get('bats', 'R'),  # Default to 'R' if not provided
                 injury=pl.get('injury', 0),
                 salary=pl.get('salary', 0),
-                eye=pl.get('eye', 0)
+                eye=pl.get('eye', 0),
+                roster=roster
             )
             players.append(player)
         except Exception as e:
@@ -2736,12 +4811,291 @@ def load_team_from_json(file_path):
         logger.debug(f"Error creating team: {data.get('team_name', 'Unknown')} - {e}")
         return None
 
-def main():
+# =============================================================================
+# LEAGUE BUNDLE - one file per league and season instead of a JSON file per team
+# =============================================================================
+#
+# Layout: BUNDLE_MAGIC, u4 format version, u4 header length, the UTF-8 JSON header,
+# then the roster rating columns as raw little-endian arrays at 8-byte-aligned
+# offsets listed in the header. The header holds the league document, the chart
+# document, the schedule, each team's fields and roster slices, every player's and
+# pitcher's string fields, the column schema it was written with, and the mtime,
+# size and sha256 of every source file (league file, charts.json, schedule file,
+# team JSON files) so load_league() can tell when the bundle is out of date.
+
+BUNDLE_MAGIC = b'PFLEAGUE'
+BUNDLE_VERSION = 2
+BUNDLE_SUFFIX = '.pfbundle'
+
+BUNDLE_PLAYER_STRINGS = ('name', 'role', 'position', 'sec_position', 'bats')
+BUNDLE_PITCHER_STRINGS = ('name', 'throws', 'type')
+BUNDLE_TEAM_FIELDS = ('team_id', 'team_name', 'unearned_runs_chart', 'stadium_value', 'home_field_advantage',
+                      'weather_value', 'minors', 'budget')
+
+
+def get_league_file_name():
+    """League structure file for the current LEAGUE_TYPE."""
+    return 'league_fictional.json' if LEAGUE_TYPE == "fictional" else 'league.json'
+
+
+def league_bundle_path():
+    """Bundle for the current LEAGUE_TYPE, kept with that league's team JSON files."""
+    stem = os.path.splitext(get_league_file_name())[0]
+    return os.path.join(str(get_team_json_directory()), stem + BUNDLE_SUFFIX)
+
+
+def bundle_schema():
+    return {
+        'players': {'strings': list(BUNDLE_PLAYER_STRINGS), 'ratings': list(RosterStore.PLAYER_RATINGS), 'days': []},
+        'pitchers': {'strings': list(BUNDLE_PITCHER_STRINGS), 'ratings': list(RosterStore.PITCHER_RATINGS),
+                     'days': list(RosterStore.PITCHER_DAYS)},
+    }
+
+
+def league_source_files(league_data):
+    """Files a bundle of the current LEAGUE_TYPE is built from (listed even if they don't exist)."""
+    team_json_dir = str(get_team_json_directory())
+    team_ids = [team_id for sub_league in league_data['sub_leagues'] for division in sub_league['divisions']
+                for team_id in division['teams']]
+    return ([os.path.join(BASE_DIRECTORY, get_league_file_name()),
+             os.path.join(BASE_DIRECTORY, CHARTS_FILE_NAME),
+             os.path.join(BASE_DIRECTORY, league_data['schedule_name'])] +
+            [os.path.join(team_json_dir, f'team_id_{team_id}.json') for team_id in team_ids])
+
+
+def source_stamps(paths):
+    """path -> {mtime_ns, size, sha256}, or None for a file that doesn't exist."""
+    stamps = {}
+    for path in paths:
+        if os.path.exists(path):
+            stat = os.stat(path)
+            stamps[path] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': file_hash(path)}
+        else:
+            stamps[path] = None
+    return stamps
+
+
+def stale_bundle_sources(header):
+    """
+    Source files that changed, appeared or disappeared since the bundle was written.
+    A file whose mtime or size moved but whose sha256 still matches is unchanged.
+    """
+    stale = []
+    for path, stamp in header['sources'].items():
+        if not os.path.exists(path):
+            if stamp is not None:
+                stale.append(path)
+            continue
+        if stamp is None:
+            stale.append(path)
+            continue
+        stat = os.stat(path)
+        if stat.st_mtime_ns == stamp['mtime_ns'] and stat.st_size == stamp['size']:
+            continue
+        if file_hash(path) != stamp['sha256']:
+            stale.append(path)
+    return stale
+
+
+def write_league_bundle(path, league, chart_doc=None, sources=None):
+    """
+    Write a load_league() result as a bundle. Teams are stored in all_team_ids
+    order; chart_doc defaults to chart_document() (charts.json or the built-ins)
+    and sources to league_source_files() for the league document.
+    """
+    schema = bundle_schema()
+    teams = []
+    rosters = {'players': [], 'pitchers': []}
+    for team_id in league['all_team_ids']:
+        team = league['team_lookup'].get(team_id)
+        if team is None:
+            continue
+        entry = {'key': team_id}
+        entry.update({field: getattr(team, field) for field in BUNDLE_TEAM_FIELDS})
+        entry.update(ballpark_name=team.ballpark.ballpark_name, ballpark_capacity=team.ballpark.ballpark_capacity,
+                     ballpark_weather=team.ballpark.ballpark_weather)
+        for group in ('players', 'pitchers'):
+            start = len(rosters[group])
+            rosters[group].extend(getattr(team, group))
+            entry[group] = [start, len(rosters[group])]
+        teams.append(entry)
+
+    header = {
+        'version': BUNDLE_VERSION,
+        'schema': schema,
+        'league': league['league_data'],
+        'charts': chart_doc if chart_doc is not None else chart_document(),
+        'schedule': league['schedule'].schedule,
+        'teams': teams,
+        'sources': source_stamps(sources if sources is not None else league_source_files(league['league_data'])),
+        'columns': {},
+    }
+    blocks = []
+    for group, objects in rosters.items():
+        header[group] = {'count': len(objects),
+                         'strings': {field: [getattr(obj, field) for obj in objects] for field in schema[group]['strings']}}
+        for name in schema[group]['ratings']:
+            blocks.append((f'{group}.{name}', np.array([getattr(obj, name) for obj in objects], dtype='<f8')))
+        for name in schema[group]['days']:
+            blocks.append((f'{group}.{name}', np.array([NO_DAY if getattr(obj, name) is None else getattr(obj, name)
+                                                        for obj in objects], dtype='<i8')))
+
+    # Column offsets depend on the header length, which depends on the offsets: lay out until it settles
+    encoded = b''
+    while True:
+        offset = len(BUNDLE_MAGIC) + 8 + len(encoded)
+        offset += -offset % 8
+        for key, array in blocks:
+            header['columns'][key] = [offset, len(array), array.dtype.str]
+            offset += array.nbytes + (-array.nbytes % 8)
+        laid_out = json.dumps(header, separators=(',', ':')).encode('utf-8')
+        settled = len(laid_out) == len(encoded)
+        encoded = laid_out
+        if settled:
+            break
+
+    with open(path, 'wb') as f:
+        f.write(BUNDLE_MAGIC)
+        f.write(struct.pack('<II', BUNDLE_VERSION, len(encoded)))
+        f.write(encoded)
+        for key, array in blocks:
+            f.seek(header['columns'][key][0])
+            f.write(array.tobytes())
+        f.truncate(offset)
+    logger.info(f"Wrote league bundle {path}: {len(teams)} teams, {len(rosters['players'])} players, "
+                f"{len(rosters['pitchers'])} pitchers")
+
+
+def read_bundle_header(path):
+    """Validate a bundle's magic, version and schema; returns the parsed header."""
+    with open(path, 'rb') as f:
+        prefix = f.read(len(BUNDLE_MAGIC) + 8)
+        if not prefix.startswith(BUNDLE_MAGIC) or len(prefix) < len(BUNDLE_MAGIC) + 8:
+            raise ValueError(f"{path} is not a Pennant Fever league bundle")
+        version, header_length = struct.unpack_from('<II', prefix, len(BUNDLE_MAGIC))
+        if version != BUNDLE_VERSION:
+            raise ValueError(f"{path} is bundle format {version}, expected {BUNDLE_VERSION}; rebuild it with pennant_fever_bundle_converter.py")
+        header = json.loads(f.read(header_length).decode('utf-8'))
+
+    if header.get('schema') != bundle_schema():
+        raise ValueError(f"{path} was written with a different roster schema; rebuild it with pennant_fever_bundle_converter.py")
+    for key in ('league', 'charts', 'schedule', 'teams', 'players', 'pitchers', 'sources', 'columns'):
+        if key not in header:
+            raise ValueError(f"{path} header is missing '{key}'")
+    size = os.path.getsize(path)
+    for group in ('players', 'pitchers'):
+        count = header[group]['count']
+        for field, values in header[group]['strings'].items():
+            if len(values) != count:
+                raise ValueError(f"{path}: {group}.{field} has {len(values)} entries, expected {count}")
+        for name in header['schema'][group]['ratings'] + header['schema'][group]['days']:
+            offset, length, dtype = header['columns'][f'{group}.{name}']
+            if length != count or offset + length * np.dtype(dtype).itemsize > size:
+                raise ValueError(f"{path}: column {group}.{name} is truncated or the wrong length")
+    for team in header['teams']:
+        for group in ('players', 'pitchers'):
+            start, end = team[group]
+            if not 0 <= start <= end <= header[group]['count']:
+                raise ValueError(f"{path}: team {team['team_id']} has an invalid {group} slice")
+    return header
+
+
+def load_league_bundle(path, mmap=False, header=None):
+    """
+    Materialize a whole league from a bundle in one pass: the rating columns become
+    the league's RosterStore directly (copy-on-write memory maps with mmap=True), and
+    each Player / Pitcher is a view over its row. Returns the same dict as load_league().
+    """
+    header = header if header is not None else read_bundle_header(path)
+    data = np.memmap(path, dtype=np.uint8, mode='c') if mmap else np.fromfile(path, dtype=np.uint8)
+
+    roster = RosterStore()
+    tables = {}
+    for group in ('players', 'pitchers'):
+        schema = header['schema'][group]
+        columns = {}
+        for name in schema['ratings'] + schema['days']:
+            offset, length, dtype = header['columns'][f'{group}.{name}']
+            dtype = np.dtype(dtype)
+            columns[name] = data[offset:offset + length * dtype.itemsize].view(dtype)
+        tables[group] = RosterTable.from_columns(schema['ratings'], schema['days'], columns, header[group]['count'])
+    roster.players = tables['players']
+    roster.pitchers = tables['pitchers']
+
+    views = {}
+    for group, cls in (('players', Player), ('pitchers', Pitcher)):
+        strings = header[group]['strings']
+        fields = list(strings)
+        views[group] = [roster_view(cls, tables[group], row, **dict(zip(fields, values)))
+                        for row, values in enumerate(zip(*(strings[field] for field in fields)))]
+
+    team_lookup = {}
+    for entry in header['teams']:
+        players = views['players'][slice(*entry['players'])]
+        pitchers = views['pitchers'][slice(*entry['pitchers'])]
+        fields = {key: value for key, value in entry.items() if key not in ('key', 'players', 'pitchers')}
+        team_lookup[entry['key']] = Team(pitchers=pitchers, players=players, **fields)
+
+    league_data = header['league']
+    sub_leagues = league_data['sub_leagues']
+    all_team_ids = [team_id for sub_league in sub_leagues for division in sub_league['divisions'] for team_id in division['teams']]
+    schedule = Schedule(os.path.join(BASE_DIRECTORY, league_data['schedule_name']), games=header['schedule'])
+    return {
+        'league_data': league_data,
+        'sub_leagues': sub_leagues,
+        'team_lookup': team_lookup,
+        'all_team_ids': all_team_ids,
+        'schedule': schedule,
+        'schedule_id_map': {i + 1: team_id for i, team_id in enumerate(all_team_ids)},
+        'charts': CompiledCharts.from_dict(header['charts']),
+        'roster': roster,
+    }
+
+def warn_missing_positions(team_lookup, charts):
+    """Report rosters the defense chart can't fully cover (those rolls score fielding 0)."""
+    for team_id, team in team_lookup.items():
+        missing = team.missing_positions(charts.fielding_positions)
+        if missing:
+            logger.warning(f"{team.team_name} ({team_id}) has no player listed at {', '.join(missing)}; "
+                           f"defense chart rolls for those positions use fielding 0")
+
+def load_league(use_bundle=None):
+    """
+    Load the league structure, every team and the schedule from disk: from the
+    league bundle when there is one (league_bundle_path(), unless use_bundle or
+    USE_LEAGUE_BUNDLE is False), otherwise from the league file and one JSON file per team.
+    A bundle that is unreadable or older than its source files is rebuilt from them.
+
+    Returns a dict with league_data, sub_leagues, team_lookup (team_id -> Team),
+    all_team_ids, schedule, schedule_id_map (schedule numeric id -> team_id),
+    charts (CompiledCharts from charts.json, or the built-in dice charts) and
+    roster (the RosterStore holding every player's and pitcher's ratings).
+    """
+    bundle_path = league_bundle_path()
+    use_bundle = USE_LEAGUE_BUNDLE if use_bundle is None else use_bundle
+    if use_bundle and os.path.exists(bundle_path):
+        try:
+            header = read_bundle_header(bundle_path)
+            stale = stale_bundle_sources(header)
+            reason = f"{len(stale)} source file(s) changed since it was built, e.g. {stale[0]}" if stale else None
+        except ValueError as e:
+            reason = str(e)
+        if reason is None:
+            logger.info(f"Loading league bundle: {bundle_path}")
+            league = load_league_bundle(bundle_path, mmap=LEAGUE_BUNDLE_MMAP, header=header)
+            warn_missing_positions(league['team_lookup'], league['charts'])
+            return league
+
+        logger.warning(f"Rebuilding league bundle {bundle_path}: {reason}")
+        league = load_league(use_bundle=False)
+        try:
+            write_league_bundle(bundle_path, league)
+        except OSError as e:
+            logger.warning(f"Could not rewrite league bundle {bundle_path}: {e}")
+        return league
+
     # Define the path to league file based on LEAGUE_TYPE
-    if LEAGUE_TYPE == "fictional":
-        league_file_name = 'league_fictional.json'
-    else:
-        league_file_name = 'league.json'
+    league_file_name = get_league_file_name()
 
     league_file_path = os.path.join(BASE_DIRECTORY, league_file_name)
     logger.info(f"Loading league structure from: {league_file_path}")
@@ -2751,15 +5105,11 @@ def main():
         league_data = json.load(f)
     
     # Extract the league and division data
-    league_name = league_data['league_name']
     sub_leagues = league_data['sub_leagues']
     
     # Dictionary to store all the loaded teams, using their team_id as the key
     team_lookup = {}
-    # logger.debug(team_lookup)
-
-    # Dictionary to store team stats for each team
-    team_stats_lookup = {}
+    roster = RosterStore()
 
     # Loop through team IDs from the league structure and load each team's data
     # Extract all team IDs from the league structure
@@ -2781,9 +5131,8 @@ def main():
         file_path = os.path.join(str(team_json_dir), f'team_id_{team_id}.json')
         logger.debug(f"Loading team data from: {file_path}")
         try:
-            team = load_team_from_json(file_path)
+            team = load_team_from_json(file_path, roster)
             team_lookup[team_id] = team
-            team_stats_lookup[team_id] = TeamStats(team.team_name)
             logger.debug(f"Loaded team {team_id}: {team.team_name}")
         except FileNotFoundError:
             logger.debug(f"File not found: {file_path}")
@@ -2792,36 +5141,84 @@ def main():
 
     logger.debug(f"Loaded teams: {list(team_lookup.keys())}")
 
-    # Pass team_lookup to Standings
-    standings = Standings(sub_leagues, team_lookup)
-
-    # Initialize season pitcher stats tracker
-    pitcher_tracker = SeasonPitcherTracker()
+    charts = load_charts()
+    warn_missing_positions(team_lookup, charts)
 
     # Load the schedule file (assuming we use the schedule name from league.json)
     schedule = Schedule(os.path.join(BASE_DIRECTORY, league_data['schedule_name']))
 
-    power_chart = {
-        (1, 1): {1: "Spot 4", 2: "Bench 6", 3: "Bench 5", 4: "Spot 5", 5: "Spot 7", 6: "Spot 9"},
-        (2, 2): {1: "Spot 3", 2: "Spot 4", 3: "Bench 1", 4: "Spot 2", 5: "Spot 6", 6: "Bench 2"},
-        (3, 3): {1: "Bench 4", 2: "Spot 3", 3: "Spot 4", 4: "Spot 1", 5: "Spot 5", 6: "Bench 3"},
-        (4, 4): {1: "Spot 5", 2: "Spot 2", 3: "Spot 3", 4: "Spot 4", 5: "Spot 1", 6: "Spot 6"},
-        (5, 5): {1: "Spot 8", 2: "Spot 7", 3: "Spot 6", 4: "Spot 3", 5: "Spot 4", 6: "Spot 2"},
-        (6, 6): {1: "Bench 2", 2: "Spot 8", 3: "Spot 5", 4: "Bench 1", 5: "Spot 3", 6: "Spot 4"}
+    return {
+        'league_data': league_data,
+        'sub_leagues': sub_leagues,
+        'team_lookup': team_lookup,
+        'all_team_ids': all_team_ids,
+        'schedule': schedule,
+        'schedule_id_map': schedule_id_map,
+        'charts': charts,
+        'roster': roster,
     }
 
-    speed_bench_chart = {
-        (1, 1): {1: "Spot 5", 2: "Bench 1", 3: "Bench 2", 4: "Spot 3", 5: "Spot 6", 6: "Spot 2"},
-        (2, 2): {1: "Spot 1", 2: "Spot 8", 3: "Spot 3", 4: "Spot 4", 5: "Spot 7", 6: "Bench 3"},
-        (3, 3): {1: "Spot 1", 2: "Spot 1", 3: "Spot 1", 4: "Spot 9", 5: "Spot 1", 6: "Spot 1"},
-        (4, 4): {1: "Spot 2", 2: "Bench 3", 3: "Bench 6", 4: "Spot 2", 5: "Spot 3", 6: "Bench 5"},
-        (5, 5): {1: "Spot 6", 2: "Spot 9", 3: "Spot 8", 4: "Bench 4", 5: "Spot 2", 6: "Spot 1"},
-        (6, 6): {1: "Spot 7", 2: "Bench 2", 3: "Spot 4", 4: "Bench 1", 5: "Spot 3", 6: "Spot 5"}
-    }
+def main():
+    init()
+    league = load_league()
+    sub_leagues = league['sub_leagues']
+    team_lookup = league['team_lookup']
+    schedule = league['schedule']
+    schedule_id_map = league['schedule_id_map']
+
+    # Dictionary to store team stats for each team
+    team_stats_lookup = {team_id: TeamStats(team.team_name) for team_id, team in team_lookup.items()}
+
+    # Standings are kept incrementally: one log line per game, periodic snapshots
+    standings_store = StandingsStore(os.path.join(BASE_DIRECTORY, 'standings_log.jsonl'),
+                                     os.path.join(BASE_DIRECTORY, 'standings_snapshot.json'))
+    standings_store.reset()
+
+    # Pass team_lookup to Standings
+    standings = Standings(sub_leagues, team_lookup, store=standings_store)
+
+    # Initialize season pitcher stats tracker
+    pitcher_tracker = SeasonPitcherTracker()
+    # Batting lines are synthesized from each day's team runs in one batch
+    batting_stats = SeasonBattingStats(team_lookup.values())
+    team_names = {team_id: team.team_name for team_id, team in team_lookup.items()}
+
+    power_chart = POWER_CHART
+    speed_bench_chart = SPEED_BENCH_CHART
+    charts = league['charts']
+
+    # One matchup cache for the whole season - teams see the same starters over and over
+    matchup_cache = MatchupCache()
+
+    # Pitcher rest, injuries and rotation go to an append-only journal instead of
+    # rewriting every team file after every game
+    journal = StateJournal(os.path.join(BASE_DIRECTORY, 'season_state.journal'))
+    if any(True for _ in journal.read_records()):
+        # An interrupted run left records behind: carry its rest and injury state into
+        # this run and fold it into the team files
+        logger.warning(f"Recovering interrupted season state from {journal.journal_path}")
+        journal.replay(team_lookup)
+        journal.compact(team_lookup)
+    journal.prime(team_lookup)
+
+    if STEP_PROFILE_SAMPLE_EVERY:
+        set_profiler(profiling.StepProfiler(STEP_PROFILE_SAMPLE_EVERY))
+
+    if TRACE_FILE:
+        trace_path = os.path.join(BASE_DIRECTORY, TRACE_FILE)
+        set_tracer(trace.FileTracer(trace_path))
+        logger.info(f"Tracing games to {trace_path}")
+
+    game_log = None
+    if GAME_LOG_FILE:
+        game_log_path = os.path.join(BASE_DIRECTORY, GAME_LOG_FILE)
+        game_log = GameLog(game_log_path)
+        logger.info(f"Logging games to {game_log_path}")
 
     # Play the season
-    for day in range(1, 187):
+    for day in range(1, schedule.num_days + 1):
         games_today = schedule.get_games_for_day(day)
+        day_results = []
         for game_info in games_today:
             # Convert schedule's numeric IDs to team string IDs
             away_team_id = schedule_id_map[game_info['away']]
@@ -2831,147 +5228,61 @@ def main():
             home_team = team_lookup[home_team_id]
 
             relief_defense_chart = Game.consult_relief_defense_chart
-            game = Game(home_team, away_team, day, power_chart, speed_bench_chart, relief_defense_chart)
+            game = Game(home_team, away_team, day, power_chart, speed_bench_chart, relief_defense_chart, matchup_cache=matchup_cache, charts=charts)
             result = game.play_game(day)
 
             # Update team stats and standings, passing pitcher handedness
-            standings.update_team_stats(home_team_id, result['home_runs'], result['away_runs'], result.get('is_one_run', False), result.get('is_extra_innings', False), pitcher_throws=result['away_pitcher_throws'], team_lookup=team_lookup)
-            standings.update_team_stats(away_team_id, result['away_runs'], result['home_runs'], result.get('is_one_run', False), result.get('is_extra_innings', False), pitcher_throws=result['home_pitcher_throws'], team_lookup=team_lookup)
+            standings.record_game(day, home_team_id, away_team_id, result, team_lookup=team_lookup)
 
             # Update each team's stats with home and away tracking, passing the pitcher handedness
-            team_stats_lookup[home_team_id].update_stats(result['home_runs'], result['away_runs'], result.get('is_one_run', False), result.get('is_extra_innings', False), pitcher_throws=result['away_pitcher_throws'], is_home_game=True)
-            team_stats_lookup[away_team_id].update_stats(result['away_runs'], result['home_runs'], result.get('is_one_run', False), result.get('is_extra_innings', False), pitcher_throws=result['home_pitcher_throws'], is_home_game=False)
-
-            # Save team-specific data (pitcher rest, injuries, etc.)
-            home_team.save_team_data()
-            away_team.save_team_data()
-
-            # Update pitcher tracker with game stats
-            # NOTE: Due to a quirk in ReliefPitching code, reliever distributions contain
-            # relievers from the BATTING team, not the pitching team. The naming is confusing:
-            # - 'away_reliever_innings_distribution' = AWAY team's relievers (when away batted)
-            # - 'home_reliever_innings_distribution' = HOME team's relievers (when home batted)
-
-            # HOME starter stats (they pitched against away batting)
-            home_starter_name = result.get('home_starter_name')
-            home_starter_innings = result.get('away_starter_innings', 0)
-            home_starter_decision = result.get('home_starter_decision')
-            is_home_cg = home_starter_innings >= 9.0
-
-            # Away reliever data (these are actually AWAY team's relievers due to code quirk)
-            away_reliever_innings = result.get('away_reliever_innings_distribution', {})
-            away_reliever_er = result.get('away_reliever_earned_runs', {})
-            away_reliever_ur = result.get('away_reliever_unearned_runs', {})
-            if not isinstance(away_reliever_innings, dict):
-                away_reliever_innings = {}
-            if not isinstance(away_reliever_er, dict):
-                away_reliever_er = {}
-            if not isinstance(away_reliever_ur, dict):
-                away_reliever_ur = {}
-
-            # Calculate home starter runs (runs allowed when away batted, minus what relievers allowed)
-            total_reliever_runs_away = sum(away_reliever_er.values()) + sum(away_reliever_ur.values())
-            home_starter_runs = max(0, result['away_runs'] - total_reliever_runs_away)
-
-            if home_starter_name:
-                pitcher_tracker.update_starter_stats(
-                    team_id=home_team_id, team_name=home_team.team_name,
-                    pitcher_name=home_starter_name, innings=home_starter_innings,
-                    earned_runs=home_starter_runs, unearned_runs=0,
-                    decision=home_starter_decision, is_complete_game=is_home_cg
-                )
+            team_stats_lookup[home_team_id].update_stats(result.home_runs, result.away_runs, result.is_one_run, result.is_extra_innings, pitcher_throws=result.away_pitcher_throws, is_home_game=True)
+            team_stats_lookup[away_team_id].update_stats(result.away_runs, result.home_runs, result.is_one_run, result.is_extra_innings, pitcher_throws=result.home_pitcher_throws, is_home_game=False)
 
-            # AWAY starter stats (they pitched against home batting)
-            away_starter_name = result.get('away_starter_name')
-            away_starter_innings = result.get('home_starter_innings', 0)
-            away_starter_decision = result.get('away_starter_decision')
-            is_away_cg = away_starter_innings >= 9.0
-
-            # Home reliever data (these are actually HOME team's relievers due to code quirk)
-            home_reliever_innings = result.get('home_reliever_innings_distribution', {})
-            home_reliever_er = result.get('home_reliever_earned_runs', {})
-            home_reliever_ur = result.get('home_reliever_unearned_runs', {})
-            if not isinstance(home_reliever_innings, dict):
-                home_reliever_innings = {}
-            if not isinstance(home_reliever_er, dict):
-                home_reliever_er = {}
-            if not isinstance(home_reliever_ur, dict):
-                home_reliever_ur = {}
-
-            # Calculate away starter runs
-            total_reliever_runs_home = sum(home_reliever_er.values()) + sum(home_reliever_ur.values())
-            away_starter_runs = max(0, result['home_runs'] - total_reliever_runs_home)
-
-            if away_starter_name:
-                pitcher_tracker.update_starter_stats(
-                    team_id=away_team_id, team_name=away_team.team_name,
-                    pitcher_name=away_starter_name, innings=away_starter_innings,
-                    earned_runs=away_starter_runs, unearned_runs=0,
-                    decision=away_starter_decision, is_complete_game=is_away_cg
-                )
+            # Record team-specific data (pitcher rest, injuries, etc.) in the state journal
+            journal.record_team(home_team, day)
+            journal.record_team(away_team, day)
 
-            # Track AWAY team relievers (from away_reliever_innings - they are AWAY team's relievers)
-            save_reliever = result.get('save_reliever_name')
-            save_team = result.get('save_team_id')
-            winning_reliever_team = result.get('winning_reliever_team_id')
-            losing_reliever_team = result.get('losing_reliever_team_id')
+            # Update pitcher tracker with game stats (see GameResult.pitching_lines for who is charged what)
+            pitcher_tracker.record_game(result, team_names)
+            day_results.append(result)
 
-            for reliever_name, innings_str in away_reliever_innings.items():
-                innings = float(innings_str) if innings_str else 0.0
-                er = away_reliever_er.get(reliever_name, 0)
-                ur = away_reliever_ur.get(reliever_name, 0)
-                decision = None
-                # Only credit W/L/S if this reliever's TEAM matches
-                if reliever_name == result.get('winning_reliever_name') and winning_reliever_team == away_team_id:
-                    decision = 'W'
-                elif reliever_name == result.get('losing_reliever_name') and losing_reliever_team == away_team_id:
-                    decision = 'L'
-                elif reliever_name == save_reliever and save_team == away_team_id:
-                    decision = 'S'
-                is_game_finished = (decision == 'S')
-                pitcher_tracker.update_reliever_stats(
-                    team_id=away_team_id, team_name=away_team.team_name,
-                    pitcher_name=reliever_name, innings=innings,
-                    earned_runs=er, unearned_runs=ur,
-                    decision=decision, is_game_finished=is_game_finished
-                )
-
-            # Track HOME team relievers (from home_reliever_innings - they are HOME team's relievers)
-            for reliever_name, innings_str in home_reliever_innings.items():
-                innings = float(innings_str) if innings_str else 0.0
-                er = home_reliever_er.get(reliever_name, 0)
-                ur = home_reliever_ur.get(reliever_name, 0)
-                decision = None
-                # Only credit W/L/S if this reliever's TEAM matches
-                if reliever_name == result.get('winning_reliever_name') and winning_reliever_team == home_team_id:
-                    decision = 'W'
-                elif reliever_name == result.get('losing_reliever_name') and losing_reliever_team == home_team_id:
-                    decision = 'L'
-                elif reliever_name == save_reliever and save_team == home_team_id:
-                    decision = 'S'
-                is_game_finished = (decision == 'S')
-                pitcher_tracker.update_reliever_stats(
-                    team_id=home_team_id, team_name=home_team.team_name,
-                    pitcher_name=reliever_name, innings=innings,
-                    earned_runs=er, unearned_runs=ur,
-                    decision=decision, is_game_finished=is_game_finished
-                )
+            if game_log is not None:
+                game_log.append(result, home_team.team_name, away_team.team_name)
 
-        # At the end of each day, display standings and save them
-        standings.display_standings(team_stats_lookup)
-        standings.save_standings()
+        # At the end of each day, log the day's games; snapshot and render only at the configured intervals
+        batting_stats.add_results(day_results)
+        standings_store.end_of_day(standings, day)
+        if STANDINGS_DISPLAY_INTERVAL and day % STANDINGS_DISPLAY_INTERVAL == 0:
+            standings.display_standings(team_stats_lookup)
+        journal.checkpoint(day)
 
     # At the end of the season, display the final standings
     logger.info("\n=== Final Standings ===")
     standings.display_standings(team_stats_lookup)
-
-    # Export pitcher stats to Excel
-    pitcher_stats_path = os.path.join(get_team_json_directory(), 'season_pitcher_stats.xlsx')
-    pitcher_tracker.export_to_excel(pitcher_stats_path)
+    standings_store.snapshot(standings, schedule.num_days)
+    standings.save_standings()
+    if game_log is not None:
+        game_log.close()
+    logger.info(f"Matchup cache: {matchup_cache.stats()}")
+    if STEP_PROFILE_SAMPLE_EVERY:
+        # Regular season only; the playoffs below run unprofiled
+        step_profiler = set_profiler(None)
+        step_profiler.export(os.path.join(BASE_DIRECTORY, 'step_profile.json'))
+        logger.info(f"resolve_team_runs step profile:\n{step_profiler.report()}")
+    journal.compact(team_lookup)
+
+    # Export pitcher stats (CSV is instant; the Excel workbook is optional and much slower)
+    pitcher_tracker.export(os.path.join(get_team_json_directory(), 'season_pitcher_stats.csv'))
+    batting_stats.export(os.path.join(get_team_json_directory(), 'season_batting_stats.csv'))
+    if PITCHER_STATS_EXCEL:
+        pitcher_tracker.export_to_excel(os.path.join(get_team_json_directory(), 'season_pitcher_stats.xlsx'))
 
     # After the regular season is complete, initiate the playoffs
-    playoffs = Playoffs(standings, team_stats_lookup, power_chart, speed_bench_chart, relief_defense_chart)
-    playoffs.simulate_playoffs()
+    playoffs = Playoffs(standings, team_stats_lookup, power_chart, speed_bench_chart, relief_defense_chart, matchup_cache=matchup_cache, charts=charts)
+    playoffs.simulate_playoffs(regular_season_days=schedule.num_days)
+
+    if TRACE_FILE:
+        set_tracer(None).close()
 
 # ----------------------------
 # GUI using Pygame (COMMENTED OUT - micro/at-bat simulation incomplete)
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+pennant_fever_game_log.py
+
+Columnar game log: every GameResult as fixed-width rows, written in chunks to
+SQLite or Parquet, plus vectorized season queries over the log.
+
+Two tables are kept:
+    games     one row per game: teams, score, starters and their hands, extras / one-run flags
+    pitching  one row per pitcher per game: outs, earned and unearned runs, decision,
+              complete game (starters) or save (relievers), as GameResult.pitching_lines charges them
+
+Rows are buffered in NumPy structured arrays with team and pitcher names interned
+to integer codes, and only turned into DataFrames when a chunk is flushed. A path
+ending in .sqlite or .db is a SQLite database (tables 'games' and 'pitching');
+anything else is a directory holding games/ and pitching/ Parquet part files
+(needs pyarrow or fastparquet). pandas is imported on first use, so the engine
+can import GameLog without paying for it.
+
+Usage:
+    from pennant_fever_game_log import GameLog, read_game_log, standings_from_log
+    log = GameLog('season_log.sqlite')
+    log.append(result, home_team.team_name, away_team.team_name)   # after each Game.play_game
+    log.close()
+
+    games, pitching = read_game_log('season_log.sqlite')
+    standings_from_log(games)
+    leaders(pitching_totals(pitching), 'ERA', min_outs=162 * 3)
+
+    python pennant_fever_game_log.py season_log.sqlite --standings --leaders ERA --splits
+"""
+
+import argparse
+import os
+import sqlite3
+
+import numpy as np
+
+
+# =============================================================================
+# ROW LAYOUT
+# =============================================================================
+
+GAME_DTYPE = np.dtype([
+    ('game', '<u4'), ('day', '<i4'),
+    ('home_team', '<i4'), ('away_team', '<i4'), ('home_team_name', '<i4'), ('away_team_name', '<i4'),
+    ('home_runs', '<i2'), ('away_runs', '<i2'),
+    ('home_starter', '<i4'), ('away_starter', '<i4'),
+    ('home_starter_throws', 'U1'), ('away_starter_throws', 'U1'),
+    ('extra_innings', '?'), ('one_run', '?'),
+])
+
+PITCHING_DTYPE = np.dtype([
+    ('game', '<u4'), ('day', '<i4'), ('team', '<i4'), ('pitcher', '<i4'), ('starter', '?'),
+    ('outs', '<i2'), ('earned_runs', '<i2'), ('unearned_runs', '<i2'),
+    ('decision', 'U1'), ('finished', '?'),
+])
+
+# Columns holding interned name codes, resolved to strings when a chunk is written
+NAME_COLUMNS = {
+    'games': ('home_team', 'away_team', 'home_team_name', 'away_team_name', 'home_starter', 'away_starter'),
+    'pitching': ('team', 'pitcher'),
+}
+
+SQLITE_SUFFIXES = ('.sqlite', '.db')
+
+
+def innings_to_outs(innings):
+    """Baseball-notation innings (6.2 or '6.2' = 6 2/3) to outs."""
+    innings = float(innings) if innings else 0.0
+    return int(innings) * 3 + round((innings % 1) * 10)
+
+
+# =============================================================================
+# SINK
+# =============================================================================
+
+class GameLog:
+    """Buffers game results as fixed-width rows and writes them out every `chunk_games` games."""
+
+    def __init__(self, path, chunk_games=4096):
+        self.path = path
+        self.backend = 'sqlite' if str(path).lower().endswith(SQLITE_SUFFIXES) else 'parquet'
+        self.games = np.zeros(chunk_games, dtype=GAME_DTYPE)
+        self.pitching = np.zeros(chunk_games * 16, dtype=PITCHING_DTYPE)
+        self.games_pending = 0
+        self.pitching_pending = 0
+        self.game_count = 0
+        self.parts = 0
+        self.names = []
+        self.name_ids = {}
+
+        # A new log replaces whatever the previous season left at this path
+        if self.backend == 'sqlite':
+            self.connection = sqlite3.connect(path)
+            for table in NAME_COLUMNS:
+                self.connection.execute(f"DROP TABLE IF EXISTS {table}")
+            self.connection.commit()
+        else:
+            self.connection = None
+            for table in NAME_COLUMNS:
+                directory = os.path.join(path, table)
+                os.makedirs(directory, exist_ok=True)
+                for file_name in os.listdir(directory):
+                    if file_name.endswith('.parquet'):
+                        os.remove(os.path.join(directory, file_name))
+
+    def intern(self, name):
+        if name is None:
+            return -1
+        name = str(name)
+        name_id = self.name_ids.get(name)
+        if name_id is None:
+            name_id = len(self.names)
+            self.names.append(name)
+            self.name_ids[name] = name_id
+        return name_id
+
+    def append(self, result, home_team_name=None, away_team_name=None):
+        """Add one GameResult (with its pitching lines) to the current chunk."""
+        lines = result.pitching_lines()
+        if self.games_pending == len(self.games) or self.pitching_pending + len(lines) > len(self.pitching):
+            self.flush()
+
+        self.game_count += 1
+        self.games[self.games_pending] = (
+            self.game_count, result.get('day', 0),
+            self.intern(result.home_team_id), self.intern(result.away_team_id),
+            self.intern(home_team_name), self.intern(away_team_name),
+            result.home_runs, result.away_runs,
+            self.intern(result.get('home_starter_name')), self.intern(result.get('away_starter_name')),
+            result.get('home_pitcher_throws') or '', result.get('away_pitcher_throws') or '',
+            bool(result.get('is_extra_innings')), bool(result.get('is_one_run')),
+        )
+        self.games_pending += 1
+
+        for team_id, pitcher_name, is_starter, innings, earned_runs, unearned_runs, decision, finished in lines:
+            self.pitching[self.pitching_pending] = (
+                self.game_count, result.get('day', 0), self.intern(team_id), self.intern(pitcher_name), is_starter,
+                innings_to_outs(innings), earned_runs, unearned_runs, decision or '', finished,
+            )
+            self.pitching_pending += 1
+
+    def frame(self, table, rows):
+        """DataFrame of buffered rows with name codes resolved."""
+        import pandas as pd
+        frame = pd.DataFrame({column: rows[column] for column in rows.dtype.names})
+        names = np.array(self.names + [None], dtype=object)  # code -1 -> None
+        for column in NAME_COLUMNS[table]:
+            frame[column] = names[rows[column]]
+        if table == 'pitching':
+            frame['decision'] = frame['decision'].replace('', None)
+        return frame
+
+    def flush(self):
+        if not self.games_pending and not self.pitching_pending:
+            return
+        frames = {
+            'games': self.frame('games', self.games[:self.games_pending]),
+            'pitching': self.frame('pitching', self.pitching[:self.pitching_pending]),
+        }
+        if self.backend == 'sqlite':
+            for table, frame in frames.items():
+                frame.to_sql(table, self.connection, if_exists='append', index=False)
+            self.connection.commit()
+        else:
+            for table, frame in frames.items():
+                frame.to_parquet(os.path.join(self.path, table, f'part-{self.parts:05d}.parquet'), index=False)
+        self.parts += 1
+        self.games_pending = 0
+        self.pitching_pending = 0
+
+    def close(self):
+        self.flush()
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+def read_game_log(path):
+    """Load a GameLog written to `path`; returns (games, pitching) DataFrames in game order."""
+    import pandas as pd
+    if str(path).lower().endswith(SQLITE_SUFFIXES):
+        with sqlite3.connect(path) as connection:
+            games = pd.read_sql('SELECT * FROM games ORDER BY game', connection)
+            pitching = pd.read_sql('SELECT * FROM pitching ORDER BY game', connection)
+    else:
+        games = pd.read_parquet(os.path.join(path, 'games')).sort_values('game', kind='stable')
+        pitching = pd.read_parquet(os.path.join(path, 'pitching')).sort_values('game', kind='stable')
+    for frame, flags in ((games, ('extra_innings', 'one_run')), (pitching, ('starter', 'finished'))):
+        for column in flags:
+            frame[column] = frame[column].astype(bool)
+    return games.reset_index(drop=True), pitching.reset_index(drop=True)
+
+
+# =============================================================================
+# SEASON QUERIES
+# =============================================================================
+
+def team_games(games):
+    """Each game twice, once from each team's side: team, opponent, runs for/against, home flag, opponent starter's hand."""
+    import pandas as pd
+    home = pd.DataFrame({
+        'game': games['game'], 'day': games['day'],
+        'team': games['home_team'], 'team_name': games['home_team_name'], 'opponent': games['away_team'],
+        'runs': games['home_runs'], 'runs_against': games['away_runs'], 'home': True,
+        'opponent_throws': games['away_starter_throws'],
+        'extra_innings': games['extra_innings'], 'one_run': games['one_run'],
+    })
+    away = pd.DataFrame({
+        'game': games['game'], 'day': games['day'],
+        'team': games['away_team'], 'team_name': games['away_team_name'], 'opponent': games['home_team'],
+        'runs': games['away_runs'], 'runs_against': games['home_runs'], 'home': False,
+        'opponent_throws': games['home_starter_throws'],
+        'extra_innings': games['extra_innings'], 'one_run': games['one_run'],
+    })
+    sides = pd.concat([home, away], ignore_index=True)
+    sides['win'] = sides['runs'] > sides['runs_against']
+    return sides
+
+
+def _record(sides, mask, label):
+    import pandas as pd
+    subset = sides[mask]
+    wins = subset.groupby('team')['win'].sum()
+    games = subset.groupby('team')['win'].size()
+    return pd.DataFrame({f'{label}_W': wins, f'{label}_L': games - wins})
+
+
+def standings_from_log(games, through_day=None):
+    """Rebuild the standings (W, L, PCT, RS, RA and home/road/one-run/extra-inning records), optionally through a day."""
+    import pandas as pd
+    if through_day is not None:
+        games = games[games['day'] <= through_day]
+    sides = team_games(games)
+    by_team = sides.groupby('team')
+    table = pd.DataFrame({
+        'team_name': by_team['team_name'].first(),
+        'W': by_team['win'].sum(),
+        'G': by_team['win'].size(),
+        'RS': by_team['runs'].sum(),
+        'RA': by_team['runs_against'].sum(),
+    })
+    table['L'] = table['G'] - table['W']
+    table['PCT'] = (table['W'] / table['G']).round(3)
+    table['RD'] = table['RS'] - table['RA']
+    for label, mask in (('home', sides['home']), ('road', ~sides['home']),
+                        ('one_run', sides['one_run']), ('extras', sides['extra_innings'])):
+        table = table.join(_record(sides, mask, label))
+    table = table.fillna(0)
+    for column in table.columns:
+        if column.endswith(('_W', '_L')):
+            table[column] = table[column].astype(int)
+    columns = ['team_name', 'W', 'L', 'PCT', 'RS', 'RA', 'RD'] + [column for column in table.columns if column.endswith(('_W', '_L'))]
+    return table[columns].sort_values(['PCT', 'RD'], ascending=False)
+
+
+def handedness_splits(games):
+    """Each team's record and runs per game against left- and right-handed starters."""
+    sides = team_games(games)
+    split = sides.groupby(['team', 'opponent_throws']).agg(W=('win', 'sum'), G=('win', 'size'), RS=('runs', 'mean'))
+    split['L'] = split['G'] - split['W']
+    split['RS'] = split['RS'].round(2)
+    return split[['W', 'L', 'RS']].unstack('opponent_throws', fill_value=0)
+
+
+def pitching_totals(pitching):
+    """Season line per (team, pitcher): G, GS, IP, ER, R, W, L, SV, CG, ERA."""
+    pitching = pitching.assign(
+        runs=pitching['earned_runs'] + pitching['unearned_runs'],
+        wins=pitching['decision'] == 'W',
+        losses=pitching['decision'] == 'L',
+        saves=pitching['decision'] == 'S',
+        complete_games=pitching['starter'] & pitching['finished'],
+    )
+    totals = pitching.groupby(['team', 'pitcher']).agg(
+        G=('game', 'size'), GS=('starter', 'sum'), outs=('outs', 'sum'), ER=('earned_runs', 'sum'),
+        R=('runs', 'sum'), W=('wins', 'sum'), L=('losses', 'sum'), SV=('saves', 'sum'), CG=('complete_games', 'sum'),
+    )
+    totals['IP'] = (totals['outs'] // 3) + (totals['outs'] % 3) / 10
+    totals['ERA'] = (totals['ER'] * 27 / totals['outs'].replace(0, np.nan)).round(2)
+    return totals.reset_index()
+
+
+def leaders(totals, stat, n=10, min_outs=0, ascending=None):
+    """Top `n` rows of a pitching_totals table by `stat` (ERA ascending, counting stats descending)."""
+    ascending = (stat == 'ERA') if ascending is None else ascending
+    qualified = totals[totals['outs'] >= min_outs]
+    return qualified.sort_values([stat, 'outs'], ascending=[ascending, False], kind='stable').head(n)
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    import pandas as pd
+    parser = argparse.ArgumentParser(description='Query a Pennant Fever game log')
+    parser.add_argument('log', help='Game log written by GameLog (.sqlite/.db file or Parquet directory)')
+    parser.add_argument('--standings', action='store_true', help='Rebuild the standings from the log')
+    parser.add_argument('--through-day', type=int, default=None, help='Standings through this day')
+    parser.add_argument('--leaders', default=None, help='Pitching leaders by this stat (ERA, W, SV, CG, IP, ...)')
+    parser.add_argument('--min-ip', type=float, default=0, help='Minimum innings to qualify for --leaders')
+    parser.add_argument('--splits', action='store_true', help='Team records against LHP and RHP starters')
+    args = parser.parse_args()
+
+    games, pitching = read_game_log(args.log)
+    print(f"{len(games)} games, {len(pitching)} pitching lines")
+    with pd.option_context('display.max_rows', None, 'display.width', 160):
+        if args.standings:
+            print(standings_from_log(games, args.through_day).to_string())
+        if args.leaders:
+            totals = pitching_totals(pitching)
+            print(leaders(totals, args.leaders, min_outs=round(args.min_ip * 3)).to_string(index=False))
+        if args.splits:
+            print(handedness_splits(games).to_string())
+
+
+if __name__ == '__main__':
+    main()
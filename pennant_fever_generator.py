@@ -10,6 +10,7 @@ import os
 import sys
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 
 # Add common folder to sys.path for shared modules
@@ -18,17 +19,12 @@ sys.path.insert(0, str(COMMON_PATH))
 
 from data_paths_pennant_fever import (
     PENNANT_FEVER_LOGS_LEAGUE_GEN_DIR,
-    CORPORATE_NAMES_FILE,
-    LEAGUE_NAME_SOURCES_FILE,
-    FIRST_NAMES_FILE,
-    SURNAMES_FILE,
-    SCHOOLS_REGISTER_FILE,
-    TEAM_GENERATION_FILE,
     PENNANT_FEVER_LEAGUE_FILES_DIR,
     PENNANT_FEVER_JSON_FIC_DIR,
     SCOUTING_REPORTS_FILE,
 )
 from common_logger import setup_logger
+from pennant_fever_reference_cache import ReferenceData, generator_sources
 
 # need to skew specialists to be mostly LHP
 # go to a universal 2-8 scale for all ratings (then maybe we can convert to 20-80 scale in the main game?)
@@ -122,28 +118,23 @@ logger = setup_logger(
     console_level=logging.INFO
 )
 
-# START LOADING DATA
+# REFERENCE DATA
 
-# Load your corporate sponsor names and league name parts
-corporate_names_df = pd.read_excel(CORPORATE_NAMES_FILE)
-league_name_sources_df = pd.read_excel(LEAGUE_NAME_SOURCES_FILE)
+# Names, schools, cities and nicknames are read on first use, from binary snapshots of the
+# Excel sheets (see pennant_fever_reference_cache.py); a sheet is only parsed again after it changes
+reference = ReferenceData(generator_sources())
 
-# Assuming the columns in your Excel files are 'corporate_name' and 'league_name_part'
-corporate_names = corporate_names_df['corporate_name'].tolist()
-league_name_parts = league_name_sources_df['league_name_part'].tolist()
 
+@lru_cache(maxsize=None)
+def corporate_names():
+    """Corporate sponsor names from the 'corporate_name' column."""
+    return reference.corporate_names['corporate_name'].tolist()
 
-# Load the datasets once
-first_names_df = pd.read_excel(FIRST_NAMES_FILE)
-surnames_df = pd.read_excel(SURNAMES_FILE)
-high_school_df = pd.read_excel(SCHOOLS_REGISTER_FILE, sheet_name='HS')
-college_df = pd.read_excel(SCHOOLS_REGISTER_FILE, sheet_name='COL')
 
-# Load city data from CITY sheet
-city_data = pd.read_excel(TEAM_GENERATION_FILE, sheet_name='CITY')
-
-# Load nickname data from NICKNAMES sheet
-nickname_data = pd.read_excel(TEAM_GENERATION_FILE, sheet_name='NICKNAMES')
+@lru_cache(maxsize=None)
+def msa_data():
+    """CITY sheet with column names stripped of extra spaces."""
+    return reference.cities.rename(columns=str.strip)
 
 def sanitize_filename(name):
     """Sanitize the team name to create a valid filename for macOS."""
@@ -192,12 +183,12 @@ class NameGen:
 
     def generate_bio(self, position=None):
         # Generate first name and race
-        first_name_row = first_names_df.sample(weights='scaled_weight').iloc[0]
+        first_name_row = reference.first_names.sample(weights='scaled_weight').iloc[0]
         self.first_name = (first_name_row['name'] if pd.isna(first_name_row['diminutive']) or np.random.rand() >= 0.3 else first_name_row['diminutive']).title()
         self.race = self.generate_race(first_name_row, ['white', 'black', 'hispanic', 'asian', 'other'])
 
         # Generate surname based on race
-        self.surname = self.generate_random_name_matching_race(surnames_df, self.race).title()
+        self.surname = self.generate_random_name_matching_race(reference.surnames, self.race).title()
 
         self.origin = self.generate_origin(self.race)
 
@@ -450,11 +441,11 @@ class NameGen:
         draft_origin = np.random.choice(list(probabilities.keys()), p=list(probabilities.values()))
 
         if draft_origin == 'high_school':
-            school_row = high_school_df.sample(weights=high_school_df['players']).iloc[0]
+            school_row = reference.high_schools.sample(weights=reference.high_schools['players']).iloc[0]
             school_name = f"{school_row['school_name'].strip().title()}"
             school_type = 'HS'
         else:
-            school_row = college_df.sample(weights=college_df['players']).iloc[0]
+            school_row = reference.colleges.sample(weights=reference.colleges['players']).iloc[0]
             school_name = school_row['school_name'].strip().title()
             school_type = 'COL'
 
@@ -526,9 +517,9 @@ class Archetype:
 
         # Determine if it's a high school or college (normalize the case)
         if school_type in ['HS', 'hs', 'high school', 'highschool']:
-            school_df = high_school_df
+            school_df = reference.high_schools
         else:
-            school_df = college_df
+            school_df = reference.colleges
         logger.debug(f"LINE 458 - School type: {school_type}")
 
         # Find matching rows after cleaning
@@ -1667,9 +1658,6 @@ class ScoutingReport:
         self.report_sections.append(summary)
 
 
-# Assuming msa_data is already loaded from the external source with 'City', 'Population', 'Latitude', 'Longitude', and 'State' columns.
-msa_data = pd.read_excel(TEAM_GENERATION_FILE, sheet_name='CITY')
-
 class Team:
     """Class for representing a team with a roster of players."""
     def __init__(self, team_id, name, city, state, league_name, division_name, city_abbrev=None, league_year=2024):
@@ -1754,7 +1742,7 @@ class Team:
     def generate_ballpark_name(self):
         """Generate a ballpark name using corporate names and venue types."""
         venue_types = ["Field", "Stadium", "Park", "Ballpark", "Arena", "Coliseum"]
-        corporate_name = random.choice(corporate_names)
+        corporate_name = random.choice(corporate_names())
         venue_type = random.choice(venue_types)
         return f"{corporate_name} {venue_type}"
 
@@ -2352,15 +2340,12 @@ class MarkovChain:
             name += random.choice(self.chain[name[-1]])
         return name
     
-# Load the msa data from Excel
-msa_data = pd.read_excel(TEAM_GENERATION_FILE, sheet_name='CITY')
 
-# Clean column names by stripping extra spaces
-msa_data.columns = msa_data.columns.str.strip()
+@lru_cache(maxsize=None)
+def city_markov_chain():
+    """Markov chain over the MSA city names, used for league names."""
+    return MarkovChain(msa_data()['msa'].tolist())
 
-# Now try to access the 'msa' column
-city_names = msa_data['msa'].tolist()
-markov_chain = MarkovChain(city_names)
 
 class League:
     def __init__(self, num_teams, num_divisions, msa_data, nickname_data):
@@ -2372,13 +2357,10 @@ class League:
         self.used_nicknames = set()  # Track used nicknames
         self.teams = self.generate_league()
 
-    # Create an instance of MarkovChain for league name parts
-    markov_chain = MarkovChain(league_name_parts)
-
     # Generate a random league name with or without a sponsor
     def generate_league_name(self):
-        corporate_name = random.choice(corporate_names)  # Randomly pick a corporate name
-        league_name = markov_chain.generate_name()  # Generate a league name
+        corporate_name = random.choice(corporate_names())  # Randomly pick a corporate name
+        league_name = city_markov_chain().generate_name()  # Generate a league name
         
         # Decide randomly whether to use the corporate name or a combination
         naming_style = random.choice(['affix', 'full_corp', 'full_name'])
@@ -2674,20 +2656,24 @@ class PlayerProfile:
         combined_dict = {**bio_dict, **profile_dict}  # Merge bio and profile data, bio first
         return combined_dict
 
-# Example usage
-num_teams = 30
-num_divisions = 6
-league = League(num_teams, num_divisions, msa_data, nickname_data)
+def main():
+    num_teams = 30
+    num_divisions = 6
+    league = League(num_teams, num_divisions, msa_data(), reference.nicknames)
+
+    # Generate league name and divisions
+    league_name = league.generate_league_name()
+    divisions = league.generate_divisions()
+    league.print_teams_and_rosters()
+    league.save_teams_to_json()
+    league.save_league_json()  # Export league structure for game engine
+
+    print("League Name:", league_name)
+    print("Divisions:", divisions)
 
-# Generate league name and divisions
-league_name = league.generate_league_name()
-divisions = league.generate_divisions()
-league.print_teams_and_rosters()
-league.save_teams_to_json()
-league.save_league_json()  # Export league structure for game engine
 
-print("League Name:", league_name)
-print("Divisions:", divisions)
+if __name__ == "__main__":
+    main()
 
 
 
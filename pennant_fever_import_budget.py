@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+pennant_fever_import_budget.py
+
+Import-time budget check for the game engine.
+
+Imports pennant_fever_game in fresh interpreters and fails (exit status 1) when the
+median import time exceeds the budget, when the import pulls in a module that should
+stay lazy (pandas, openpyxl, pygame), or when it sets up logging handlers, which
+belongs in pennant_fever_game.init(). Run it before committing engine changes, or
+from CI. On failure the slowest imports from `python -X importtime` are listed.
+
+Usage:
+    python pennant_fever_import_budget.py                   # default budget, 5 runs
+    python pennant_fever_import_budget.py --budget 0.2 --runs 9
+    python pennant_fever_import_budget.py --module pennant_fever_season_runner
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+DEFAULT_BUDGET = 0.30  # seconds; numpy alone is roughly a third of this
+LAZY_MODULES = ('pandas', 'openpyxl', 'pygame', 'scipy', 'pyarrow')
+
+PROBE = """
+import json, logging, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'seconds': elapsed,
+    'loaded': [name for name in {lazy!r} if name in sys.modules],
+    'handlers': logging.getLogger('pennant_fever').hasHandlers(),
+}}))
+"""
+
+
+def run_probe(module):
+    code = PROBE.format(module=module, lazy=LAZY_MODULES)
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def slowest_imports(module, count=10):
+    """(cumulative microseconds, module name) for the slowest imports in `python -X importtime`."""
+    stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], capture_output=True,
+                            text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:count]
+
+
+def check(module='pennant_fever_game', budget=DEFAULT_BUDGET, runs=5):
+    """Returns a list of failure messages (empty when the import is within budget)."""
+    probes = [run_probe(module) for _ in range(runs)]
+    median = statistics.median(probe['seconds'] for probe in probes)
+    print(f"import {module}: median {median * 1000:.0f} ms over {runs} runs (budget {budget * 1000:.0f} ms)")
+
+    failures = []
+    if median > budget:
+        failures.append(f"import took {median * 1000:.0f} ms, over the {budget * 1000:.0f} ms budget")
+    loaded = sorted({name for probe in probes for name in probe['loaded']})
+    if loaded:
+        failures.append(f"import loaded {', '.join(loaded)}; import it where it is used instead")
+    if any(probe['handlers'] for probe in probes):
+        failures.append("import configured logging handlers; that belongs in init()")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fail if importing the Pennant Fever engine gets slow')
+    parser.add_argument('--module', default='pennant_fever_game', help='Module to import')
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET, help='Median import time allowed, in seconds')
+    parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters to time')
+    args = parser.parse_args()
+
+    failures = check(args.module, args.budget, args.runs)
+    if not failures:
+        print("OK")
+        return
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    print("\nSlowest imports (cumulative ms):")
+    for cumulative, name in slowest_imports(args.module):
+        print(f"  {cumulative / 1000:>8.1f}  {name}")
+    sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
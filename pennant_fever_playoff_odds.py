@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+pennant_fever_playoff_odds.py
+
+Playoff series and bracket probabilities without replaying the game engine.
+
+Per-game win probabilities come from the exact solver (pennant_fever_solver),
+one per (home team, home starter, away team, away starter). Series odds are then
+computed in closed form for any best-of-N format and home pattern, and propagated
+through the same bracket Playoffs.simulate_playoffs plays:
+    division winner 1 vs wildcard, division winner 2 vs division winner 3,
+    the two winners for the pennant, then the two pennant winners for the title.
+
+The analytic path averages each matchup over both rotations. The vectorized
+Monte Carlo fallback follows each team's strict five-man rotation game by game,
+for when the starter order matters.
+
+Usage:
+    playoffs.seed_teams()
+    bracket = bracket_from_playoffs(playoffs)
+    matrix = StarterWinMatrix(bracket_teams(bracket, playoffs.standings.team_lookup), current_day=189)
+    analytic_playoff_odds(bracket, matrix)       # {team_id: {'pennant': p, 'title': p, ...}}
+    monte_carlo_playoff_odds(bracket, matrix, simulations=20000, rng=np.random.default_rng(1))
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from pennant_fever_game import MatchupCache
+from pennant_fever_solver import run_distribution, win_probability
+
+
+# =============================================================================
+# SERIES PROBABILITIES
+# =============================================================================
+
+def default_home_pattern(games):
+    """
+    Home-field pattern for team 1 (the higher seed) in a best-of-`games` series.
+    Best-of-7 is the 2-3-2 used by Playoffs.simulate_series, best-of-5 is 2-2-1,
+    and other lengths alternate in pairs starting at team 1.
+    """
+    if games == 7:
+        return (True, True, False, False, False, True, True)
+    if games == 5:
+        return (True, True, False, False, True)
+    return tuple((game // 2) % 2 == 0 for game in range(games))
+
+
+def series_win_probability(p_home, p_away, games=7, home_pattern=None):
+    """
+    Probability team 1 wins a best-of-`games` series (first to games // 2 + 1).
+
+    p_home is team 1's win probability in its home games and p_away in its road games.
+    Both may be NumPy arrays (broadcast together) to price many series at once.
+    `games` must be odd: an even series can end tied, which neither team wins.
+    """
+    if games < 1 or games % 2 == 0:
+        raise ValueError(f"Series length must be a positive odd number of games, got {games}")
+    home_pattern = home_pattern if home_pattern is not None else default_home_pattern(games)
+    if len(home_pattern) != games:
+        raise ValueError(f"home_pattern has {len(home_pattern)} games, expected {games}")
+    p_home, p_away = np.broadcast_arrays(np.asarray(p_home, dtype=np.float64), np.asarray(p_away, dtype=np.float64))
+    needed = games // 2 + 1
+
+    # state[(team 1 wins, team 2 wins)] -> probability, for series still in progress
+    state = {(0, 0): np.ones(p_home.shape)}
+    team1_series = np.zeros(p_home.shape)
+    for team1_home in home_pattern:
+        p = p_home if team1_home else p_away
+        next_state = {}
+        for (wins1, wins2), prob in state.items():
+            for won, step in ((True, p), (False, 1 - p)):
+                key = (wins1 + 1, wins2) if won else (wins1, wins2 + 1)
+                if key[0] == needed:
+                    team1_series = team1_series + prob * step
+                elif key[1] < needed:
+                    next_state[key] = next_state.get(key, 0) + prob * step
+        state = next_state
+    return team1_series
+
+
+# =============================================================================
+# PER-GAME WIN PROBABILITIES
+# =============================================================================
+
+class StarterWinMatrix:
+    """
+    Exact single-game home win probability for every pair of playoff teams and
+    starters: prob[home, home_starter, away, away_starter], starters in rotation order.
+    """
+
+    def __init__(self, teams, current_day, cache=None, power_chart=None, speed_bench_chart=None, charts=None):
+        self.teams = list(teams)
+        self.index = {team.team_id: i for i, team in enumerate(self.teams)}
+        self.starters = [team.pitchers[:min(5, len(team.pitchers))] for team in self.teams]
+        self.rotation_sizes = np.array([len(starters) for starters in self.starters], dtype=np.int64)
+        self.rotation_start = np.array([team.current_rotation_index for team in self.teams], dtype=np.int64)
+        cache = cache if cache is not None else MatchupCache()
+
+        # Each batting team's run distribution against each opposing starter
+        distributions = {}
+        for batting in self.teams:
+            for pitching, starters in zip(self.teams, self.starters):
+                if pitching is batting:
+                    continue
+                for k, starter in enumerate(starters):
+                    distributions[(batting.team_id, pitching.team_id, k)] = run_distribution(
+                        batting, starter, current_day, power_chart=power_chart,
+                        speed_bench_chart=speed_bench_chart, cache=cache, charts=charts)
+
+        size = len(self.teams)
+        depth = int(self.rotation_sizes.max()) if size else 0
+        self.prob = np.full((size, depth, size, depth), np.nan)
+        for h, home in enumerate(self.teams):
+            for a, away in enumerate(self.teams):
+                if h == a:
+                    continue
+                for hs, home_starter in enumerate(self.starters[h]):
+                    for as_, away_starter in enumerate(self.starters[a]):
+                        self.prob[h, hs, a, as_] = win_probability(
+                            home, away, home_starter, away_starter, current_day,
+                            home_distribution=distributions[(home.team_id, away.team_id, as_)],
+                            away_distribution=distributions[(away.team_id, home.team_id, hs)])
+
+    def average(self):
+        """prob[home, away] averaged over both rotations (0.5 on the unused diagonal)."""
+        known = ~np.isnan(self.prob)
+        counts = known.sum(axis=(1, 3))
+        totals = np.where(known, self.prob, 0.0).sum(axis=(1, 3))
+        return np.divide(totals, counts, out=np.full(counts.shape, 0.5), where=counts > 0)
+
+
+# =============================================================================
+# BRACKET
+# =============================================================================
+
+def bracket_from_playoffs(playoffs) -> List[Tuple[str, Tuple[int, int], Tuple[int, int]]]:
+    """
+    The bracket Playoffs.simulate_playoffs plays, from its seeded playoff_teams:
+    [(league, (division winner 1, wildcard), (division winner 2, division winner 3)), ...]
+    with team 1 (home-field) listed first in each pair.
+    """
+    bracket = []
+    for league, seeds in playoffs.playoff_teams.items():
+        winners = seeds['division_winners']
+        bracket.append((league, (winners[0], seeds['wildcard']), (winners[1], winners[2])))
+    return bracket
+
+
+def bracket_teams(bracket, team_lookup):
+    team_ids = []
+    for _, first, second in bracket:
+        for team_id in first + second:
+            if team_id not in team_ids:
+                team_ids.append(team_id)
+    return [team_lookup[team_id] for team_id in team_ids]
+
+
+def _series_round(first: Dict[int, float], second: Dict[int, float], series: np.ndarray) -> Dict[int, float]:
+    """Winner distribution of a series between two (team index -> probability) fields."""
+    winners: Dict[int, float] = {}
+    for a, pa in first.items():
+        for b, pb in second.items():
+            p = float(series[a, b])
+            winners[a] = winners.get(a, 0.0) + pa * pb * p
+            winners[b] = winners.get(b, 0.0) + pa * pb * (1 - p)
+    return winners
+
+
+def analytic_playoff_odds(bracket, matrix: StarterWinMatrix, games=7, home_pattern=None):
+    """
+    Exact odds of reaching and winning each round, with per-game probabilities
+    averaged over both rotations. Returns {team_id: {'lcs', 'pennant', 'title'}}.
+    """
+    game_prob = matrix.average()
+    # series[i, j]: team i (home-field) beats team j
+    series = series_win_probability(game_prob, 1 - game_prob.T, games, home_pattern)
+
+    odds = {team.team_id: {'lcs': 0.0, 'pennant': 0.0, 'title': 0.0} for team in matrix.teams}
+    champions = []
+    for _, first, second in bracket:
+        semis = [_series_round({matrix.index[first[0]]: 1.0}, {matrix.index[first[1]]: 1.0}, series),
+                 _series_round({matrix.index[second[0]]: 1.0}, {matrix.index[second[1]]: 1.0}, series)]
+        for semi in semis:
+            for i, p in semi.items():
+                odds[matrix.teams[i].team_id]['lcs'] += p
+        pennant = _series_round(semis[0], semis[1], series)
+        for i, p in pennant.items():
+            odds[matrix.teams[i].team_id]['pennant'] += p
+        champions.append(pennant)
+
+    # The first league in the bracket has home field in the final, as in simulate_playoffs
+    for i, p in _series_round(champions[0], champions[1], series).items():
+        odds[matrix.teams[i].team_id]['title'] += p
+    return odds
+
+
+# =============================================================================
+# MONTE CARLO FALLBACK (rotation-dependent starters)
+# =============================================================================
+
+def _simulate_series(team1, team2, rotation, matrix, rng, games=7, home_pattern=None):
+    """
+    Play one series in every simulation at once. team1/team2 are per-simulation team
+    indices; rotation holds each simulation's next rotation slot per team and is
+    advanced in place for every game played. Returns the winning team index per simulation.
+    """
+    home_pattern = home_pattern if home_pattern is not None else default_home_pattern(games)
+    needed = games // 2 + 1
+    simulations = len(team1)
+    rows = np.arange(simulations)
+    wins1 = np.zeros(simulations, dtype=np.int64)
+    wins2 = np.zeros(simulations, dtype=np.int64)
+
+    for team1_home in home_pattern:
+        live = (wins1 < needed) & (wins2 < needed)
+        if not live.any():
+            break
+        home = team1 if team1_home else team2
+        away = team2 if team1_home else team1
+        home_starter = rotation[rows, home] % matrix.rotation_sizes[home]
+        away_starter = rotation[rows, away] % matrix.rotation_sizes[away]
+        p = matrix.prob[home, home_starter, away, away_starter]
+        home_won = rng.random(simulations) < p
+
+        team1_won = home_won if team1_home else ~home_won
+        wins1 += live & team1_won
+        wins2 += live & ~team1_won
+        rotation[rows[live], home[live]] += 1
+        rotation[rows[live], away[live]] += 1
+    return np.where(wins1 >= needed, team1, team2)
+
+
+def monte_carlo_playoff_odds(bracket, matrix: StarterWinMatrix, simulations=20000, rng=None, games=7, home_pattern=None):
+    """Vectorized bracket simulation that follows each team's rotation game by game."""
+    rng = rng if rng is not None else np.random.default_rng()
+    rotation = np.tile(matrix.rotation_start, (simulations, 1))
+    counts = {team.team_id: {'lcs': 0, 'pennant': 0, 'title': 0} for team in matrix.teams}
+
+    def fixed(team_id):
+        return np.full(simulations, matrix.index[team_id], dtype=np.int64)
+
+    def tally(winners, key):
+        for i, count in zip(*np.unique(winners, return_counts=True)):
+            counts[matrix.teams[i].team_id][key] += int(count)
+
+    champions = []
+    for _, first, second in bracket:
+        semi1 = _simulate_series(fixed(first[0]), fixed(first[1]), rotation, matrix, rng, games, home_pattern)
+        semi2 = _simulate_series(fixed(second[0]), fixed(second[1]), rotation, matrix, rng, games, home_pattern)
+        tally(semi1, 'lcs')
+        tally(semi2, 'lcs')
+        pennant = _simulate_series(semi1, semi2, rotation, matrix, rng, games, home_pattern)
+        tally(pennant, 'pennant')
+        champions.append(pennant)
+    tally(_simulate_series(champions[0], champions[1], rotation, matrix, rng, games, home_pattern), 'title')
+
+    return {team_id: {key: count / simulations for key, count in team.items()} for team_id, team in counts.items()}
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+pennant_fever_reference_cache.py
+
+Binary columnar snapshots of the generator's reference workbooks.
+
+pennant_fever_generator reads its names, schools, cities and nicknames from Excel
+sheets. Parsing them with openpyxl takes seconds per run, so each sheet is converted
+once into a snapshot file next to its workbook (<workbook>.<sheet>.refcache) and
+read from there while the workbook is unchanged. A snapshot records the workbook's
+mtime, size and sha256. It is reused while mtime and size match, or while the hash
+still matches (the workbook was touched or copied but not edited). Otherwise the
+sheet is parsed again and the snapshot rewritten.
+
+Layout: CACHE_MAGIC, u4 format version, u4 header length, the UTF-8 JSON header
+(source stamp, row count, one entry per column), then the column blocks at 8-byte
+aligned offsets. Numeric, boolean and datetime columns are raw little-endian arrays.
+Text columns are one NUL-separated UTF-8 blob (decoded with a single split) plus a
+null mask. Anything else (mixed-type columns, text containing NUL, unusual column
+labels or index) is pickled. Snapshots are written to a temp file and renamed, so
+generator runs sharing a workbook never see a torn file. Numeric columns are
+memory-mapped copy-on-write, so concurrent runs share those pages.
+
+ReferenceData loads each sheet on first use and keeps one copy per process.
+
+Usage:
+    from pennant_fever_reference_cache import ReferenceData, generator_sources
+    reference = ReferenceData(generator_sources())
+    reference.first_names           # DataFrame, parsed or loaded from its snapshot on first access
+
+    python pennant_fever_reference_cache.py --build           # convert every generator sheet now
+    python pennant_fever_reference_cache.py --benchmark       # cold (Excel) vs warm (snapshot) startup
+    python pennant_fever_reference_cache.py --clear
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import pickle
+import struct
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger("FictionalGenerator")
+
+CACHE_MAGIC = b'PFREFDAT'
+CACHE_VERSION = 1
+CACHE_SUFFIX = '.refcache'
+
+
+# =============================================================================
+# SOURCES
+# =============================================================================
+
+def generator_sources():
+    """name -> (workbook, sheet) for every sheet pennant_fever_generator reads (sheet None = first sheet)."""
+    try:
+        import data_paths_pennant_fever as paths
+    except ImportError:
+        sys.path.insert(0, str(Path.home() / "Documents/_code/common"))
+        import data_paths_pennant_fever as paths
+    return {
+        'corporate_names': (paths.CORPORATE_NAMES_FILE, None),
+        'first_names': (paths.FIRST_NAMES_FILE, None),
+        'surnames': (paths.SURNAMES_FILE, None),
+        'high_schools': (paths.SCHOOLS_REGISTER_FILE, 'HS'),
+        'colleges': (paths.SCHOOLS_REGISTER_FILE, 'COL'),
+        'cities': (paths.TEAM_GENERATION_FILE, 'CITY'),
+        'nicknames': (paths.TEAM_GENERATION_FILE, 'NICKNAMES'),
+    }
+
+
+def read_source(path, sheet_name=None):
+    """Parse one sheet the way the generator always has (CSV sources are read as CSV)."""
+    import pandas as pd
+    if str(path).lower().endswith('.csv'):
+        return pd.read_csv(path)
+    return pd.read_excel(path, sheet_name=0 if sheet_name is None else sheet_name)
+
+
+def cache_path(path, sheet_name=None, cache_dir=None):
+    """Snapshot file for a sheet: next to the workbook, or in cache_dir."""
+    path = Path(path)
+    name = f"{path.name}.{'sheet0' if sheet_name is None else sheet_name}{CACHE_SUFFIX}"
+    return Path(cache_dir) / name if cache_dir else path.with_name(name)
+
+
+def file_hash(path):
+    """sha256 hex digest of a file's contents (also used by the game's schedule cache and league bundle)."""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def source_stamp(path, sheet_name=None, sha256=None):
+    stat = os.stat(path)
+    return {'path': str(path), 'sheet': sheet_name, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size,
+            'sha256': sha256 or file_hash(path)}
+
+
+# =============================================================================
+# SNAPSHOT FILES
+# =============================================================================
+
+def _column_blocks(series):
+    """(column entry, [(key, bytes)]) for one column; text and numbers columnar, anything else pickled."""
+    import pandas as pd
+    values = series.to_numpy()
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in 'biuf':
+        array = np.ascontiguousarray(values).astype(dtype.newbyteorder('<'), copy=False)
+        return {'kind': 'numeric', 'dtype': array.dtype.str}, [('data', array.tobytes())]
+    if isinstance(dtype, np.dtype) and dtype.kind in 'mM':
+        return {'kind': 'datetime', 'dtype': dtype.str}, [('data', values.view('<i8').tobytes())]
+    if dtype == object or isinstance(dtype, pd.StringDtype):
+        objects = series.astype(object).to_numpy()
+        nulls = pd.isna(objects)
+        present = objects[~nulls]
+        if all(isinstance(value, str) and '\0' not in value for value in present):
+            blob = '\0'.join('' if null else value for value, null in zip(objects, nulls)).encode('utf-8')
+            return ({'kind': 'text', 'dtype': str(dtype)},
+                    [('nulls', nulls.astype('u1').tobytes()), ('blob', blob)])
+    return {'kind': 'pickle', 'dtype': str(dtype)}, [('data', pickle.dumps(series, protocol=pickle.HIGHEST_PROTOCOL))]
+
+
+def write_cache(cache_file, frame, source):
+    """Write `frame` as a snapshot of `source` (a source_stamp dict), atomically."""
+    import pandas as pd
+    header = {'version': CACHE_VERSION, 'source': source, 'rows': len(frame), 'columns': [], 'frame': None}
+    blocks = []
+    plain_labels = all(isinstance(label, (str, int, float)) and not isinstance(label, bool) for label in frame.columns)
+    plain_index = isinstance(frame.index, pd.RangeIndex) and frame.index.start == 0 and frame.index.step == 1
+    if plain_labels and plain_index and frame.columns.is_unique:
+        for label in frame.columns:
+            entry, column_blocks = _column_blocks(frame[label])
+            entry['name'] = label
+            entry['blocks'] = {}
+            header['columns'].append(entry)
+            blocks.extend((entry['blocks'], key, data) for key, data in column_blocks)
+    else:
+        header['frame'] = {}
+        blocks.append((header['frame'], 'data', pickle.dumps(frame, protocol=pickle.HIGHEST_PROTOCOL)))
+
+    # Block offsets depend on the header length, which depends on the offsets: lay out until it settles
+    encoded = b''
+    while True:
+        offset = len(CACHE_MAGIC) + 8 + len(encoded)
+        offset += -offset % 8
+        for owner, key, data in blocks:
+            owner[key] = [offset, len(data)]
+            offset += len(data) + (-len(data) % 8)
+        laid_out = json.dumps(header, separators=(',', ':')).encode('utf-8')
+        settled = len(laid_out) == len(encoded)
+        encoded = laid_out
+        if settled:
+            break
+
+    temp_file = f"{cache_file}.{os.getpid()}.tmp"
+    with open(temp_file, 'wb') as f:
+        f.write(CACHE_MAGIC)
+        f.write(struct.pack('<II', CACHE_VERSION, len(encoded)))
+        f.write(encoded)
+        for owner, key, data in blocks:
+            f.seek(owner[key][0])
+            f.write(data)
+        f.truncate(offset)
+    os.replace(temp_file, cache_file)
+
+
+def read_cache_header(cache_file):
+    """Parsed header of a snapshot; ValueError if it isn't one or is another format version."""
+    with open(cache_file, 'rb') as f:
+        prefix = f.read(len(CACHE_MAGIC) + 8)
+        if len(prefix) < len(CACHE_MAGIC) + 8 or not prefix.startswith(CACHE_MAGIC):
+            raise ValueError(f"{cache_file} is not a reference snapshot")
+        version, header_length = struct.unpack_from('<II', prefix, len(CACHE_MAGIC))
+        if version != CACHE_VERSION:
+            raise ValueError(f"{cache_file} is snapshot format {version}, expected {CACHE_VERSION}")
+        return json.loads(f.read(header_length).decode('utf-8'))
+
+
+def read_cache(cache_file, header=None, mmap=True):
+    """Rebuild the DataFrame in a snapshot; numeric columns stay memory-mapped (copy-on-write) with mmap."""
+    import pandas as pd
+    header = header or read_cache_header(cache_file)
+    size = os.path.getsize(cache_file)
+    data = np.memmap(cache_file, dtype=np.uint8, mode='c') if mmap and size else np.fromfile(cache_file, dtype=np.uint8)
+
+    def block(entry, key):
+        offset, length = entry[key]
+        if offset + length > size:
+            raise ValueError(f"{cache_file} is truncated")
+        return data[offset:offset + length]
+
+    if header['frame'] is not None:
+        return pickle.loads(block(header['frame'], 'data').tobytes())
+
+    rows = header['rows']
+    columns = {}
+    for entry in header['columns']:
+        blocks = entry['blocks']
+        if entry['kind'] == 'numeric':
+            columns[entry['name']] = block(blocks, 'data').view(np.dtype(entry['dtype']))
+        elif entry['kind'] == 'datetime':
+            columns[entry['name']] = block(blocks, 'data').view('<i8').view(np.dtype(entry['dtype']))
+        elif entry['kind'] == 'text':
+            values = np.empty(rows, dtype=object)
+            if rows:
+                values[:] = block(blocks, 'blob').tobytes().decode('utf-8').split('\0')
+                values[block(blocks, 'nulls').view(bool)] = np.nan
+            columns[entry['name']] = pd.Series(values, dtype=entry['dtype'])
+        else:
+            columns[entry['name']] = pickle.loads(block(blocks, 'data').tobytes()).to_numpy()
+    frame = pd.DataFrame(columns, copy=False)
+    if not header['columns']:
+        frame = pd.DataFrame(index=pd.RangeIndex(rows))
+    return frame
+
+
+def load_sheet(path, sheet_name=None, cache_dir=None, use_cache=True, mmap=True):
+    """One reference sheet as a DataFrame, from its snapshot when that is still valid."""
+    if not use_cache:
+        return read_source(path, sheet_name)
+    cache_file = cache_path(path, sheet_name, cache_dir)
+    stat = os.stat(path)
+    source_hash = None
+    if cache_file.exists():
+        try:
+            header = read_cache_header(cache_file)
+            cached = header['source']
+            if cached['sheet'] == sheet_name:
+                if cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+                    logger.debug(f"Reference snapshot hit (mtime): {cache_file}")
+                    return read_cache(cache_file, header, mmap)
+                # Touched but possibly unchanged (e.g. copied or checked out again)
+                source_hash = file_hash(path)
+                if cached['sha256'] == source_hash:
+                    logger.debug(f"Reference snapshot hit (sha256): {cache_file}")
+                    frame = read_cache(cache_file, header, mmap=False)
+                    write_cache(cache_file, frame, source_stamp(path, sheet_name, source_hash))
+                    return frame
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable reference snapshot {cache_file}: {e}")
+
+    start = time.perf_counter()
+    frame = read_source(path, sheet_name)
+    try:
+        write_cache(cache_file, frame, source_stamp(path, sheet_name, source_hash))
+    except OSError as e:
+        logger.warning(f"Could not write reference snapshot {cache_file}: {e}")
+    logger.info(f"Converted {Path(path).name} [{sheet_name or 'first sheet'}] to a reference snapshot "
+                f"in {time.perf_counter() - start:.2f}s")
+    return frame
+
+
+class ReferenceData:
+    """
+    Named reference sheets loaded on first attribute access, one copy per process:
+    ReferenceData({'first_names': (FIRST_NAMES_FILE, None)}).first_names
+    """
+
+    def __init__(self, sources, cache_dir=None, use_cache=True):
+        self._sources = dict(sources)
+        self._cache_dir = cache_dir
+        self._use_cache = use_cache
+        self._frames = {}
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            path, sheet_name = self._sources[name]
+        except KeyError:
+            raise AttributeError(f"No reference sheet named '{name}'") from None
+        frame = self._frames.get(name)
+        if frame is None:
+            frame = self._frames[name] = load_sheet(path, sheet_name, self._cache_dir, self._use_cache)
+        return frame
+
+    def preload(self):
+        """Load every sheet now (e.g. in a parent process before forking workers)."""
+        for name in self._sources:
+            getattr(self, name)
+        return self
+
+    def loaded(self):
+        return list(self._frames)
+
+
+# =============================================================================
+# MAINTENANCE AND BENCHMARK
+# =============================================================================
+
+def clear(sources, cache_dir=None):
+    removed = 0
+    for path, sheet_name in sources.values():
+        cache_file = cache_path(path, sheet_name, cache_dir)
+        if cache_file.exists():
+            cache_file.unlink()
+            removed += 1
+    return removed
+
+
+def benchmark(sources, cache_dir=None, repeats=3):
+    """
+    Per sheet: cold (parse the workbook, what every run paid before), build
+    (parse + write the snapshot) and warm (load the snapshot); best of `repeats`.
+    """
+    rows = []
+    for name, (path, sheet_name) in sources.items():
+        cache_file = cache_path(path, sheet_name, cache_dir)
+        cold = build = warm = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            frame = read_source(path, sheet_name)
+            cold = min(cold, time.perf_counter() - start)
+
+            if cache_file.exists():
+                cache_file.unlink()
+            start = time.perf_counter()
+            load_sheet(path, sheet_name, cache_dir)
+            build = min(build, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            load_sheet(path, sheet_name, cache_dir)
+            warm = min(warm, time.perf_counter() - start)
+        rows.append((name, len(frame), cold, build, warm))
+    return rows
+
+
+def print_benchmark(rows):
+    print(f"{'Sheet':<22} {'Rows':>8} {'Cold':>9} {'Build':>9} {'Warm':>9} {'Speedup':>8}")
+    for name, count, cold, build, warm in rows:
+        print(f"{name:<22} {count:>8} {cold * 1000:>7.1f}ms {build * 1000:>7.1f}ms {warm * 1000:>7.1f}ms "
+              f"{cold / warm:>7.1f}x")
+    cold = sum(row[2] for row in rows)
+    warm = sum(row[4] for row in rows)
+    print(f"{'startup total':<22} {'':>8} {cold * 1000:>7.1f}ms {sum(row[3] for row in rows) * 1000:>7.1f}ms "
+          f"{warm * 1000:>7.1f}ms {cold / warm:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the generator's reference-data snapshots")
+    parser.add_argument('--build', action='store_true', help='Convert every generator sheet that is missing or stale')
+    parser.add_argument('--benchmark', action='store_true', help='Time cold (workbook) vs warm (snapshot) loads')
+    parser.add_argument('--repeats', type=int, default=3, help='Benchmark repetitions (best is reported)')
+    parser.add_argument('--clear', action='store_true', help='Delete the snapshots')
+    parser.add_argument('--cache-dir', default=None, help='Keep snapshots here instead of next to the workbooks')
+    args = parser.parse_args()
+
+    # Conversion messages would interleave with the benchmark table
+    logging.basicConfig(level=logging.WARNING if args.benchmark else logging.INFO, format='%(message)s')
+    sources = generator_sources()
+    if args.clear:
+        print(f"Removed {clear(sources, args.cache_dir)} snapshot(s)")
+    if args.build:
+        reference = ReferenceData(sources, args.cache_dir).preload()
+        for name in reference.loaded():
+            path, sheet_name = sources[name]
+            print(f"{name:<22} {cache_path(path, sheet_name, args.cache_dir)}")
+    if args.benchmark:
+        print_benchmark(benchmark(sources, args.cache_dir, args.repeats))
+    if not (args.clear or args.build or args.benchmark):
+        parser.print_help()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+pennant_fever_season_runner.py
+
+Monte Carlo season runner: plays independent replicate seasons (regular season
+plus playoffs) across a process pool and summarizes win distributions,
+division, pennant and title odds per team.
+
+The league JSON and schedule are read once in the parent and handed to each
+worker at start-up; the league's RosterStore is moved into shared memory for
+the life of the pool, so workers map the rating columns instead of unpickling them. Every replicate gets its own numpy Generator spawned from a
+single SeedSequence (replicate i uses spawn key (i,)), so any replicate can be
+replayed bit-for-bit on its own, regardless of worker count or scheduling.
+
+Usage:
+    python pennant_fever_season_runner.py --seasons 1000 --workers 32 --seed 2024
+    python pennant_fever_season_runner.py --seasons 1000 --seed 2024 --output projections.json
+    python pennant_fever_season_runner.py --seed 2024 --replay 417
+"""
+
+import argparse
+import contextlib
+import copy
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+import numpy as np
+
+from pennant_fever_game import (
+    Game,
+    MatchupCache,
+    Playoffs,
+    Standings,
+    POWER_CHART,
+    SPEED_BENCH_CHART,
+    init,
+    load_league,
+    logger,
+)
+
+
+# =============================================================================
+# SEASON PLAN (built once in the parent, shared with every worker)
+# =============================================================================
+
+def build_season_plan(league) -> Dict[str, Any]:
+    """Flatten a load_league() result into what a replicate needs: teams, divisions, games by day, charts, roster."""
+    schedule_id_map = league['schedule_id_map']
+    team_lookup = league['team_lookup']
+    schedule = league['schedule']
+
+    games_by_day = []
+    for day in schedule.game_days():
+        games = [(schedule_id_map[game['home']], schedule_id_map[game['away']])
+                 for game in schedule.get_games_for_day(day)]
+        games_by_day.append((day, [(home_id, away_id) for home_id, away_id in games
+                                   if home_id in team_lookup and away_id in team_lookup]))
+
+    team_ids = [team_id for team_id in league['all_team_ids'] if team_id in team_lookup]
+    divisions = {}
+    for sub_league in league['sub_leagues']:
+        for division in sub_league['divisions']:
+            for team_id in division['teams']:
+                divisions[team_id] = (sub_league['sub_league_name'], division['division_name'])
+
+    return {
+        'sub_leagues': league['sub_leagues'],
+        'team_lookup': team_lookup,
+        'team_ids': team_ids,
+        'divisions': divisions,
+        'games_by_day': games_by_day,
+        'num_days': schedule.num_days,
+        'charts': league['charts'],
+        'roster': league.get('roster'),
+    }
+
+
+def replicate_rng(seed, replicate):
+    """Generator for one replicate; identical to SeedSequence(seed).spawn(n)[replicate]."""
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(replicate,)))
+
+
+# =============================================================================
+# ONE REPLICATE
+# =============================================================================
+
+def play_replicate(plan, seed, replicate) -> Dict[str, Any]:
+    """Play one full season plus playoffs on fresh copies of the teams."""
+    rng = replicate_rng(seed, replicate)
+    team_lookup = copy.deepcopy(plan['team_lookup'])
+    standings = Standings(plan['sub_leagues'], team_lookup)
+    matchup_cache = MatchupCache()
+    relief_defense_chart = Game.consult_relief_defense_chart
+
+    for day, games in plan['games_by_day']:
+        for home_id, away_id in games:
+            home_team = team_lookup[home_id]
+            away_team = team_lookup[away_id]
+            game = Game(home_team, away_team, day, POWER_CHART, SPEED_BENCH_CHART, relief_defense_chart,
+                        matchup_cache=matchup_cache, rng=rng, charts=plan['charts'])
+            result = game.play_game(day)
+            standings.record_game(day, home_id, away_id, result, team_lookup=team_lookup)
+
+    win_counts = standings.column('wins')
+    wins = [int(win_counts[standings.team_index[team_id][2]]) if team_id in standings.team_index else 0
+            for team_id in plan['team_ids']]
+
+    playoffs = Playoffs(standings, {}, POWER_CHART, SPEED_BENCH_CHART, relief_defense_chart,
+                        matchup_cache=matchup_cache, rng=rng, charts=plan['charts'])
+    champion = playoffs.simulate_playoffs(regular_season_days=plan['num_days'])
+
+    division_winners = []
+    wildcards = []
+    for seeds in playoffs.playoff_teams.values():
+        division_winners.extend(seeds['division_winners'])
+        wildcards.append(seeds['wildcard'])
+
+    return {
+        'replicate': replicate,
+        'wins': wins,
+        'division_winners': division_winners,
+        'wildcards': wildcards,
+        'pennant_winners': list(playoffs.league_champions.values()),
+        'champion': champion.team_id,
+    }
+
+
+# =============================================================================
+# WORKER POOL
+# =============================================================================
+
+_WORKER_PLAN = None
+_WORKER_SEED = None
+
+
+def _init_worker(plan, seed, log_level):
+    """Runs once per worker process: keep the plan so tasks only carry a replicate index."""
+    global _WORKER_PLAN, _WORKER_SEED
+    _WORKER_PLAN = plan
+    _WORKER_SEED = seed
+    logger.setLevel(log_level)
+
+
+def _run_worker_replicate(replicate):
+    return play_replicate(_WORKER_PLAN, _WORKER_SEED, replicate)
+
+
+def run_seasons(plan, seasons, seed, workers=None, log_level=logging.WARNING) -> List[Dict[str, Any]]:
+    """Play `seasons` replicates; workers=1 runs in-process."""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        previous_level = logger.level
+        logger.setLevel(log_level)
+        try:
+            return [play_replicate(plan, seed, replicate) for replicate in range(seasons)]
+        finally:
+            logger.setLevel(previous_level)
+
+    # A few chunks per worker keeps IPC low while still balancing uneven replicates
+    chunksize = max(1, seasons // (workers * 4))
+    roster = plan.get('roster')
+    with roster.shared() if roster is not None else contextlib.nullcontext():
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(plan, seed, log_level)) as executor:
+            return list(executor.map(_run_worker_replicate, range(seasons), chunksize=chunksize))
+
+
+# =============================================================================
+# SUMMARY
+# =============================================================================
+
+def summarize(plan, results) -> Dict[str, Any]:
+    """Collapse replicate results to per-team win distributions and odds."""
+    team_ids = plan['team_ids']
+    seasons = len(results)
+    wins = np.array([result['wins'] for result in results], dtype=np.int32).reshape(seasons, len(team_ids))
+
+    def odds(key):
+        counts = dict.fromkeys(team_ids, 0)
+        for result in results:
+            value = result[key]
+            for team_id in (value if isinstance(value, list) else [value]):
+                counts[team_id] += 1
+        return {team_id: count / seasons for team_id, count in counts.items()}
+
+    division_odds = odds('division_winners')
+    wildcard_odds = odds('wildcards')
+    pennant_odds = odds('pennant_winners')
+    title_odds = odds('champion')
+
+    teams = {}
+    for column, team_id in enumerate(team_ids):
+        team_wins = wins[:, column]
+        low, median, high = np.percentile(team_wins, [10, 50, 90])
+        sub_league, division = plan['divisions'].get(team_id, (None, None))
+        teams[team_id] = {
+            'team_name': plan['team_lookup'][team_id].team_name,
+            'sub_league': sub_league,
+            'division': division,
+            'mean_wins': round(float(team_wins.mean()), 2),
+            'std_wins': round(float(team_wins.std()), 2),
+            'p10_wins': float(low),
+            'median_wins': float(median),
+            'p90_wins': float(high),
+            'min_wins': int(team_wins.min()),
+            'max_wins': int(team_wins.max()),
+            'division_odds': division_odds[team_id],
+            'playoff_odds': division_odds[team_id] + wildcard_odds[team_id],
+            'pennant_odds': pennant_odds[team_id],
+            'title_odds': title_odds[team_id],
+        }
+    return {'seasons': seasons, 'teams': teams}
+
+
+def print_summary(summary):
+    print(f"\n{summary['seasons']} seasons")
+    print(f"{'Team':<20} {'W':>6} {'SD':>5} {'P10':>5} {'P90':>5} {'Div%':>6} {'Play%':>6} {'Pen%':>6} {'WS%':>6}")
+    ordered = sorted(summary['teams'].values(), key=lambda t: (t['sub_league'] or '', t['division'] or '', -t['mean_wins']))
+    for team in ordered:
+        print(f"{team['team_name']:<20} {team['mean_wins']:>6.1f} {team['std_wins']:>5.1f} {team['p10_wins']:>5.0f} {team['p90_wins']:>5.0f} "
+              f"{team['division_odds'] * 100:>6.1f} {team['playoff_odds'] * 100:>6.1f} {team['pennant_odds'] * 100:>6.1f} {team['title_odds'] * 100:>6.1f}")
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Monte Carlo season projections for Pennant Fever')
+    parser.add_argument('--seasons', type=int, default=100, help='Number of replicate seasons')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: all cores, 1 = in-process)')
+    parser.add_argument('--seed', type=int, default=None, help='Root seed (random if omitted; printed for replay)')
+    parser.add_argument('--replay', type=int, default=None, help='Replay a single replicate index in-process')
+    parser.add_argument('--output', default=None, help='Write the JSON summary to this file')
+    args = parser.parse_args()
+
+    seed = args.seed if args.seed is not None else int(np.random.SeedSequence().entropy % (2 ** 63))
+    print(f"Root seed: {seed}")
+
+    init()
+    plan = build_season_plan(load_league())
+
+    if args.replay is not None:
+        result = play_replicate(plan, seed, args.replay)
+        print(json.dumps(result, indent=2))
+        return
+
+    start = time.perf_counter()
+    results = run_seasons(plan, args.seasons, seed, workers=args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"Played {args.seasons} seasons in {elapsed:.1f}s ({args.seasons / elapsed:.2f} seasons/s)")
+
+    summary = summarize(plan, results)
+    summary['seed'] = seed
+    print_summary(summary)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(summary, f, indent=2)
+        print(f"Summary written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+pennant_fever_solver.py
+
+Exact run distributions and single-game win probabilities.
+
+Game.resolve_team_runs is deterministic given the white/red/green dice (the
+odd-triad injury check changes the roster for later games but never the runs
+of the current one), so every quantity below is computed by weighting the 216
+equally likely triads of the batch engine's outcome table instead of sampling.
+
+Usage:
+    dist = run_distribution(team, opponent_pitcher, current_day)
+    dist.pmf                      # {runs: probability}
+    cache = MatchupCache()        # optional, reuses tables/PMFs across repeated matchups
+    run_distribution(team, opponent_pitcher, current_day, cache=cache)
+    win_probability(home_team, away_team, home_pitcher, away_pitcher, current_day)
+"""
+
+from typing import Dict
+
+import numpy as np
+
+from pennant_fever_batch import BatchGameEngine, TRIAD_COUNT
+from pennant_fever_game import compile_charts
+
+
+# =============================================================================
+# RUN DISTRIBUTION
+# =============================================================================
+
+class RunDistribution:
+    """Exact distribution of one team's runs against one opposing starter."""
+
+    def __init__(self, table):
+        self.table = table
+        runs, counts = np.unique(table['total_runs'], return_counts=True)
+        self.runs = runs
+        self.probabilities = counts / TRIAD_COUNT
+        self.pmf: Dict[int, float] = {int(r): float(p) for r, p in zip(runs, self.probabilities)}
+        self.expected_runs = float(table['total_runs'].mean())
+        self.shutout_probability = float(table['is_shutout'].mean())
+        self.complete_game_probability = float(table['is_complete_game'].mean())
+        self.cg_shutout_probability = float(table['is_cg_sho'].mean())
+        self.injury_check_probability = float(table['injury_check'].mean())
+        self.expected_bullpen_outs = float(table['bullpen_outs'].mean())
+        self.expected_bullpen_innings = self.expected_bullpen_outs / 3
+
+    def cdf(self, runs):
+        """Probability of scoring `runs` or fewer."""
+        return float(self.probabilities[self.runs <= runs].sum())
+
+
+def run_distribution(team, opponent_pitcher, current_day, ballpark=None,
+                     power_chart=None, speed_bench_chart=None, cache=None, charts=None):
+    """
+    Return the exact RunDistribution for a batting team against an opposing starter.
+    Pass a MatchupCache to reuse distributions across repeated matchups.
+    """
+    # resolve_team_runs always uses the batting team's own ballpark
+    ballpark = ballpark if ballpark is not None else team.ballpark
+    charts = charts if charts is not None else compile_charts(power_chart, speed_bench_chart)
+
+    def compute():
+        engine = BatchGameEngine(team, opponent_pitcher, ballpark, current_day, cache=cache, charts=charts)
+        return RunDistribution(engine.table)
+
+    if cache is None:
+        return compute()
+    return cache.run_pmf(team, opponent_pitcher, ballpark, current_day, compute, id(charts))
+
+
+# =============================================================================
+# EXTRA INNINGS
+# =============================================================================
+
+def extra_innings_batter_values(team):
+    """Batting + clutch of the extra-innings batter for each of the 36 red/green rolls."""
+    values = []
+    for red_die in range(1, 7):
+        for green_die in range(1, 7):
+            batter = team.get_batter_for_extra_innings(int(f"{red_die}{green_die}"))
+            values.append(batter.batting + batter.clutch)
+    return np.array(values, dtype=np.float64)
+
+
+def extra_innings_home_win_probability(home_team, away_team, home_relief_values, away_relief_values):
+    """
+    Probability the home team wins Game.handle_extra_innings, for every pair of
+    (home reliever value, visiting reliever value). Returns a matrix indexed
+    [home_relief_values, away_relief_values].
+    """
+    visiting_batters = extra_innings_batter_values(away_team)
+    home_batters = extra_innings_batter_values(home_team)
+    home_relief_values = np.asarray(home_relief_values, dtype=np.float64)
+    away_relief_values = np.asarray(away_relief_values, dtype=np.float64)
+
+    # special value = batter + clutch - opposing reliever value (axes: home rv, away rv, batter roll)
+    visiting_special = visiting_batters[None, None, :] - home_relief_values[:, None, None]
+    home_special = home_batters[None, None, :] - away_relief_values[None, :, None]
+
+    # Compare every visiting roll against every home roll
+    diff = home_special[..., :, None] - visiting_special[..., None, :]
+    p_home = (diff > 0).mean(axis=(-2, -1))
+    p_tied = (diff == 0).mean(axis=(-2, -1))
+
+    # break_tie_in_extra_innings adds the same dice to both sides, so only home field
+    # advantage separates them; a dead heat after all three dice goes to the home team
+    if home_team.home_field_advantage >= 0:
+        p_home = p_home + p_tied
+    return p_home
+
+
+# =============================================================================
+# WIN PROBABILITY
+# =============================================================================
+
+def _joint_outcomes(table):
+    """Collapse the 216 triads to distinct (runs, extras relief value) outcomes."""
+    outcomes = np.stack([table['total_runs'], table['extras_relief_value']], axis=1)
+    unique, counts = np.unique(outcomes, axis=0, return_counts=True)
+    return unique[:, 0], unique[:, 1], counts / TRIAD_COUNT
+
+
+def win_probability(home_team, away_team, home_pitcher, away_pitcher, current_day,
+                    power_chart=None, speed_bench_chart=None, home_distribution=None, away_distribution=None,
+                    cache=None, charts=None):
+    """
+    Exact probability that the home team wins a single game (Game.play_game),
+    including the extra-innings tie-break.
+    """
+    if away_distribution is None:
+        away_distribution = run_distribution(away_team, home_pitcher, current_day, power_chart=power_chart,
+                                             speed_bench_chart=speed_bench_chart, cache=cache, charts=charts)
+    if home_distribution is None:
+        home_distribution = run_distribution(home_team, away_pitcher, current_day, power_chart=power_chart,
+                                             speed_bench_chart=speed_bench_chart, cache=cache, charts=charts)
+
+    home_runs, home_rv, home_p = _joint_outcomes(home_distribution.table)
+    away_runs, away_rv, away_p = _joint_outcomes(away_distribution.table)
+    joint = home_p[:, None] * away_p[None, :]
+
+    regulation = (home_runs[:, None] > away_runs[None, :])
+    tied = (home_runs[:, None] == away_runs[None, :])
+
+    extras = extra_innings_home_win_probability(home_team, away_team, home_rv, away_rv)
+    return float((joint * regulation).sum() + (joint * tied * extras).sum())
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+pennant_fever_trace.py
+
+Structured trace events for the game engine, and an offline play-by-play renderer.
+
+The engine emits small typed records (dice, Batting Value steps, chart bonuses,
+relievers chosen, runs, injuries, extra innings) instead of formatted text. Each
+record is a fixed-size row of numbers, with team and player names interned once
+into a string table. Records go to an in-memory ring buffer (RingBufferTracer)
+or a binary trace file (FileTracer). With no tracer installed the engine's trace
+sites are a single `TRACER is not None` test and build no arguments.
+
+Usage:
+    from pennant_fever_game import set_tracer
+    from pennant_fever_trace import FileTracer, RingBufferTracer, render
+
+    set_tracer(FileTracer('season.trace'))    # or RingBufferTracer(100000)
+    ...play games...
+    set_tracer(None).close()                  # set_tracer returns the tracer it replaces
+
+    python pennant_fever_trace.py season.trace                 # every game
+    python pennant_fever_trace.py season.trace --day 12        # one day
+    python pennant_fever_trace.py season.trace --team Orioles --last 5
+"""
+
+import argparse
+import struct
+from abc import ABC, abstractmethod
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+# =============================================================================
+# EVENTS
+# =============================================================================
+
+GAME_START = 1   # team=home, name=away, a/b=home/away starter (name ids)
+DICE = 2         # team batting, a/b/c = white/red/green
+BV = 3           # team batting, step = resolve_team_runs step, a = Batting Value after the step
+BONUS = 4        # team batting, step, name = player ('SP'/'BN' for speed), a = bonus added to BV
+RELIEVER = 5     # team, name = reliever, a = relief value, b = fatigue multiplier
+SHUTOUT = 6      # team batting (held scoreless), name = opposing starter, step = 1 CG/SHO, 2 with relief
+RUNS = 7         # team batting, a/b = earned/unearned runs, c = starter innings
+INJURY = 8       # team, name = player, a = days out (-1 = season)
+EXTRAS = 9       # a/b = visiting/home special value, step = 0 visiting won, 1 home won, 2 dice tie-break
+GAME_END = 10    # a/b = home/away runs, step = 1 if extra innings
+
+EVENT_NAMES = {
+    GAME_START: 'game_start', DICE: 'dice', BV: 'bv', BONUS: 'bonus', RELIEVER: 'reliever',
+    SHUTOUT: 'shutout', RUNS: 'runs', INJURY: 'injury', EXTRAS: 'extras', GAME_END: 'game_end',
+}
+
+# BONUS steps
+BONUS_POWER = 1
+BONUS_SPEED = 2
+BONUS_BAT = 3
+
+TRACE_DTYPE = np.dtype([
+    ('kind', 'u1'), ('step', 'u1'), ('game', '<u4'), ('day', '<i4'),
+    ('team', '<i4'), ('name', '<i4'), ('a', '<f8'), ('b', '<f8'), ('c', '<f8'),
+])
+
+TRACE_MAGIC = b'PFTRACE1'
+
+
+# =============================================================================
+# TRACERS
+# =============================================================================
+
+class Tracer(ABC):
+    """Interns names and stamps each event with the current game and day; subclasses store the rows."""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.name_ids: Dict[str, int] = {}
+        self.game = 0
+        self.day = 0
+
+    def intern(self, name):
+        if name is None:
+            return -1
+        name = str(name)
+        name_id = self.name_ids.get(name)
+        if name_id is None:
+            name_id = len(self.names)
+            self.names.append(name)
+            self.name_ids[name] = name_id
+        return name_id
+
+    def begin_game(self, day, home_team, away_team, home_starter, away_starter):
+        self.game += 1
+        self.day = day
+        self.emit(GAME_START, home_team, away_team, self.intern(home_starter), self.intern(away_starter))
+
+    def emit(self, kind, team=None, name=None, a=0.0, b=0.0, c=0.0, step=0):
+        self.write((kind, step, self.game, self.day, self.intern(team), self.intern(name), a, b, c))
+
+    @abstractmethod
+    def write(self, row):
+        """Store one event row (a tuple in TRACE_DTYPE field order)."""
+
+    def close(self):
+        pass
+
+
+class RingBufferTracer(Tracer):
+    """Keeps the most recent `capacity` events in memory."""
+
+    def __init__(self, capacity=65536):
+        super().__init__()
+        self.capacity = capacity
+        self.buffer = np.zeros(capacity, dtype=TRACE_DTYPE)
+        self.count = 0
+
+    def write(self, row):
+        self.buffer[self.count % self.capacity] = row
+        self.count += 1
+
+    def events(self):
+        """Buffered events, oldest first."""
+        if self.count <= self.capacity:
+            return self.buffer[:self.count].copy()
+        start = self.count % self.capacity
+        return np.concatenate([self.buffer[start:], self.buffer[:start]])
+
+    def render(self, **filters):
+        return render(self.events(), self.names, **filters)
+
+
+class FileTracer(Tracer):
+    """
+    Appends events to a binary trace file in chunks: each chunk holds the names
+    interned since the previous chunk, then a block of raw TRACE_DTYPE rows.
+    """
+
+    def __init__(self, path, chunk_events=8192):
+        super().__init__()
+        self.path = path
+        self.chunk = np.zeros(chunk_events, dtype=TRACE_DTYPE)
+        self.pending = 0
+        self.names_written = 0
+        self.file = open(path, 'wb')
+        self.file.write(TRACE_MAGIC)
+
+    def write(self, row):
+        self.chunk[self.pending] = row
+        self.pending += 1
+        if self.pending == len(self.chunk):
+            self.flush()
+
+    def flush(self):
+        new_names = self.names[self.names_written:]
+        self.file.write(struct.pack('<II', len(new_names), self.pending))
+        for name in new_names:
+            encoded = name.encode('utf-8')
+            self.file.write(struct.pack('<H', len(encoded)))
+            self.file.write(encoded)
+        self.file.write(self.chunk[:self.pending].tobytes())
+        self.names_written = len(self.names)
+        self.pending = 0
+
+    def close(self):
+        if self.file.closed:
+            return
+        if self.pending or self.names_written < len(self.names):
+            self.flush()
+        self.file.close()
+
+
+def read_trace(path) -> Tuple[np.ndarray, List[str]]:
+    """Load a FileTracer file; returns (events, names). A torn final chunk is dropped."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if not data.startswith(TRACE_MAGIC):
+        raise ValueError(f"{path} is not a Pennant Fever trace file")
+
+    names: List[str] = []
+    chunks = []
+    offset = len(TRACE_MAGIC)
+    header = struct.Struct('<II')
+    while offset + header.size <= len(data):
+        name_count, event_count = header.unpack_from(data, offset)
+        cursor = offset + header.size
+        chunk_names = []
+        try:
+            for _ in range(name_count):
+                (length,) = struct.unpack_from('<H', data, cursor)
+                cursor += 2
+                if cursor + length > len(data):
+                    raise struct.error('truncated name')
+                chunk_names.append(data[cursor:cursor + length].decode('utf-8'))
+                cursor += length
+        except struct.error:
+            break
+        size = event_count * TRACE_DTYPE.itemsize
+        if cursor + size > len(data):
+            break
+        names.extend(chunk_names)
+        chunks.append(np.frombuffer(data, dtype=TRACE_DTYPE, count=event_count, offset=cursor))
+        offset = cursor + size
+
+    events = np.concatenate(chunks) if chunks else np.zeros(0, dtype=TRACE_DTYPE)
+    return events, names
+
+
+# =============================================================================
+# PLAY-BY-PLAY
+# =============================================================================
+
+def _number(value):
+    return f"{value:g}"
+
+
+def render(events, names, day=None, team=None, last=None) -> str:
+    """
+    Readable play-by-play of traced games. Filter by day, by team name (either
+    side), or keep only the last N games.
+    """
+    def name(name_id):
+        return names[name_id] if 0 <= name_id < len(names) else '?'
+
+    games: Dict[int, List] = {}
+    for event in events:
+        games.setdefault(int(event['game']), []).append(event)
+
+    blocks = []
+    for game_id, game_events in games.items():
+        start = next((e for e in game_events if e['kind'] == GAME_START), None)
+        home = name(int(start['team'])) if start is not None else None
+        away = name(int(start['name'])) if start is not None else None
+        game_day = int(game_events[0]['day'])
+        if day is not None and game_day != day:
+            continue
+        if team is not None and team not in (home, away):
+            continue
+
+        lines = []
+        for event in game_events:
+            kind = int(event['kind'])
+            step = int(event['step'])
+            team_name = name(int(event['team']))
+            a, b, c = float(event['a']), float(event['b']), float(event['c'])
+            if kind == GAME_START:
+                lines.append(f"Day {game_day}, game {game_id}: {away} at {home} "
+                             f"(SP {name(int(a))} vs {name(int(b))})")
+            elif kind == DICE:
+                lines.append(f"  {team_name} bat: white {int(a)}, red {int(b)}, green {int(c)} (sum {int(a + b + c)})")
+            elif kind == SHUTOUT:
+                how = 'complete game shutout' if step == 1 else 'shutout, bullpen finishes'
+                lines.append(f"    {name(int(event['name']))}: {how}")
+            elif kind == RELIEVER:
+                lines.append(f"    reliever {name(int(event['name']))} ({team_name}): relief value {_number(a)} "
+                             f"x fatigue {_number(b)}")
+            elif kind == BV:
+                lines.append(f"    step {step}: BV {_number(round(a, 2))}")
+            elif kind == BONUS:
+                if step == BONUS_SPEED:
+                    # The Speed/Bench Chart reports the spot type ('SP' lineup, 'BN' bench), not the player
+                    source = 'the bench' if name(int(event['name'])) == 'BN' else 'the lineup'
+                    lines.append(f"    speed bonus from {source}: +{_number(a)}")
+                else:
+                    label = 'power' if step == BONUS_POWER else 'individual bat'
+                    lines.append(f"    {label} bonus from {name(int(event['name']))}: +{_number(a)}")
+            elif kind == RUNS:
+                lines.append(f"    {team_name} score {_number(a + b)} ({_number(a)} earned, {_number(b)} unearned), "
+                             f"starter {_number(c)} IP")
+            elif kind == INJURY:
+                days = 'the season' if a < 0 else f"{_number(a)} days"
+                lines.append(f"    injury: {name(int(event['name']))} ({team_name}) out {days}")
+            elif kind == EXTRAS:
+                outcome = {0: away, 1: home}.get(step, 'dice tie-break')
+                lines.append(f"  extra innings: {away} {_number(a)} vs {home} {_number(b)} -> {outcome}")
+            elif kind == GAME_END:
+                suffix = ' (extra innings)' if step else ''
+                lines.append(f"  Final: {away} {_number(b)}, {home} {_number(a)}{suffix}")
+        blocks.append("\n".join(lines))
+
+    if last is not None:
+        blocks = blocks[-last:]
+    return "\n\n".join(blocks)
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Render a Pennant Fever trace file as play-by-play')
+    parser.add_argument('trace', help='Trace file written by FileTracer')
+    parser.add_argument('--day', type=int, default=None, help='Only games on this day')
+    parser.add_argument('--team', default=None, help='Only games involving this team name')
+    parser.add_argument('--last', type=int, default=None, help='Only the last N games')
+    parser.add_argument('--summary', action='store_true', help='Print event counts instead of play-by-play')
+    args = parser.parse_args()
+
+    events, names = read_trace(args.trace)
+    if args.summary:
+        kinds, counts = np.unique(events['kind'], return_counts=True)
+        games = len(np.unique(events['game'])) if len(events) else 0
+        print(f"{len(events)} events, {games} games, {len(names)} names")
+        for kind, count in zip(kinds, counts):
+            print(f"  {EVENT_NAMES.get(int(kind), kind):<12} {count}")
+        return
+    print(render(events, names, day=args.day, team=args.team, last=args.last))
+
+
+if __name__ == '__main__':
+    main()